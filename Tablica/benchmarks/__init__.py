@@ -0,0 +1,7 @@
+"""
+Benchmarks for TABLICA solutions.
+
+Standalone scripts (bench_*.py) measure single Python paths in-process;
+the suite (python3 -m benchmarks.suite) runs every language through
+SolutionRunner on seeded generated inputs and writes JSON reports.
+"""
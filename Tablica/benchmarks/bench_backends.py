@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Backend throughput benchmark for the TABLICA Python solution.
+
+Compares the text path (parse_integers + reverse_and_format), the
+byte-level fast path (reverse_tokens) and the optional NumPy backend
+(reverse_numpy) in-process, so interpreter startup is excluded.
+
+Usage:
+    python3 benchmarks/bench_backends.py [--count N] [--repeat R]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+def generate_input(count: int, low: int, high: int, seed: int = 42) -> bytes:
+    """
+    Generate space-separated random integers.
+
+    Args:
+        count: Number of integers
+        low: Smallest value
+        high: Largest value
+        seed: Random seed for reproducibility
+
+    Returns:
+        Encoded input
+    """
+    rng = random.Random(seed)
+    return " ".join(str(rng.randint(low, high)) for _ in range(count)).encode()
+
+
+def generate_padded_input(count: int, width: int, seed: int = 42) -> bytes:
+    """
+    Generate zero-padded random integers that all need normalisation.
+
+    Args:
+        count: Number of integers
+        width: Padded token width
+        seed: Random seed for reproducibility
+
+    Returns:
+        Encoded input
+    """
+    rng = random.Random(seed)
+    return " ".join(str(rng.randint(0, 10**(width - 1))).zfill(width)
+                    for _ in range(count)).encode()
+
+
+def text_path(data: bytes) -> bytes:
+    """Run the original str.split()/int()/str() path."""
+    return tablica.reverse_and_format(tablica.parse_integers(data.decode())).encode()
+
+
+def best_time(func, data: bytes, repeat: int) -> float:
+    """
+    Measure the best wall time of several runs.
+
+    Args:
+        func: Callable taking the input bytes
+        data: Input bytes
+        repeat: Number of runs
+
+    Returns:
+        Best time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a throughput table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000, help="integers per input")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    backends = [('text', text_path), ('bytes', tablica.reverse_tokens)]
+    if tablica.load_numpy() is not None:
+        backends.append(('numpy', tablica.reverse_numpy))
+    else:
+        print("NumPy not installed - numpy backend skipped")
+
+    datasets = [
+        ('small values [-100, 100]', generate_input(args.count, -100, 100)),
+        ('32-bit values', generate_input(args.count, -2**31, 2**31 - 1)),
+        ('10-digit positive', generate_input(args.count, 10**9, 10**10 - 1)),
+        ('zero-padded to 8 digits', generate_padded_input(args.count, 8)),
+    ]
+
+    print(f"{'dataset':<28}{'backend':<10}{'time [s]':>10}{'MB/s':>10}")
+    print("-" * 58)
+    for name, data in datasets:
+        expected = text_path(data)
+        for backend, func in backends:
+            if func(data) != expected:
+                print(f"{name:<28}{backend:<10}{'MISMATCH':>10}")
+                continue
+            elapsed = best_time(func, data, args.repeat)
+            throughput = len(data) / elapsed / 1e6
+            print(f"{name:<28}{backend:<10}{elapsed:>10.3f}{throughput:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
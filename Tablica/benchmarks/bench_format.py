@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Output formatting benchmark for the TABLICA Python solution.
+
+Compares formatting reversed integers with str() (the previous
+iter_reversed_blocks) against format_integers() with the precomputed
+hot_table(), slice by slice as write_reversed() does, on skewed and
+uniform value distributions. The one-off cost of building the table is
+printed separately.
+
+Usage:
+    python3 benchmarks/bench_format.py [--count N] [--repeat R] [--hot-range LIMIT]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+def uniform(count: int, low: int, high: int, seed: int = 42) -> list:
+    """Generate integers uniformly distributed in [low, high]."""
+    rng = random.Random(seed)
+    return [rng.randint(low, high) for _ in range(count)]
+
+
+def skewed(count: int, limit: int, outliers: float = 0.0, seed: int = 42) -> list:
+    """
+    Generate mostly small integers that repeat a lot.
+
+    Magnitudes follow a Pareto distribution (most values have one or two
+    digits, a few reach limit), with random signs.
+
+    Args:
+        count: Number of integers
+        limit: Largest magnitude of the skewed part
+        outliers: Share of values drawn from the whole 32-bit range instead
+        seed: Random seed for reproducibility
+
+    Returns:
+        List of integers
+    """
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        if outliers and rng.random() < outliers:
+            values.append(rng.randint(-2**31, 2**31 - 1))
+        else:
+            value = min(int(rng.paretovariate(1.0)) - 1, limit)
+            values.append(-value if rng.random() < 0.5 else value)
+    return values
+
+
+def format_str(numbers: list, table=None) -> bytes:
+    """Format reversed slices with str(), as before the table."""
+    blocks = []
+    for end in range(len(numbers), 0, -tablica.TOKEN_BATCH):
+        block = numbers[max(0, end - tablica.TOKEN_BATCH):end]
+        block.reverse()
+        blocks.append(' '.join(map(str, block)).encode())
+    return b' '.join(blocks)
+
+
+def format_table(numbers: list, table=None) -> bytes:
+    """Format reversed slices with format_integers() and the table."""
+    blocks = []
+    for end in range(len(numbers), 0, -tablica.TOKEN_BATCH):
+        block = numbers[max(0, end - tablica.TOKEN_BATCH):end]
+        block.reverse()
+        blocks.append(tablica.format_integers(block, table))
+    return b' '.join(blocks)
+
+
+def best_time(func, numbers: list, table, repeat: int) -> float:
+    """
+    Measure the best wall time of several runs.
+
+    Args:
+        func: Formatter taking the numbers and the table
+        numbers: Values to format
+        table: Formatting table
+        repeat: Number of runs
+
+    Returns:
+        Best time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(numbers, table)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a time table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000, help="integers per dataset")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per measurement")
+    parser.add_argument('--hot-range', type=int, default=tablica.HOT_RANGE,
+                        help=f"table limit (default: {tablica.HOT_RANGE})")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = tablica.hot_table(args.hot_range)
+    print(f"table for +-{args.hot_range}: built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    limit = args.hot_range
+    datasets = [
+        ('skewed, |v| <= 100', skewed(args.count, 100)),
+        (f'skewed, |v| <= {limit}', skewed(args.count, limit)),
+        (f'skewed + 0.1% 32-bit', skewed(args.count, limit, outliers=0.001)),
+        ('uniform [-100, 100]', uniform(args.count, -100, 100)),
+        (f'uniform [-{limit}, {limit}]', uniform(args.count, -limit, limit)),
+        ('uniform 32-bit', uniform(args.count, -2**31, 2**31 - 1)),
+    ]
+
+    print(f"{'dataset':<28}{'str [s]':>10}{'table [s]':>11}{'speedup':>9}")
+    print("-" * 58)
+    for name, numbers in datasets:
+        if format_table(numbers, table) != format_str(numbers):
+            print(f"{name:<28}{'MISMATCH':>10}")
+            continue
+        plain = best_time(format_str, numbers, table, args.repeat)
+        fast = best_time(format_table, numbers, table, args.repeat)
+        print(f"{name:<28}{plain:>10.3f}{fast:>11.3f}{plain / fast:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
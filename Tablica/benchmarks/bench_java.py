@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Java execution mode benchmark for the TABLICA Java solution.
+
+Runs the Java solution through SolutionRunner on seeded inputs of several
+sizes and reports wall time and throughput per mode:
+
+- cold: a new JVM per run
+- cds: a new JVM per run, started from an AppCDS archive
+- warm (first): first run sent to a freshly started harness JVM
+- warm: later runs on the same harness JVM, after JIT warm-up
+
+Usage:
+    python3 benchmarks/bench_java.py [--sizes 1e3 1e5 1e6] [--repeat N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.generators import generate_input  # noqa: E402
+from benchmarks.suite import parse_size  # noqa: E402
+from tests.test_runner import SolutionRunner  # noqa: E402
+
+
+def timed_runs(runner: SolutionRunner, input_data: str, repeat: int) -> list:
+    """
+    Time repeated runs of the Java solution.
+
+    Args:
+        runner: Runner in the mode to measure
+        input_data: Program input
+        repeat: Number of runs
+
+    Returns:
+        Wall times in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, stderr, returncode = runner.run('java', input_data, timeout=600)
+        times.append(time.perf_counter() - start)
+        if returncode != 0:
+            raise RuntimeError(f"Java exited with {returncode}: {stderr}")
+    return times
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[10**3, 10**5, 10**6],
+                        help="integer counts, e.g. 1e3 1e6")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per mode (best is kept)")
+    parser.add_argument('--warmup', type=int, default=20, help="harness runs before timing warm")
+    args = parser.parse_args()
+
+    # Private cache so the AppCDS archive is created here, not in timing
+    cache_dir = tempfile.mkdtemp(prefix='tablica_')
+    try:
+        cold = SolutionRunner(cache_dir=cache_dir, java_mode='cold')
+        cds = SolutionRunner(cache_dir=cache_dir, java_mode='cds')
+        warm = SolutionRunner(cache_dir=cache_dir, java_mode='warm', precompile=False)
+        cold.command('java')  # raises if the JDK is missing or compilation fails
+
+        print(f"{'size':>9}{'mode':>16}{'time':>12}{'throughput':>15}")
+        print("-" * 52)
+        for size in args.sizes:
+            input_data = generate_input(size, 'int32').decode()
+            megabytes = len(input_data) / 1e6
+            build_dir, _ = warm._build('java')
+            harness = warm._java_harness(build_dir)
+            harness.close()  # time the first request on a fresh JVM
+            results = [
+                ('cold', min(timed_runs(cold, input_data, args.repeat))),
+                ('cds', min(timed_runs(cds, input_data, args.repeat))),
+                ('warm (first)', timed_runs(warm, input_data, 1)[0]),
+            ]
+            timed_runs(warm, input_data, args.warmup)
+            results.append(('warm', min(timed_runs(warm, input_data, args.repeat))))
+            for mode, elapsed in results:
+                print(f"{size:>9}{mode:>16}{elapsed * 1000:>9.1f} ms"
+                      f"{megabytes / elapsed:>10.1f} MB/s")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
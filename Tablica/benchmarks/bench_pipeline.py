@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Pipelined-read benchmark for the TABLICA Python solution.
+
+Feeds tablica.py through a throttled local pipe and compares:
+
+- read-all: the default path, which reads everything before parsing
+- --stream: chunked parsing in the main thread, one blocking read at a time
+- --pipeline: a reader thread fills a queue while the main thread parses
+
+against the time to read the throttled input alone and the time to
+parse it from an unthrottled pipe.
+
+The producer sends bursts at a fixed average rate and, like a network
+sender, cannot catch up after a write blocked on a full pipe. A kernel
+pipe buffers only 64 KiB, so a consumer that parses instead of reading
+stalls the producer; the --pipeline reader thread keeps draining it.
+
+Usage:
+    python3 benchmarks/bench_pipeline.py [--count N] [--rate MB/s] [--burst BYTES]
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+SOLUTION = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        '..', 'solutions', 'tablica.py')
+
+
+def generate_input(count: int, seed: int = 42) -> bytes:
+    """Generate newline-separated random 32-bit integers."""
+    rng = random.Random(seed)
+    return "\n".join(str(rng.randint(-2**31, 2**31 - 1)) for _ in range(count)).encode()
+
+
+def feed(pipe, data: bytes, rate: float, burst: int) -> None:
+    """
+    Write data to a pipe in bursts at a fixed average rate, then close it.
+
+    Time spent blocked on a full pipe is lost: the next burst is due one
+    period after the previous write returned.
+
+    Args:
+        pipe: Writable binary pipe
+        data: Bytes to write
+        rate: Bytes per second (0 for unthrottled)
+        burst: Bytes per write
+    """
+    due = time.perf_counter()
+    try:
+        for offset in range(0, len(data), burst):
+            if rate:
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            pipe.write(data[offset:offset + burst])
+            pipe.flush()
+            due = max(due, time.perf_counter()) + burst / rate if rate else 0
+    finally:
+        pipe.close()
+
+
+def timed_run(command, data: bytes, rate: float, burst: int) -> float:
+    """
+    Run a command fed through a throttled pipe.
+
+    Args:
+        command: Command line
+        data: Input bytes
+        rate: Bytes per second (0 for unthrottled)
+        burst: Bytes per write
+
+    Returns:
+        Wall time in seconds until the command exits
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+    feeder = threading.Thread(target=feed, args=(process.stdin, data, rate, burst))
+    feeder.start()
+    process.wait()
+    feeder.join()
+    elapsed = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(f"{command} exited with {process.returncode}")
+    return elapsed
+
+
+def best_of(repeat: int, *args) -> float:
+    """Best wall time of several timed_run calls."""
+    return min(timed_run(*args) for _ in range(repeat))
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000000, help="integers in the input")
+    parser.add_argument('--rate', type=float, default=0,
+                        help="pipe rate in MB/s (default: matched to the parse time)")
+    parser.add_argument('--burst', type=int, default=1 << 19, help="bytes per producer write")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per mode (best is kept)")
+    args = parser.parse_args()
+
+    data = generate_input(args.count)
+    solution = [sys.executable, SOLUTION]
+
+    parse_time = best_of(args.repeat, solution + ['--stream'], data, 0, args.burst)
+    # Equal read and parse times show the overlap best
+    rate = args.rate * 1e6 if args.rate else len(data) / parse_time
+    read_time = best_of(args.repeat, [sys.executable, '-c',
+                                      'import sys; sys.stdin.buffer.read()'], data, rate,
+                        args.burst)
+
+    print(f"Input: {args.count} integers, {len(data) / 1e6:.1f} MB, "
+          f"pipe throttled to {rate / 1e6:.1f} MB/s in {args.burst // 1024} KiB bursts")
+    print()
+    print(f"{'mode':<36}{'time':>10}")
+    print("-" * 46)
+    print(f"{'read only (throttled)':<36}{read_time:>8.3f} s")
+    print(f"{'parse only (--stream, unthrottled)':<36}{parse_time:>8.3f} s")
+    print(f"{'sum / max':<36}{read_time + parse_time:>8.3f} s / "
+          f"{max(read_time, parse_time):.3f} s")
+    for name, extra in [('read-all (default)', []), ('--stream', ['--stream']),
+                        ('--pipeline', ['--pipeline'])]:
+        elapsed = best_of(args.repeat, solution + extra, data, rate, args.burst)
+        print(f"{name:<36}{elapsed:>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Server mode benchmark for the TABLICA Python solution.
+
+Starts tablica.py --serve on a temporary Unix socket, sends many tiny
+requests over one connection and reports requests per second and
+round-trip latency percentiles, next to the cost of spawning one
+tablica.py process per request.
+
+Usage:
+    python3 benchmarks/bench_server.py [--requests N] [--spawns M]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SOLUTIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'solutions')
+sys.path.insert(0, SOLUTIONS_DIR)
+
+import tablica  # noqa: E402
+
+SOLUTION = os.path.join(SOLUTIONS_DIR, 'tablica.py')
+
+
+def percentiles(samples):
+    """
+    Summarise latency samples.
+
+    Args:
+        samples: Latencies in seconds
+
+    Returns:
+        Dict of p50/p90/p99/max in milliseconds
+    """
+    ordered = sorted(samples)
+    count = len(ordered)
+    pick = lambda fraction: ordered[min(count - 1, int(fraction * count))] * 1000
+    return {'p50': pick(0.50), 'p90': pick(0.90), 'p99': pick(0.99), 'max': ordered[-1] * 1000}
+
+
+def wait_for_socket(path: str, timeout: float = 10.0) -> None:
+    """Wait until the server has created its socket file."""
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            raise RuntimeError("server did not start")
+        time.sleep(0.01)
+
+
+def bench_server(path: str, payloads) -> list:
+    """Send payloads over one connection and time each round trip."""
+    latencies = []
+    start = time.perf_counter()
+
+    def timed():
+        nonlocal start
+        for payload in payloads:
+            start = time.perf_counter()
+            yield payload
+
+    for status, body in tablica.request_reversal(path, timed()):
+        latencies.append(time.perf_counter() - start)
+        if status != tablica.STATUS_OK:
+            raise RuntimeError(body.decode())
+    return latencies
+
+
+def bench_spawn(payloads) -> list:
+    """Run one tablica.py process per payload and time each run."""
+    latencies = []
+    for payload in payloads:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SOLUTION], input=payload,
+                       capture_output=True, check=True)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, latencies) -> None:
+    """Print throughput and latency percentiles of one mode."""
+    stats = percentiles(latencies)
+    rps = len(latencies) / sum(latencies)
+    print(f"{name:<22}{len(latencies):>9}{rps:>12.1f}"
+          f"{stats['p50']:>10.3f}{stats['p90']:>10.3f}{stats['p99']:>10.3f}{stats['max']:>10.3f}")
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=10000, help="requests sent to the server")
+    parser.add_argument('--spawns', type=int, default=50, help="process spawns to time")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = [" ".join(str(rng.randint(-1000, 1000)) for _ in range(rng.randint(1, 20))).encode()
+                for _ in range(args.requests)]
+
+    tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+    path = os.path.join(tmp_dir, 'server.sock')
+    server = subprocess.Popen([sys.executable, SOLUTION, '--serve', path],
+                              stderr=subprocess.PIPE, text=True)
+    try:
+        wait_for_socket(path)
+        server_latencies = bench_server(path, payloads)
+    finally:
+        server.terminate()
+        _, server_stats = server.communicate(timeout=10)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    spawn_latencies = bench_spawn(payloads[:args.spawns])
+
+    print(f"{'mode':<22}{'requests':>9}{'req/s':>12}{'p50 ms':>10}{'p90 ms':>10}"
+          f"{'p99 ms':>10}{'max ms':>10}")
+    print("-" * 83)
+    report('server (round trip)', server_latencies)
+    report('process per request', spawn_latencies)
+    print()
+    print(f"Server-side stats: {server_stats.strip()}")
+
+
+if __name__ == "__main__":
+    main()
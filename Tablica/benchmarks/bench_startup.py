@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the TABLICA Python solution.
+
+Spawns tablica.py on a tiny input many times and reports the wall time
+of each run next to the bare interpreter (python -c pass):
+
+- warm: bytecode caches populated, as in repeated judge runs
+- cold: every run gets an empty PYTHONPYCACHEPREFIX, so each imported
+  module is compiled from source again
+
+It also lists the modules tablica.py imports beyond the interpreter's
+own, as reported by -X importtime.
+
+Usage:
+    python3 benchmarks/bench_startup.py [--runs N] [--cold-runs M]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SOLUTION = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        '..', 'solutions', 'tablica.py')
+
+INPUT = b"1 2 3 4 5\n"
+
+CASES = [
+    ('python -c pass', ['-c', 'pass']),
+    ('tablica.py', [SOLUTION]),
+    ('tablica.py --stream', [SOLUTION, '--stream']),
+]
+
+
+def spawn_times(args, runs: int, cold: bool = False) -> list:
+    """
+    Time repeated interpreter spawns.
+
+    Args:
+        args: Interpreter arguments
+        runs: Number of spawns
+        cold: Give every spawn an empty bytecode cache
+
+    Returns:
+        Wall times in seconds
+    """
+    times = []
+    for _ in range(runs):
+        env = dict(os.environ)
+        cache_dir = tempfile.mkdtemp(prefix='tablica_') if cold else None
+        if cache_dir:
+            env['PYTHONPYCACHEPREFIX'] = cache_dir
+        try:
+            start = time.perf_counter()
+            subprocess.run([sys.executable] + args, input=INPUT, env=env,
+                           capture_output=True, check=True)
+            times.append(time.perf_counter() - start)
+        finally:
+            if cache_dir:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+    return times
+
+
+def imported_modules(args) -> dict:
+    """
+    Collect -X importtime output of one run.
+
+    Args:
+        args: Interpreter arguments
+
+    Returns:
+        Dict of module name to (self, cumulative) import time in microseconds
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, input=INPUT.decode(),
+                            capture_output=True, check=True, text=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(own), int(cumulative))
+    return modules
+
+
+def main() -> None:
+    """Run the benchmark and print the tables."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=50, help="warm spawns per case")
+    parser.add_argument('--cold-runs', type=int, default=5, help="cold spawns per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<24}{'warm median':>14}{'warm min':>11}{'cold median':>14}")
+    print("-" * 63)
+    for name, case_args in CASES:
+        spawn_times(case_args, 2)  # populate the caches
+        warm = spawn_times(case_args, args.runs)
+        cold = spawn_times(case_args, args.cold_runs, cold=True)
+        print(f"{name:<24}{statistics.median(warm) * 1000:>11.1f} ms"
+              f"{min(warm) * 1000:>8.1f} ms{statistics.median(cold) * 1000:>11.1f} ms")
+
+    baseline = imported_modules(['-c', 'pass'])
+    for name, case_args in CASES[1:]:
+        extra = {module: times for module, times in imported_modules(case_args).items()
+                 if module not in baseline}
+        total = sum(own for own, _ in extra.values())
+        print()
+        print(f"Imports beyond the interpreter's ({name}): {len(extra)} modules, "
+              f"{total / 1000:.1f} ms")
+        for module, (own, cumulative) in sorted(extra.items(), key=lambda item: -item[1][1])[:10]:
+            print(f"  {module:<28}{own:>8} us{cumulative:>10} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Seeded input generators for TABLICA benchmarks.
+
+Inputs are described by a profile (digit-width distribution, share of
+negative values and separator mix) and generated chunk by chunk, each
+chunk from its own seeded random stream. The same (profile, count, seed)
+always gives the same bytes, and inputs far larger than memory (1e8
+integers is about 1 GB) can be written straight to disk.
+
+Values stay within 32-bit signed range so the Java and C++ solutions
+can be compared on the same inputs.
+"""
+
+import random
+from typing import Dict, Iterator, List, Tuple
+
+# Largest value accepted by every solution (Java/C++ use 32-bit int)
+INT32_MAX = 2**31 - 1
+
+# Integers generated per chunk (keeps the generating process small, which
+# matters because spawned solutions inherit its peak RSS, see suite.py)
+CHUNK_COUNT = 10000
+
+# Separator sets; "mixed" follows test_mixed_separators in test_advanced.py
+SEPARATORS: Dict[str, List[str]] = {
+    'space': [' '],
+    'newline': ['\n'],
+    'mixed': [' ', '  ', '    ', '\t', '\t\t', '\n'],
+}
+
+# digits: (fewest, most) decimal digits, each width equally likely
+# negative_ratio: share of values written with a minus sign
+# separators: key of SEPARATORS
+PROFILES: Dict[str, Dict] = {
+    'small': {'digits': (1, 3), 'negative_ratio': 0.5, 'separators': 'space'},
+    'int32': {'digits': (1, 10), 'negative_ratio': 0.5, 'separators': 'space'},
+    'wide': {'digits': (9, 10), 'negative_ratio': 0.0, 'separators': 'space'},
+    'lines': {'digits': (1, 10), 'negative_ratio': 0.5, 'separators': 'newline'},
+    'mixed_separators': {'digits': (1, 6), 'negative_ratio': 0.3, 'separators': 'mixed'},
+}
+
+
+def value_ranges(digits: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    Value range of every digit width of a profile.
+
+    Args:
+        digits: (fewest, most) decimal digits
+
+    Returns:
+        List of (low, high) pairs, one per width, capped at INT32_MAX
+    """
+    fewest, most = digits
+    return [(10 ** (width - 1) if width > 1 else 0, min(10 ** width - 1, INT32_MAX))
+            for width in range(fewest, most + 1)]
+
+
+def generate_chunk(count: int, profile: Dict, rng: random.Random) -> str:
+    """
+    Generate one chunk of input text.
+
+    Args:
+        count: Number of integers
+        profile: Entry of PROFILES
+        rng: Random stream of this chunk
+
+    Returns:
+        Integers, each followed by a separator
+    """
+    ranges = value_ranges(profile['digits'])
+    negative_ratio = profile['negative_ratio']
+    separators = SEPARATORS[profile['separators']]
+
+    parts = []
+    for _ in range(count):
+        low, high = rng.choice(ranges)
+        value = rng.randint(low, high)
+        if value and rng.random() < negative_ratio:
+            value = -value
+        parts.append(str(value))
+        parts.append(rng.choice(separators))
+    return ''.join(parts)
+
+
+def iter_chunks(count: int, profile_name: str, seed: int = 42) -> Iterator[bytes]:
+    """
+    Generate an input chunk by chunk.
+
+    Args:
+        count: Total number of integers
+        profile_name: Key of PROFILES
+        seed: Base seed; chunk i uses a stream derived from (seed, i)
+
+    Yields:
+        Encoded chunks; concatenated they form the whole input
+
+    Raises:
+        KeyError: If the profile is unknown
+    """
+    profile = PROFILES[profile_name]
+    for index, start in enumerate(range(0, count, CHUNK_COUNT)):
+        rng = random.Random(f"{seed}:{profile_name}:{index}")
+        yield generate_chunk(min(CHUNK_COUNT, count - start), profile, rng).encode()
+
+
+def generate_input(count: int, profile_name: str, seed: int = 42) -> bytes:
+    """
+    Generate a whole input in memory.
+
+    Args:
+        count: Number of integers
+        profile_name: Key of PROFILES
+        seed: Base seed
+
+    Returns:
+        Encoded input
+    """
+    return b''.join(iter_chunks(count, profile_name, seed))
+
+
+def write_input(path: str, count: int, profile_name: str, seed: int = 42) -> int:
+    """
+    Generate an input straight to a file.
+
+    Args:
+        path: Destination file
+        count: Number of integers
+        profile_name: Key of PROFILES
+        seed: Base seed
+
+    Returns:
+        Number of bytes written
+    """
+    size = 0
+    with open(path, 'wb') as f:
+        for chunk in iter_chunks(count, profile_name, seed):
+            f.write(chunk)
+            size += len(chunk)
+    return size
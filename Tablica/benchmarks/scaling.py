@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Empirical complexity check for TABLICA solutions.
+
+Runs each solution through SolutionRunner on seeded corpus inputs of
+geometrically increasing size and fits
+
+    cost(n) = startup + coefficient * n ** exponent
+
+where startup is measured on an empty input and subtracted first, so
+interpreter or JVM startup does not flatten the curve. The exponent is
+fitted by least squares on log(cost - startup) against log(n). A linear
+solution fits close to 1; a quadratic step anywhere in parsing or output
+pushes it towards 2 long before any absolute time limit is hit.
+
+Cost is CPU time (user + system) where it is measured, which is steadier
+than wall time on a busy machine, and wall time otherwise (warm-mode Java).
+Each point is the best of several runs.
+
+Usage (from the Tablica directory):
+    python3 -m benchmarks.scaling [--languages python java cpp]
+        [--sizes 1e4 3e4 1e5 3e5 1e6] [--repeat 3]
+"""
+
+import argparse
+import math
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from benchmarks.suite import parse_size
+from tests import corpus
+from tests.test_runner import RunResult, SolutionRunner
+
+LANGUAGES = ['python', 'java', 'cpp']
+
+# Geometric series from 1e4 to 1e6 (factor sqrt(10))
+DEFAULT_SIZES = [10**4, 31623, 10**5, 316228, 10**6]
+
+# Fits above this exponent are rejected as clearly super-linear
+MAX_EXPONENT = 1.3
+
+# Points whose cost above startup is smaller than this (seconds) or than
+# this share of startup are left out of the fit: they are mostly noise
+MIN_EXCESS_S = 0.002
+MIN_EXCESS_SHARE = 0.2
+
+# Fewest points a fit needs
+MIN_POINTS = 3
+
+
+@dataclass
+class ScalingFit:
+    """Fitted cost curve of one solution."""
+
+    language: str
+    startup_s: float
+    exponent: float
+    coefficient: float
+    sizes: List[int]
+    costs: List[float]
+    metric: str = 'cpu_s'
+
+    @property
+    def ns_per_element(self) -> float:
+        """Cost above startup per element at the largest size, in nanoseconds."""
+        return (self.costs[-1] - self.startup_s) / self.sizes[-1] * 1e9
+
+    @property
+    def linear(self) -> bool:
+        """Whether the exponent is within MAX_EXPONENT."""
+        return self.exponent <= MAX_EXPONENT
+
+
+def fit_exponent(sizes: Sequence[int], costs: Sequence[float], startup_s: float):
+    """
+    Fit costs - startup_s = coefficient * size ** exponent.
+
+    Args:
+        sizes: Input sizes (elements)
+        costs: Cost at each size in seconds
+        startup_s: Cost of an empty input in seconds
+
+    Returns:
+        Tuple of (exponent, coefficient)
+
+    Raises:
+        ValueError: If fewer than MIN_POINTS sizes rise clearly above startup
+    """
+    floor = max(MIN_EXCESS_S, MIN_EXCESS_SHARE * startup_s)
+    points = [(math.log(size), math.log(cost - startup_s))
+              for size, cost in zip(sizes, costs) if cost - startup_s >= floor]
+    if len(points) < MIN_POINTS:
+        raise ValueError(f"only {len(points)} of {len(sizes)} sizes cost more than "
+                         f"{floor * 1000:.1f} ms above startup; use larger sizes")
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    exponent = (sum((x - mean_x) * (y - mean_y) for x, y in points)
+                / sum((x - mean_x) ** 2 for x, _ in points))
+    return exponent, math.exp(mean_y - exponent * mean_x)
+
+
+def dataset_for(size: int) -> corpus.Dataset:
+    """Seeded int32 corpus dataset of a given size."""
+    return corpus.load_spec(f"scaling_{size}",
+                            {'kind': 'profile', 'profile': 'int32', 'count': size, 'seed': 42})
+
+
+def best_cost(runner: SolutionRunner, language: str, repeat: int, timeout: float,
+              dataset: Optional[corpus.Dataset] = None) -> RunResult:
+    """
+    Run a solution repeatedly and return its cheapest run.
+
+    Args:
+        runner: Runner to use
+        language: Solution language
+        repeat: Number of runs
+        timeout: Seconds per run
+        dataset: Input, or None for an empty input
+
+    Returns:
+        RunResult with the lowest cost
+
+    Raises:
+        RuntimeError: If a run fails or prints the wrong output
+    """
+    best = None
+    for _ in range(repeat):
+        if dataset is None:
+            result = runner.run(language, "", timeout)
+        else:
+            result = runner.run(language, timeout=timeout, input_path=dataset.path,
+                                keep_stdout=False)
+        if result.returncode != 0:
+            raise RuntimeError(f"{language} exited with {result.returncode}: {result.stderr}")
+        if dataset is not None and result.stdout_sha256 != dataset.expected_sha256:
+            raise RuntimeError(f"{language}: wrong output for {dataset.name}")
+        if best is None or cost(result) < cost(best):
+            best = result
+    return best
+
+
+def cost(result: RunResult) -> float:
+    """CPU time of a run if measured, else wall time."""
+    return result.cpu_s if result.cpu_s is not None else result.wall_s
+
+
+def measure_scaling(runner: SolutionRunner, language: str,
+                    sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 3,
+                    timeout: float = 120) -> ScalingFit:
+    """
+    Measure and fit the cost curve of one solution.
+
+    Args:
+        runner: Runner to use
+        language: Solution language
+        sizes: Input sizes, smallest first
+        repeat: Runs per size (the best is kept)
+        timeout: Seconds per run
+
+    Returns:
+        ScalingFit
+
+    Raises:
+        RuntimeError: If a run fails
+        ValueError: If the sizes are too small to fit
+    """
+    startup = best_cost(runner, language, repeat, timeout)
+    results = [best_cost(runner, language, repeat, timeout, dataset_for(size)) for size in sizes]
+    metric = 'cpu_s' if all(r.cpu_s is not None for r in [startup] + results) else 'wall_s'
+    startup_s = getattr(startup, metric)
+    costs = [getattr(result, metric) for result in results]
+    exponent, coefficient = fit_exponent(sizes, costs, startup_s)
+    return ScalingFit(language, startup_s, exponent, coefficient, list(sizes), costs, metric)
+
+
+def main() -> int:
+    """Measure every language and print the fits; nonzero if one is super-linear."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--languages', nargs='+', choices=LANGUAGES, default=LANGUAGES)
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=DEFAULT_SIZES,
+                        help="integer counts, e.g. 1e4 1e5 1e6")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per size (best is kept)")
+    args = parser.parse_args()
+
+    runner = SolutionRunner()
+    print(f"{'language':<10}{'startup':>10}{'exponent':>10}{'ns/elem':>10}  verdict")
+    print("-" * 50)
+    status = 0
+    for language in args.languages:
+        try:
+            fit = measure_scaling(runner, language, sorted(args.sizes), args.repeat)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"{language:<10}  skipped: {e}")
+            continue
+        verdict = "linear" if fit.linear else f"SUPER-LINEAR (> {MAX_EXPONENT})"
+        print(f"{language:<10}{fit.startup_s * 1000:>7.1f} ms{fit.exponent:>10.2f}"
+              f"{fit.ns_per_element:>10.1f}  {verdict}")
+        if not fit.linear:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
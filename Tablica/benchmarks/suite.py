@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for TABLICA solutions.
+
+Generates seeded inputs (see benchmarks/generators.py), runs every
+language through SolutionRunner's command and execute() with the input
+file on stdin and records wall time, throughput and peak RSS of each run as JSON. A second command
+compares two JSON reports and fails on regressions.
+
+Usage (from the Tablica directory):
+    python3 -m benchmarks.suite run [--languages python cpp java]
+        [--profiles int32 mixed_separators] [--sizes 1e3 1e4 1e5 1e6]
+        [--repeat 3] [--output results.json]
+    python3 -m benchmarks.suite compare BASELINE.json CURRENT.json [--threshold 0.1]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Sequence
+
+from benchmarks.generators import PROFILES, write_input
+from tests.test_runner import OutputDigest, SolutionRunner, execute
+
+LANGUAGES = ['python', 'java', 'cpp']
+
+DEFAULT_PROFILES = ['int32', 'mixed_separators']
+
+# 1e7 and 1e8 are opt-in: generating 1e8 integers takes minutes and ~1 GB
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6]
+
+DEFAULT_OUTPUT = 'benchmark-results.json'
+
+# Report format version, bumped on incompatible changes
+SCHEMA_VERSION = 1
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as 1000, 1e6 or 2.5e5."""
+    try:
+        size = int(float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive: {value!r}")
+    return size
+
+
+def measure(command: List[str], input_path: str, timeout: float) -> Dict:
+    """
+    Run a command once with a file on stdin and measure it.
+
+    The run goes through the test runner's execute(), so the child is
+    reaped by its spawner process and rss_floor_kb is the spawner's small
+    high-water mark rather than this process's.
+
+    Args:
+        command: Command line
+        input_path: File fed to stdin
+        timeout: Seconds before the process is killed
+
+    Returns:
+        Dict with wall_s, user_s, sys_s, max_rss_kb, rss_floor_kb,
+        returncode and stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the run ran out of time
+    """
+    _, stderr, returncode, usage = execute(command, b'', timeout, input_path=input_path,
+                                           stdout_sink=OutputDigest())
+    return {
+        'wall_s': usage['wall_s'],
+        'user_s': usage['user_s'],
+        'sys_s': usage['sys_s'],
+        'max_rss_kb': usage['max_rss_kb'],
+        'rss_floor_kb': usage['rss_floor_kb'],
+        'returncode': returncode,
+        'stderr': stderr.decode(errors='replace').strip(),
+    }
+
+
+def run_case(runner: SolutionRunner, language: str, input_path: str, input_bytes: int,
+             repeat: int, timeout: float, args: Sequence[str]) -> Dict:
+    """
+    Benchmark one language on one input.
+
+    Args:
+        runner: Runner that builds (and compiles) the command
+        language: One of LANGUAGES
+        input_path: Generated input file
+        input_bytes: Size of the input
+        repeat: Number of runs; the best wall time is reported
+        timeout: Seconds per run
+        args: Extra arguments passed to the solution
+
+    Returns:
+        Result fields for the report (an "error" entry if it could not run)
+    """
+    try:
+        command = runner.command(language, args)
+    except (RuntimeError, OSError) as e:
+        return {'error': str(e).splitlines()[0] if str(e) else type(e).__name__}
+
+    runs = []
+    for _ in range(repeat):
+        try:
+            run = measure(command, input_path, timeout)
+        except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+            return {'error': f"{type(e).__name__}: {e}"}
+        if run['returncode'] != 0:
+            return {'error': f"exit code {run['returncode']}: {run['stderr'][:200]}"}
+        runs.append(run)
+
+    best = min(runs, key=lambda run: run['wall_s'])
+    return {
+        'wall_s': best['wall_s'],
+        'median_s': statistics.median(run['wall_s'] for run in runs),
+        'runs_s': [run['wall_s'] for run in runs],
+        'user_s': best['user_s'],
+        'sys_s': best['sys_s'],
+        'mb_per_s': input_bytes / 1e6 / best['wall_s'],
+        'max_rss_kb': max(run['max_rss_kb'] for run in runs),
+        'rss_floor_kb': max(run['rss_floor_kb'] for run in runs),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, timeout=10)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run_suite(languages: Sequence[str], profiles: Sequence[str], sizes: Sequence[int],
+              repeat: int = 3, timeout: float = 600, seed: int = 42,
+              args: Sequence[str] = (), log=sys.stdout) -> Dict:
+    """
+    Run every (profile, size, language) combination.
+
+    Each input is generated once into a temporary directory and shared
+    by all languages.
+
+    Args:
+        languages: Languages to run
+        profiles: Keys of PROFILES
+        sizes: Integer counts
+        repeat: Runs per combination
+        timeout: Seconds per run
+        seed: Base seed of the generators
+        args: Extra arguments passed to every solution
+        log: Stream for progress lines (None for silence)
+
+    Returns:
+        Report with "meta" and "results"
+    """
+    runner = SolutionRunner()
+    results = []
+    tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+    try:
+        for profile in profiles:
+            for size in sizes:
+                input_path = os.path.join(tmp_dir, f"{profile}_{size}.txt")
+                input_bytes = write_input(input_path, size, profile, seed)
+                for language in languages:
+                    result = {
+                        'language': language,
+                        'profile': profile,
+                        'size': size,
+                        'bytes': input_bytes,
+                        'args': list(args),
+                    }
+                    result.update(run_case(runner, language, input_path, input_bytes,
+                                           repeat, timeout, args))
+                    results.append(result)
+                    if log is not None:
+                        log.write(format_result(result) + "\n")
+                        log.flush()
+                os.unlink(input_path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    meta = {
+        'schema': SCHEMA_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'repeat': repeat,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def format_result(result: Dict) -> str:
+    """Format one result as a table row."""
+    name = f"{result['language']:<10}{result['profile']:<18}{result['size']:>11}"
+    if 'error' in result:
+        return f"{name}  error: {result['error']}"
+    at_floor = "<=" if result['max_rss_kb'] <= result['rss_floor_kb'] else ""
+    return (f"{name}{result['wall_s']:>10.3f} s{result['mb_per_s']:>10.1f} MB/s"
+            f"{at_floor:>4}{result['max_rss_kb'] / 1024:.1f} MB")
+
+
+def result_key(result: Dict) -> tuple:
+    """Identify a result across reports."""
+    return (result['language'], result['profile'], result['size'], tuple(result['args']))
+
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = 0.1) -> List[Dict]:
+    """
+    Compare the results of two reports.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        threshold: Allowed relative slowdown or RSS growth (0.1 = 10%)
+
+    Returns:
+        One entry per result present in both reports, with time and RSS
+        ratios (current / baseline) and a "regression" flag; RSS at or
+        below the spawning process's floor does not count as growth
+    """
+    earlier = {result_key(result): result for result in baseline['results']
+               if 'error' not in result}
+    comparisons = []
+    for result in current['results']:
+        before = earlier.get(result_key(result))
+        if before is None or 'error' in result:
+            continue
+        time_ratio = result['wall_s'] / before['wall_s']
+        rss_ratio = result['max_rss_kb'] / before['max_rss_kb']
+        rss_grew = (rss_ratio > 1 + threshold
+                    and result['max_rss_kb'] > result['rss_floor_kb'])
+        comparisons.append({
+            'key': result_key(result),
+            'time_ratio': time_ratio,
+            'rss_ratio': rss_ratio,
+            'regression': time_ratio > 1 + threshold or rss_grew,
+        })
+    return comparisons
+
+
+def command_run(options: argparse.Namespace) -> int:
+    """Run the suite and write the JSON report."""
+    print(f"{'language':<10}{'profile':<18}{'size':>11}{'wall':>12}{'throughput':>15}"
+          f"{'peak RSS':>12}")
+    print("-" * 78)
+    report = run_suite(options.languages, options.profiles, options.sizes,
+                       options.repeat, options.timeout, options.seed, options.args)
+    with open(options.output, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print()
+    print(f"Report written to {options.output}")
+    return 0
+
+
+def command_compare(options: argparse.Namespace) -> int:
+    """Compare two reports; exit code 1 if anything regressed."""
+    with open(options.baseline) as f:
+        baseline = json.load(f)
+    with open(options.current) as f:
+        current = json.load(f)
+
+    comparisons = compare_reports(baseline, current, options.threshold)
+    print(f"{'language':<10}{'profile':<18}{'size':>11}{'time':>10}{'RSS':>10}")
+    print("-" * 59)
+    for entry in comparisons:
+        language, profile, size, _ = entry['key']
+        flag = "  REGRESSION" if entry['regression'] else ""
+        print(f"{language:<10}{profile:<18}{size:>11}{entry['time_ratio']:>9.2f}x"
+              f"{entry['rss_ratio']:>9.2f}x{flag}")
+
+    regressions = sum(entry['regression'] for entry in comparisons)
+    print()
+    print(f"{len(comparisons)} compared, {regressions} regressed "
+          f"(threshold {options.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Benchmark suite for TABLICA solutions.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="run benchmarks and write a JSON report")
+    run.add_argument('--languages', nargs='+', choices=LANGUAGES, default=LANGUAGES)
+    run.add_argument('--profiles', nargs='+', choices=sorted(PROFILES),
+                     default=DEFAULT_PROFILES)
+    run.add_argument('--sizes', nargs='+', type=parse_size, default=DEFAULT_SIZES,
+                     help="integer counts, e.g. 1e3 1e6 1e8")
+    run.add_argument('--repeat', type=int, default=3, help="runs per case (best is kept)")
+    run.add_argument('--timeout', type=float, default=600, help="seconds per run")
+    run.add_argument('--seed', type=int, default=42)
+    run.add_argument('--args', nargs=argparse.REMAINDER, default=[],
+                     help="extra arguments passed to the solutions (must be last)")
+    run.add_argument('--output', default=DEFAULT_OUTPUT, help="JSON report path")
+    run.set_defaults(handler=command_run)
+
+    compare = commands.add_parser('compare', help="compare two JSON reports")
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.1,
+                         help="allowed relative slowdown or RSS growth (default: 0.1)")
+    compare.set_defaults(handler=command_compare)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point."""
+    options = parse_args(argv)
+    sys.exit(options.handler(options))
+
+
+if __name__ == "__main__":
+    main()
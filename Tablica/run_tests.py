@@ -4,18 +4,435 @@ Main test runner for TABLICA problem solutions.
 
 This script runs all test suites (basic, edge cases, performance, error handling)
 for Python, Java, and C++ implementations and provides a comprehensive report.
+
+Every run appends the time each test spent in each language to a local
+history file ($TABLICA_HISTORY_FILE, default .tablica-history.jsonl).
+With --check-regressions the suite is run several times and the samples
+are compared with earlier runs on the same host; significant slowdowns
+are reported and make the exit status 2.
 """
 
+import collections
+import datetime
+import json
+import os
+import platform
+import statistics
 import sys
+import threading
 import unittest
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
+from typing import Dict, List, Optional, Sequence
+
+from tests.test_runner import RunResult, SolutionRunner, current_test
+
+# Runs of the suite per --check-regressions invocation
+DEFAULT_REPEAT = 3
+
+# Earlier runs of the same host and --jobs used as the baseline, and the
+# fewest baseline samples a timing needs to be checked
+BASELINE_RUNS = 20
+MIN_BASELINE_SAMPLES = 8
+
+# A slowdown is reported when the one-sided Mann-Whitney p-value is below
+# SIGNIFICANCE and the median grew by at least MIN_SLOWDOWN and MIN_DELTA_S
+SIGNIFICANCE = 0.01
+MIN_SLOWDOWN = 1.10
+MIN_DELTA_S = 0.005
+
+# Exit status when tests pass but --check-regressions found a slowdown
+EXIT_REGRESSION = 2
+
+# TestResult calls made by TestCase.run, recorded in worker threads and
+# replayed on the main result
+RESULT_EVENTS = ('startTest', 'stopTest', 'addSuccess', 'addFailure', 'addError', 'addSkip',
+                 'addSubTest', 'addExpectedFailure', 'addUnexpectedSuccess')
+
+
+class RecordingResult(unittest.TestResult):
+    """Result that records the outcome of one test for replay in the main thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def replay(self, result: unittest.TestResult) -> None:
+        """Apply the recorded calls to another result, in order."""
+        for name, args in self.events:
+            getattr(result, name)(*args)
+
+
+def _recorder(name: str):
+    """Build a RecordingResult method that records calls to NAME."""
+    def record(self, *args):
+        self.events.append((name, args))
+    return record
+
+
+for _name in RESULT_EVENTS:
+    setattr(RecordingResult, _name, _recorder(_name))
+
+
+class ClassFixture:
+    """setUpClass/tearDownClass of one test class, shared by worker threads."""
+
+    def __init__(self, test_class: type, count: int):
+        """
+        Prepare the fixture; nothing runs until the first enter().
+        
+        Args:
+            test_class: TestCase subclass
+            count: Number of its tests that will run
+        """
+        self.test_class = test_class
+        self.remaining = count
+        self.skipped = getattr(test_class, '__unittest_skip__', False)
+        self.lock = threading.Lock()
+        self.started = False
+        self.error = None
+
+    def enter(self):
+        """Run setUpClass on first use; return its exc_info if it failed."""
+        with self.lock:
+            if not self.started:
+                self.started = True
+                if not self.skipped:
+                    try:
+                        self.test_class.setUpClass()
+                    except Exception:
+                        self.error = sys.exc_info()
+            return self.error
+
+    def leave(self):
+        """Run tearDownClass after the last test; return its exc_info if it failed."""
+        with self.lock:
+            self.remaining -= 1
+            if self.remaining or self.skipped or self.error:
+                return None
+            try:
+                self.test_class.tearDownClass()
+            except Exception:
+                return sys.exc_info()
+            return None
+
+
+def iter_test_cases(test_suite):
+    """Yield the individual test cases of a (nested) suite."""
+    for test in test_suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_test_cases(test)
+        else:
+            yield test
+
+
+class TrackingResult(unittest.TextTestResult):
+    """Text result that marks which test is running (current_test)."""
+
+    def startTest(self, test):
+        self._token = current_test.set(test.id())
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        current_test.reset(self._token)
+
+
+def run_parallel(test_suite: unittest.TestSuite, jobs: int, stream=None) -> unittest.TestResult:
+    """
+    Run test cases on a pool of worker threads.
+    
+    Each test class is set up once, by the first worker that needs it, and
+    torn down after its last test. Classes with parallel_safe = False (they
+    patch process-wide state) run one test at a time afterwards. Output and
+    the returned result match a serial TextTestRunner run, except that
+    tests are reported as they finish.
+    
+    Args:
+        test_suite: Suite to run
+        jobs: Number of worker threads
+        stream: Output stream (default: sys.stdout)
+    
+    Returns:
+        unittest.TextTestResult with every outcome
+    """
+    tests = list(iter_test_cases(test_suite))
+    parallel = [test for test in tests if getattr(type(test), 'parallel_safe', True)]
+    serial = [test for test in tests if not getattr(type(test), 'parallel_safe', True)]
+    fixtures = {}
+    for test in parallel:
+        fixture = fixtures.setdefault(type(test), ClassFixture(type(test), 0))
+        fixture.remaining += 1
+    
+    def run_one(test):
+        fixture = fixtures[type(test)]
+        recording = RecordingResult()
+        error = fixture.enter()
+        if error is None:
+            token = current_test.set(test.id())
+            try:
+                test(recording)
+            finally:
+                current_test.reset(token)
+        else:
+            recording.events = [('startTest', (test,)), ('addError', (test, error)),
+                                ('stopTest', (test,))]
+        error = fixture.leave()
+        if error is not None:
+            recording.events.append(('addError', (test, error)))
+        return recording
+    
+    stream = stream or sys.stdout
+    runner = unittest.TextTestRunner(verbosity=2, stream=stream, resultclass=TrackingResult)
+    result = runner._makeResult()
+    start_time = time.perf_counter()
+    result.startTestRun()
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for future in as_completed([pool.submit(run_one, test) for test in parallel]):
+                future.result().replay(result)
+        unittest.TestSuite(serial).run(result)
+    finally:
+        result.stopTestRun()
+    elapsed = time.perf_counter() - start_time
+    
+    result.printErrors()
+    stream.write(f"{result.separator2}\n")
+    stream.write(f"Ran {result.testsRun} tests in {elapsed:.3f}s ({jobs} jobs)\n\n")
+    stream.write("OK\n" if result.wasSuccessful() else "FAILED\n")
+    return result
 
 
-def run_all_tests():
+def print_resource_table(results: Sequence[RunResult]) -> None:
+    """
+    Print per-language totals of solution runs.
+    
+    Wall and CPU times are summed over runs, peak RSS is the largest of
+    any run, and compile time is counted once per language. Languages run
+    only in warm mode (no per-run CPU or RSS) show "-"; a peak RSS marked
+    "<=" did not rise above what the child inherited from the spawner.
+    
+    Args:
+        results: RunResults, e.g. SolutionRunner.history()
+    """
+    if not results:
+        return
+    print("=" * 70)
+    print("Resource Usage per Language")
+    print("=" * 70)
+    print(f"{'language':<10}{'runs':>6}{'wall s':>9}{'user s':>9}{'sys s':>8}"
+          f"{'peak RSS':>12}{'MB in':>8}{'MB out':>8}{'compile s':>11}")
+    for language in sorted({result.language for result in results}):
+        runs = [result for result in results if result.language == language]
+        measured = [result for result in runs if result.max_rss_kb is not None]
+        wall = sum(result.wall_s for result in runs)
+        mb_in = sum(result.bytes_in for result in runs) / 1e6
+        mb_out = sum(result.bytes_out for result in runs) / 1e6
+        compile_s = max(result.compile_s for result in runs)
+        if measured:
+            user = f"{sum(result.user_s for result in measured):.2f}"
+            system = f"{sum(result.sys_s for result in measured):.2f}"
+            peak = max(result.max_rss_kb for result in measured)
+            floor = max(result.rss_floor_kb or 0 for result in measured)
+            # At the inherited floor the child's own peak is only bounded by it
+            rss = f"{'<=' if peak <= floor else ''}{max(peak, floor) / 1024:.1f} MB"
+        else:
+            user = system = rss = "-"
+        print(f"{language:<10}{len(runs):>6}{wall:>9.2f}{user:>9}{system:>8}{rss:>12}"
+              f"{mb_in:>8.2f}{mb_out:>8.2f}{compile_s:>11.2f}")
+    print()
+
+
+def default_history_file() -> str:
+    """Return $TABLICA_HISTORY_FILE, or .tablica-history.jsonl next to this script."""
+    return (os.environ.get('TABLICA_HISTORY_FILE')
+            or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.tablica-history.jsonl'))
+
+
+def collect_timings(results: Sequence[RunResult]) -> Dict[str, Dict]:
+    """
+    Total the solution runs of each test and language.
+    
+    Args:
+        results: RunResults of one run of the suite
+    
+    Returns:
+        Dict mapping "<test id> [<language>]" to wall_s, cpu_s (None if a
+        run was not measured, e.g. warm-mode Java) and runs
+    """
+    timings = {}
+    for result in results:
+        if result.test_id is None:
+            continue
+        # Suite runs name modules tests.test_x, discovery test_x
+        test_id = result.test_id.removeprefix("tests.")
+        entry = timings.setdefault(f"{test_id} [{result.language}]",
+                                   {'wall_s': 0.0, 'cpu_s': 0.0, 'runs': 0})
+        entry['wall_s'] += result.wall_s
+        entry['runs'] += 1
+        if entry['cpu_s'] is not None:
+            entry['cpu_s'] = None if result.cpu_s is None else entry['cpu_s'] + result.cpu_s
+    return timings
+
+
+def load_history(path: str) -> List[Dict]:
+    """Read the timing history, oldest run first (unreadable lines are skipped)."""
+    records = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def append_history(path: str, runs: Sequence[Dict[str, Dict]], jobs: int) -> None:
+    """
+    Append one line per run of the suite to the timing history.
+    
+    Args:
+        path: History file
+        runs: collect_timings() of each run
+        jobs: --jobs of the runs (timings are only compared at equal jobs)
+    """
+    with open(path, 'a') as f:
+        for timings in runs:
+            record = {
+                'time': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+                'host': platform.node(),
+                'python': platform.python_version(),
+                'jobs': jobs,
+                'timings': timings,
+            }
+            f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def slowdown_p_value(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that current samples are larger.
+    
+    The p-value is exact: the rank sum of the current samples is compared
+    with its distribution over every way of picking that many samples
+    from the pooled ones, so few samples and ties need no approximation.
+    
+    Args:
+        baseline: Earlier samples
+        current: New samples
+    
+    Returns:
+        Probability of a rank sum at least as large if nothing changed
+    """
+    pooled = sorted(list(baseline) + list(current))
+    # Twice the mid-rank of each value, so tied ranks stay integers
+    ranks = {}
+    start = 0
+    while start < len(pooled):
+        end = start
+        while end < len(pooled) and pooled[end] == pooled[start]:
+            end += 1
+        ranks[pooled[start]] = start + end + 1
+        start = end
+
+    observed = sum(ranks[value] for value in current)
+    # ways[k][total]: subsets of k samples whose ranks sum to total
+    ways = [collections.Counter() for _ in range(len(current) + 1)]
+    ways[0][0] = 1
+    for value in list(baseline) + list(current):
+        for k in range(len(current), 0, -1):
+            for total, count in ways[k - 1].items():
+                ways[k][total + ranks[value]] += count
+    subsets = ways[-1]
+    return sum(count for total, count in subsets.items() if total >= observed) / sum(subsets.values())
+
+
+def find_regressions(history: Sequence[Dict], runs: Sequence[Dict[str, Dict]],
+                     jobs: int) -> List[Dict]:
+    """
+    Compare new timings with the recent history.
+    
+    The baseline is the last BASELINE_RUNS earlier runs on this host with
+    the same jobs. CPU time is compared where every sample has it (it does
+    not depend on how busy the machine is), wall time otherwise.
+    
+    Args:
+        history: Earlier runs, from load_history()
+        runs: collect_timings() of each new run
+        jobs: --jobs of the new runs
+    
+    Returns:
+        One dict per slowdown with key, metric, baseline_s and current_s
+        (medians), ratio and p_value, slowest first
+    """
+    host = platform.node()
+    earlier = [record for record in history
+               if record.get('host') == host and record.get('jobs') == jobs][-BASELINE_RUNS:]
+    regressions = []
+    for key in sorted(set().union(*runs)):
+        current = [timings[key] for timings in runs if key in timings]
+        baseline = [record['timings'][key] for record in earlier if key in record['timings']]
+        if len(baseline) < MIN_BASELINE_SAMPLES:
+            continue
+        metric = 'cpu_s' if all(t['cpu_s'] is not None for t in baseline + current) else 'wall_s'
+        before = [t[metric] for t in baseline]
+        after = [t[metric] for t in current]
+        baseline_s, current_s = statistics.median(before), statistics.median(after)
+        if current_s < baseline_s * MIN_SLOWDOWN or current_s - baseline_s < MIN_DELTA_S:
+            continue
+        p_value = slowdown_p_value(before, after)
+        if p_value < SIGNIFICANCE:
+            regressions.append({'key': key, 'metric': metric, 'baseline_s': baseline_s,
+                                'current_s': current_s, 'ratio': current_s / baseline_s,
+                                'p_value': p_value})
+    regressions.sort(key=lambda regression: regression['ratio'], reverse=True)
+    return regressions
+
+
+def print_regressions(regressions: Sequence[Dict]) -> None:
+    """Print the outcome of --check-regressions."""
+    print("=" * 70)
+    print("Performance Regressions")
+    print("=" * 70)
+    if not regressions:
+        print("No significant slowdowns.")
+        print()
+        return
+    print(f"{'baseline':>10}{'current':>10}{'ratio':>8}{'p':>8}  test [language] (metric)")
+    for regression in regressions:
+        print(f"{regression['baseline_s']:>9.3f}s{regression['current_s']:>9.3f}s"
+              f"{regression['ratio']:>7.2f}x{regression['p_value']:>8.4f}  "
+              f"{regression['key']} ({regression['metric']})")
+    print()
+
+
+def run_suite(test_suite: unittest.TestSuite, jobs: int = 1) -> unittest.TestResult:
+    """
+    Run a suite serially, or with run_parallel() when jobs > 1.
+    
+    Args:
+        test_suite: Suite to run
+        jobs: Number of worker threads
+    
+    Returns:
+        Result of the run
+    """
+    if jobs > 1:
+        return run_parallel(test_suite, jobs)
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout, resultclass=TrackingResult)
+    return runner.run(test_suite)
+
+
+def run_all_tests(jobs: int = 1):
     """
     Discover and run all tests in the tests directory.
     
+    Args:
+        jobs: Number of tests run at once (see run_parallel())
+    
     Returns:
         bool: True if all tests passed, False otherwise
     """
@@ -30,24 +447,14 @@ def run_all_tests():
     suite = loader.discover(start_dir, pattern='test_*.py')
     
     # Count total tests
-    def count_tests(test_suite):
-        count = 0
-        for test in test_suite:
-            if isinstance(test, unittest.TestSuite):
-                count += count_tests(test)
-            else:
-                count += 1
-        return count
-    
-    total_tests = count_tests(suite)
+    total_tests = sum(1 for _ in iter_test_cases(suite))
     print(f"Discovered {total_tests} tests across multiple test suites")
     print()
     
     # Run tests with detailed output
-    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
-    
+    first_run = len(SolutionRunner.history())
     start_time = time.time()
-    result = runner.run(suite)
+    result = run_suite(suite, jobs)
     elapsed_time = time.time() - start_time
     
     # Print summary
@@ -62,6 +469,7 @@ def run_all_tests():
     print(f"Skipped: {len(result.skipped)}")
     print(f"Time elapsed: {elapsed_time:.2f} seconds")
     print()
+    print_resource_table(SolutionRunner.history()[first_run:])
     
     # Print detailed failure information
     if result.failures:
@@ -92,12 +500,13 @@ def run_all_tests():
         return False
 
 
-def run_specific_suite(suite_name: str):
+def run_specific_suite(suite_name: str, jobs: int = 1):
     """
     Run a specific test suite.
     
     Args:
         suite_name: Name of the test suite (e.g., 'basic', 'edge_cases', 'performance', 'error_handling')
+        jobs: Number of tests run at once (see run_parallel())
     
     Returns:
         bool: True if all tests passed, False otherwise
@@ -108,8 +517,10 @@ def run_specific_suite(suite_name: str):
     loader = unittest.TestLoader()
     suite = loader.loadTestsFromName(f'tests.test_{suite_name}')
     
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    first_run = len(SolutionRunner.history())
+    result = run_suite(suite, jobs)
+    print()
+    print_resource_table(SolutionRunner.history()[first_run:])
     
     return result.wasSuccessful()
 
@@ -118,21 +529,112 @@ def print_usage():
     """Print usage information."""
     print("Usage:")
     print("  python3 run_tests.py              # Run all tests")
+    print("  python3 run_tests.py --jobs N [suite] # Run N tests at once, languages concurrently")
+    print("  python3 run_tests.py --check-regressions [--repeat N] [suite]")
+    print("                                    # Run N times (default 3), compare with history")
     print("  python3 run_tests.py basic        # Run basic functionality tests")
     print("  python3 run_tests.py edge_cases   # Run edge case tests")
     print("  python3 run_tests.py performance  # Run performance tests")
     print("  python3 run_tests.py error_handling # Run error handling tests")
+    print("  python3 run_tests.py advanced     # Run advanced edge case tests")
+    print("  python3 run_tests.py streaming    # Run streaming mode tests (Python)")
+    print("  python3 run_tests.py file_input   # Run file input (mmap) tests (Python)")
+    print("  python3 run_tests.py byte_path    # Run byte-level fast path tests (Python)")
+    print("  python3 run_tests.py numpy_backend # Run NumPy backend tests (Python)")
+    print("  python3 run_tests.py compact_storage # Run compact storage tests (Python)")
+    print("  python3 run_tests.py parallel     # Run parallel mode tests (Python)")
+    print("  python3 run_tests.py external     # Run external-memory mode tests (Python)")
+    print("  python3 run_tests.py line_modes   # Run per-line mode tests (Python)")
+    print("  python3 run_tests.py server       # Run server mode tests (Python)")
+    print("  python3 run_tests.py startup      # Run startup/import tests (Python)")
+    print("  python3 run_tests.py profile      # Run phase profiler tests (Python)")
+    print("  python3 run_tests.py batch        # Run batch mode tests (Python)")
+    print("  python3 run_tests.py inprocess    # Run library API/in-process runner tests (Python)")
+    print("  python3 run_tests.py output_writer # Run output writer tests (Python)")
+    print("  python3 run_tests.py pipeline     # Run pipelined read tests (Python)")
+    print("  python3 run_tests.py benchmarks   # Run benchmark suite tests")
+    print("  python3 run_tests.py compile_cache # Run compile cache tests (C++)")
+    print("  python3 run_tests.py java_harness # Run warm/AppCDS Java mode tests")
+    print("  python3 run_tests.py run_tests    # Run parallel runner tests")
+    print("  python3 run_tests.py resources    # Run resource accounting tests")
+    print("  python3 run_tests.py corpus       # Run input corpus tests")
+    print("  python3 run_tests.py scaling      # Run scaling (complexity) tests")
     print()
 
 
+def take_option(args: List[str], name: str) -> Optional[str]:
+    """
+    Remove "NAME VALUE" or "NAME=VALUE" from an argument list.
+    
+    Args:
+        args: Arguments, modified in place
+        name: Option name, e.g. '--jobs'
+    
+    Returns:
+        The value, or None if the option is absent
+    """
+    for i, arg in enumerate(args):
+        if arg == name and i + 1 < len(args):
+            value = args[i + 1]
+            del args[i:i + 2]
+            return value
+        if arg.startswith(name + '='):
+            del args[i]
+            return arg[len(name) + 1:]
+    return None
+
+
+def take_flag(args: List[str], name: str) -> bool:
+    """Remove a flag from an argument list; return whether it was there."""
+    if name in args:
+        args.remove(name)
+        return True
+    return False
+
+
+def parse_count(option: str, value: Optional[str], default: int, minimum: int) -> int:
+    """Parse a count option, printing usage and exiting if it is invalid."""
+    try:
+        count = int(value) if value is not None else default
+    except ValueError:
+        count = minimum - 1
+    if count < minimum:
+        print(f"Error: {option} must be an integer of at least {minimum}, got {value!r}")
+        print()
+        print_usage()
+        sys.exit(1)
+    return count
+
+
+def parse_jobs(value: Optional[str]) -> int:
+    """Parse --jobs: a positive count, or 0 for one per CPU."""
+    jobs = parse_count('--jobs', value, 1, 0)
+    return jobs or os.cpu_count() or 1
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['--help', '-h', 'help']:
+    args = sys.argv[1:]
+    jobs = parse_jobs(take_option(args, '--jobs'))
+    check_regressions = take_flag(args, '--check-regressions')
+    repeat = parse_count('--repeat', take_option(args, '--repeat'),
+                         DEFAULT_REPEAT if check_regressions else 1, 1)
+    if jobs > 1:
+        # Read by SolutionRunner: run each test's languages concurrently too
+        os.environ['TABLICA_TEST_JOBS'] = str(jobs)
+    
+    if args:
+        if args[0] in ['--help', '-h', 'help']:
             print_usage()
             sys.exit(0)
         
-        suite_name = sys.argv[1]
-        valid_suites = ['basic', 'edge_cases', 'performance', 'error_handling']
+        suite_name = args[0]
+        valid_suites = ['basic', 'edge_cases', 'performance', 'error_handling',
+                        'advanced', 'streaming', 'file_input',
+                        'byte_path', 'numpy_backend', 'compact_storage',
+                        'parallel', 'external', 'line_modes', 'server',
+                        'startup', 'output_writer', 'pipeline', 'benchmarks',
+                        'compile_cache', 'java_harness', 'run_tests', 'resources',
+                        'corpus', 'scaling', 'profile', 'batch', 'inprocess']
         
         if suite_name not in valid_suites:
             print(f"Error: Unknown test suite '{suite_name}'")
@@ -140,9 +642,24 @@ if __name__ == "__main__":
             print()
             print_usage()
             sys.exit(1)
-        
-        success = run_specific_suite(suite_name)
-    else:
-        success = run_all_tests()
+    
+    history_file = default_history_file()
+    history = load_history(history_file)
+    runs = []
+    success = True
+    for _ in range(repeat):
+        first_run = len(SolutionRunner.history())
+        if args:
+            success = run_specific_suite(args[0], jobs) and success
+        else:
+            success = run_all_tests(jobs) and success
+        runs.append(collect_timings(SolutionRunner.history()[first_run:]))
+    append_history(history_file, runs, jobs)
+    
+    if check_regressions:
+        regressions = find_regressions(history, runs, jobs)
+        print_regressions(regressions)
+        if regressions and success:
+            sys.exit(EXIT_REGRESSION)
     
     sys.exit(0 if success else 1)
@@ -2,8 +2,10 @@ import java.util.*;
 import java.util.stream.Collectors;
 import java.util.stream.Stream;
 import java.io.BufferedReader;
+import java.io.InputStream;
 import java.io.InputStreamReader;
 import java.io.IOException;
+import java.io.PrintStream;
 
 /**
  * SPOJ: TABLICA – Reverse array problem (Java 8+)
@@ -34,46 +36,63 @@ public final class Tablica {
      * @param args command line arguments (unused)
      */
     public static void main(String[] args) {
+        int status = run(System.in, System.out, System.err);
+        if (status != 0) {
+            System.exit(status);
+        }
+    }
+
+    /**
+     * Reverses the integers of one input, reporting errors instead of exiting.
+     *
+     * <p>Shared by {@link #main} and the warm test harness, which calls it
+     * many times in one JVM with in-memory streams.
+     *
+     * @param in  Input stream of whitespace-separated integers
+     * @param out Stream for the reversed integers
+     * @param err Stream for error messages
+     * @return Exit status: 0 on success, 1 on error
+     */
+    static int run(InputStream in, PrintStream out, PrintStream err) {
         try {
-            String input = readAllInput();
+            String input = readAllInput(in);
             
             if (input == null || input.trim().isEmpty()) {
-                return; // No data to process
+                return 0; // No data to process
             }
 
             List<Integer> numbers = parseIntegers(input.trim());
             
             if (numbers.isEmpty()) {
-                return; // Empty result after parsing
+                return 0; // Empty result after parsing
             }
 
             String output = reverseAndFormat(numbers);
-            System.out.println(output);
+            out.println(output);
+            return 0;
 
         } catch (NumberFormatException e) {
-            System.err.println("Error: Input must contain only integers.");
-            System.exit(1);
+            err.println("Error: Input must contain only integers.");
         } catch (OutOfMemoryError e) {
-            System.err.println("Error: Input too large to process.");
-            System.exit(1);
+            err.println("Error: Input too large to process.");
         } catch (IOException e) {
-            System.err.println("Error: Failed to read input.");
-            System.exit(1);
+            err.println("Error: Failed to read input.");
         } catch (Exception e) {
-            System.err.println("Error: Unexpected error - " + e.getClass().getSimpleName());
-            System.exit(1);
+            err.println("Error: Unexpected error - " + e.getClass().getSimpleName());
         }
+        return 1;
     }
 
     /**
-     * Reads all input from stdin using BufferedReader for efficiency.
+     * Reads all input from a stream using BufferedReader for efficiency.
      * 
+     * @param in Input stream
      * @return All input as a single string
      * @throws IOException if reading fails
      */
-    private static String readAllInput() throws IOException {
+    private static String readAllInput(InputStream in) throws IOException {
         StringBuilder sb = new StringBuilder();
-        try (BufferedReader reader = new BufferedReader(new InputStreamReader(System.in))) {
+        try (BufferedReader reader = new BufferedReader(new InputStreamReader(in))) {
             String line;
             while ((line = reader.readLine()) != null) {
                 sb.append(line).append(' ');
@@ -0,0 +1,72 @@
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.PrintStream;
+
+/**
+ * Warm execution harness for the TABLICA Java solution (test support).
+ *
+ * <p>Keeps one JVM alive and runs {@code Tablica.run} once per request, so
+ * the test runner pays JVM startup and JIT warm-up once instead of per case.
+ *
+ * <p>Protocol on stdin/stdout, all integers 4-byte big-endian:
+ * <ul>
+ *   <li>Request: length, then that many bytes of program input</li>
+ *   <li>Response: exit status, stdout length, stderr length, then the
+ *       stdout and stderr bytes</li>
+ * </ul>
+ * The harness exits when stdin is closed between requests.
+ */
+public final class TablicaHarness {
+
+    private TablicaHarness() {
+        // Prevent instantiation of utility class
+        throw new AssertionError("Utility class should not be instantiated");
+    }
+
+    /**
+     * Answers requests until stdin is closed.
+     *
+     * @param args command line arguments (unused)
+     * @throws IOException if the protocol streams fail
+     */
+    public static void main(String[] args) throws IOException {
+        DataInputStream requests = new DataInputStream(
+                new BufferedInputStream(new FileInputStream(FileDescriptor.in)));
+        DataOutputStream responses = new DataOutputStream(
+                new BufferedOutputStream(new FileOutputStream(FileDescriptor.out)));
+        // Stray prints must not corrupt the protocol stream
+        System.setOut(System.err);
+
+        while (true) {
+            int length;
+            try {
+                length = requests.readInt();
+            } catch (EOFException e) {
+                return; // Runner closed the pipe
+            }
+            byte[] input = new byte[length];
+            requests.readFully(input);
+
+            ByteArrayOutputStream out = new ByteArrayOutputStream();
+            ByteArrayOutputStream err = new ByteArrayOutputStream();
+            int status = Tablica.run(new ByteArrayInputStream(input),
+                    new PrintStream(out, true), new PrintStream(err, true));
+
+            responses.writeInt(status);
+            responses.writeInt(out.size());
+            responses.writeInt(err.size());
+            out.writeTo(responses);
+            err.writeTo(responses);
+            responses.flush();
+        }
+    }
+}
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+On-disk input corpus for TABLICA tests.
+
+Named datasets (DATASETS) are generated once from a seeded spec and
+stored in $TABLICA_CORPUS_DIR (default: corpus/ in the compile cache
+directory, see test_runner.default_cache_dir), together with the length
+and SHA-256 of the output every solution must print for them. Tests get
+a file path to feed to SolutionRunner (or an mmap of the file) instead of
+building input and expected strings, so the test process stays small even
+for 1e7+ integers.
+
+Files are named after the dataset and a hash of its spec, so editing a
+spec makes a new file rather than reusing a stale one. Generation works
+chunk by chunk and never holds a whole dataset in memory.
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import random
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from benchmarks.generators import CHUNK_COUNT, iter_chunks
+from tests.test_runner import default_cache_dir
+
+# Bumped when the file layout or the expected-output format changes
+CORPUS_VERSION = 1
+
+# kind 'range': integers start..stop-1 in order
+# kind 'random': count integers from random.Random(seed).randint(low, high)
+# kind 'profile': benchmarks.generators profile (count, seed)
+DATASETS: Dict[str, Dict] = {
+    'range_100': {'kind': 'range', 'start': 1, 'stop': 101},
+    'range_1000': {'kind': 'range', 'start': 1, 'stop': 1001},
+    'range_10000': {'kind': 'range', 'start': 1, 'stop': 10001},
+    'range_50000': {'kind': 'range', 'start': 0, 'stop': 50000},
+    'random_100': {'kind': 'random', 'count': 100, 'low': -1000000, 'high': 1000000, 'seed': 42},
+    'int32_1e6': {'kind': 'profile', 'profile': 'int32', 'count': 10**6, 'seed': 42},
+    'int32_1e7': {'kind': 'profile', 'profile': 'int32', 'count': 10**7, 'seed': 42},
+}
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """A generated dataset: input file plus the expected output's digest."""
+
+    name: str
+    path: str
+    count: int
+    input_bytes: int
+    expected_bytes: int
+    expected_sha256: str
+
+    @contextlib.contextmanager
+    def mapped(self) -> Iterator[mmap.mmap]:
+        """Map the input file read-only for the duration of the block."""
+        with open(self.path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+
+
+def default_corpus_dir() -> str:
+    """Return $TABLICA_CORPUS_DIR, or corpus/ in the compile cache directory."""
+    return os.environ.get('TABLICA_CORPUS_DIR') or os.path.join(default_cache_dir(), 'corpus')
+
+
+def spec_key(spec: Dict) -> str:
+    """Hash a dataset spec and the corpus version (16 hex characters)."""
+    text = json.dumps({'version': CORPUS_VERSION, 'spec': spec}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def iter_tokens(spec: Dict) -> Iterator[List[bytes]]:
+    """
+    Generate a dataset's integers, a chunk at a time.
+
+    Args:
+        spec: Entry of DATASETS
+
+    Yields:
+        Lists of encoded integers, in input order
+
+    Raises:
+        ValueError: If the spec's kind is unknown
+    """
+    kind = spec['kind']
+    if kind == 'range':
+        for start in range(spec['start'], spec['stop'], CHUNK_COUNT):
+            stop = min(start + CHUNK_COUNT, spec['stop'])
+            yield [str(value).encode() for value in range(start, stop)]
+    elif kind == 'random':
+        rng = random.Random(spec['seed'])
+        for start in range(0, spec['count'], CHUNK_COUNT):
+            count = min(CHUNK_COUNT, spec['count'] - start)
+            yield [str(rng.randint(spec['low'], spec['high'])).encode() for _ in range(count)]
+    elif kind == 'profile':
+        for chunk in iter_chunks(spec['count'], spec['profile'], spec['seed']):
+            yield chunk.split()
+    else:
+        raise ValueError(f"Unknown dataset kind: {kind!r}")
+
+
+def generate(spec: Dict, input_path: str, scratch_dir: str) -> Dict:
+    """
+    Write a dataset's input file and compute its expected output.
+
+    The expected output is the integers in reverse order, separated by
+    spaces, with a trailing newline. Each chunk's reversed text goes to a
+    scratch file; hashing the chunks back to front gives the digest
+    without holding the dataset in memory.
+
+    Args:
+        spec: Entry of DATASETS
+        input_path: Input file to write
+        scratch_dir: Directory for the scratch file
+
+    Returns:
+        Metadata with count, input_bytes, expected_bytes and expected_sha256
+    """
+    count = input_bytes = 0
+    segments = []  # (offset, length) of each chunk's reversed text
+    with open(input_path, 'wb') as infile, \
+            tempfile.TemporaryFile(dir=scratch_dir) as scratch:
+        for tokens in iter_tokens(spec):
+            if not tokens:
+                continue
+            text = b' '.join(tokens) + b' '
+            infile.write(text)
+            input_bytes += len(text)
+            count += len(tokens)
+            reversed_text = b' '.join(reversed(tokens))
+            segments.append((scratch.tell(), len(reversed_text)))
+            scratch.write(reversed_text)
+
+        digest = hashlib.sha256()
+        expected_bytes = 0
+        for index, (offset, length) in enumerate(reversed(segments)):
+            if index:
+                digest.update(b' ')
+                expected_bytes += 1
+            scratch.seek(offset)
+            digest.update(scratch.read(length))
+            expected_bytes += length
+        digest.update(b'\n')
+        expected_bytes += 1
+
+    return {'count': count, 'input_bytes': input_bytes,
+            'expected_bytes': expected_bytes, 'expected_sha256': digest.hexdigest()}
+
+
+def load(name: str, corpus_dir: Optional[str] = None) -> Dataset:
+    """
+    Return a dataset, generating it first if it is not on disk.
+
+    Args:
+        name: Key of DATASETS
+        corpus_dir: Corpus directory (default: default_corpus_dir())
+
+    Returns:
+        Dataset
+
+    Raises:
+        KeyError: If the dataset is unknown
+    """
+    return load_spec(name, DATASETS[name], corpus_dir)
+
+
+def load_spec(name: str, spec: Dict, corpus_dir: Optional[str] = None) -> Dataset:
+    """
+    Return a dataset that is not in DATASETS, e.g. one size of a series.
+
+    Args:
+        name: Dataset name, used in the file name
+        spec: Spec in the format of DATASETS
+        corpus_dir: Corpus directory (default: default_corpus_dir())
+
+    Returns:
+        Dataset
+    """
+    corpus_dir = corpus_dir or default_corpus_dir()
+    base = os.path.join(corpus_dir, f"{name}-{spec_key(spec)}")
+    input_path, meta_path = base + '.in', base + '.json'
+
+    with _locks_lock:
+        lock = _locks.setdefault(base, threading.Lock())
+    with lock:
+        meta = _read_meta(meta_path, input_path)
+        if meta is None:
+            os.makedirs(corpus_dir, exist_ok=True)
+            # Generate under temporary names, then rename, so other
+            # processes never see a partial file
+            fd, tmp_input = tempfile.mkstemp(prefix='tablica_', dir=corpus_dir)
+            os.close(fd)
+            try:
+                meta = generate(spec, tmp_input, corpus_dir)
+                meta['spec'] = spec
+                fd, tmp_meta = tempfile.mkstemp(prefix='tablica_', dir=corpus_dir)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(meta, f, indent=2, sort_keys=True)
+                os.rename(tmp_input, input_path)
+                os.rename(tmp_meta, meta_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_input)
+                raise
+
+    return Dataset(name, input_path, meta['count'], meta['input_bytes'],
+                   meta['expected_bytes'], meta['expected_sha256'])
+
+
+def _read_meta(meta_path: str, input_path: str) -> Optional[Dict]:
+    """Return a stored dataset's metadata, or None if missing or incomplete."""
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if os.path.getsize(input_path) != meta['input_bytes']:
+            return None
+    except (OSError, ValueError, KeyError):
+        return None
+    return meta
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Process spawner for SolutionRunner (test support).
+
+Linux carries a process's resident set into the programs it starts:
+every child of a large test process reports at least that process's
+RSS as its own peak. SolutionRunner therefore starts the solutions
+through this small helper, started once per test process, so their
+peak RSS starts from the spawner's (reported as rss_floor_kb) instead.
+
+Protocol on a SOCK_SEQPACKET Unix socket (file descriptor in argv[1]),
+one JSON object per message:
+
+    request: {"id", "command"}, with stdin, stdout and stderr file
+             descriptors attached
+    replies: {"id", "pid"} once started, or {"id", "error", "errno",
+             "filename"} if it could not start; then {"id", "status",
+             "wall_s", "user_s", "sys_s", "max_rss_kb", "rss_floor_kb"}
+             when it exited
+
+The spawner exits when the socket is closed.
+"""
+
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+# Largest request message in bytes
+MAX_MESSAGE = 1 << 16
+
+
+def rss_floor_kb() -> int:
+    """
+    Peak RSS the spawner passes on to its children, in KiB.
+
+    That is the high-water mark of its own memory (VmHWM): its
+    RUSAGE_SELF figure also holds what it inherited from the test process.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def send(sock: socket.socket, message: dict) -> None:
+    """Send one JSON message."""
+    sock.send(json.dumps(message).encode())
+
+
+def run(sock: socket.socket, request: dict, fds) -> None:
+    """
+    Start one command on the given descriptors and report its usage.
+
+    Args:
+        sock: Socket to the test process
+        request: Decoded request
+        fds: stdin, stdout and stderr descriptors (closed here)
+    """
+    request_id = request['id']
+    start = time.perf_counter()
+    try:
+        process = subprocess.Popen(request['command'], stdin=fds[0], stdout=fds[1],
+                                   stderr=fds[2])
+    except OSError as e:
+        send(sock, {'id': request_id, 'error': e.strerror or str(e), 'errno': e.errno,
+                    'filename': e.filename})
+        return
+    finally:
+        for fd in fds:
+            os.close(fd)
+    send(sock, {'id': request_id, 'pid': process.pid})
+
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    send(sock, {
+        'id': request_id,
+        'status': process.returncode,
+        'wall_s': time.perf_counter() - start,
+        'user_s': usage.ru_utime,
+        'sys_s': usage.ru_stime,
+        'max_rss_kb': usage.ru_maxrss,
+        'rss_floor_kb': rss_floor_kb(),
+    })
+
+
+def main() -> None:
+    """Serve requests until the test process closes the socket."""
+    sock = socket.socket(fileno=int(sys.argv[1]))
+    while True:
+        message, fds, _, _ = socket.recv_fds(sock, MAX_MESSAGE, 3)
+        if not message:
+            return
+        threading.Thread(target=run, args=(sock, json.loads(message), fds), daemon=True).start()
+
+
+if __name__ == "__main__":
+    main()
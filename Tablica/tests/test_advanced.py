@@ -8,6 +8,7 @@ and extreme edge cases that production code should handle.
 
 import unittest
 import signal
+from tests import corpus
 from tests.test_runner import SolutionRunner
 
 
@@ -21,16 +22,17 @@ class TestAdvancedCases(unittest.TestCase):
 
     def test_very_long_line(self):
         """Test handling of very long input line (stress test)."""
-        # Create a line with 50,000 numbers
-        numbers = list(range(50000))
-        input_data = " ".join(map(str, numbers))
-        expected = " ".join(map(str, reversed(numbers)))
+        # A line with 50,000 numbers
+        dataset = corpus.load('range_50000')
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], timeout=30,
+                                                      input_path=dataset.path,
+                                                      keep_stdout=False):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data, timeout=30)
-                self.assertEqual(code, 0, f"{lang}: Non-zero exit code for very long line")
-                self.assertEqual(stdout, expected, f"{lang}: Failed very long line")
+                result = result()
+                self.assertEqual(result.returncode, 0, f"{lang}: Non-zero exit code for very long line")
+                self.assertEqual(result.stdout_sha256, dataset.expected_sha256,
+                                 f"{lang}: Failed very long line")
 
     def test_maximum_integer_values(self):
         """Test with maximum 32-bit integer values."""
@@ -38,9 +40,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "2147483647 -2147483648 0"
         expected = "0 -2147483648 2147483647"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed max integer values")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -49,9 +51,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "-100 -50 -25 -10 -5 -1"
         expected = "-1 -5 -10 -25 -50 -100"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed all negative")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -60,9 +62,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "1 2 3 1 2 3 1 2 3"
         expected = "3 2 1 3 2 1 3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed repeating pattern")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -72,9 +74,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = " ".join(map(str, fib))
         expected = " ".join(map(str, reversed(fib)))
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed Fibonacci sequence")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -84,9 +86,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = " ".join(map(str, powers))
         expected = " ".join(map(str, reversed(powers)))
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed powers of two")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -96,9 +98,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = " ".join(map(str, primes))
         expected = " ".join(map(str, reversed(primes)))
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed prime numbers")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -107,9 +109,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "1000000 500000 250000 125000 62500 31250"
         expected = "31250 62500 125000 250000 500000 1000000"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed sparse range")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -118,9 +120,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "1000000000 1000 1 0 -1 -1000 -1000000000"
         expected = "-1000000000 -1000 -1 0 1 1000 1000000000"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed mixed magnitude")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -129,9 +131,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "1\n2\n3\n4\n5"
         expected = "5 4 3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed newline separated")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -140,9 +142,9 @@ class TestAdvancedCases(unittest.TestCase):
         input_data = "1\t2  3\n4    5\t\t6"
         expected = "6 5 4 3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed mixed separators")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -22,9 +22,9 @@ class TestBasicFunctionality(unittest.TestCase):
         input_data = "1 2 3"
         expected = "3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed simple reverse")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -33,9 +33,9 @@ class TestBasicFunctionality(unittest.TestCase):
         input_data = "42"
         expected = "42"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed single element")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -44,9 +44,9 @@ class TestBasicFunctionality(unittest.TestCase):
         input_data = "10 20"
         expected = "20 10"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed two elements")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -55,9 +55,9 @@ class TestBasicFunctionality(unittest.TestCase):
         input_data = "5 4 3 2 1"
         expected = "1 2 3 4 5"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed already reversed")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -66,9 +66,9 @@ class TestBasicFunctionality(unittest.TestCase):
         input_data = "7 7 7 7"
         expected = "7 7 7 7"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed identical elements")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
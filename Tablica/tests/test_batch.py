@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Batch mode tests for TABLICA Python solution.
+
+Tests that --batch and --manifest reverse every input into its own
+output file with process and thread pools, report failed files like
+handle_error() without stopping the others, and refuse options and
+output paths that do not fit a batch.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from tests.test_runner import SolutionRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+class TestBatchMode(unittest.TestCase):
+    """Test reversing many files in one run of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def setUp(self):
+        """Give each test an empty directory."""
+        self.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+
+    def tearDown(self):
+        """Remove the directory."""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_inputs(self, contents):
+        """Write one input file per string and return their paths."""
+        paths = []
+        for index, text in enumerate(contents):
+            path = os.path.join(self.tmp_dir, f"input{index}.txt")
+            with open(path, 'w') as f:
+                f.write(text)
+            paths.append(path)
+        return paths
+
+    def read_output(self, path: str) -> str:
+        """Read the output written for an input path."""
+        with open(tablica.batch_output_path(path)) as f:
+            return f.read()
+
+    def test_process_and_thread_pools(self):
+        """Test every input gets its reversed output with either pool."""
+        contents = [" ".join(map(str, range(i, i + 50))) for i in range(40)]
+        paths = self.write_inputs(contents)
+        for pool in tablica.POOLS:
+            with self.subTest(pool=pool):
+                stdout, stderr, code = self.runner.run(
+                    'python', args=['--batch'] + paths + ['--jobs', '3', '--pool', pool])
+                self.assertEqual((stdout, stderr, code), ("", "", 0))
+                for path, text in zip(paths, contents):
+                    expected = " ".join(reversed(text.split())) + "\n"
+                    self.assertEqual(self.read_output(path), expected)
+
+    def test_same_output_as_single_runs(self):
+        """Test normalised, non-ASCII, whitespace-only and empty inputs match stdout runs."""
+        contents = ["+1 007 -0 5", "1 +2 ٣", " \n\t ", "", "42\n"]
+        paths = self.write_inputs(contents)
+        _, stderr, code = self.runner.run('python', args=['--batch'] + paths)
+        self.assertEqual((stderr, code), ("", 0))
+        for path, text in zip(paths, contents):
+            stdout, _, _ = self.runner.run('python', text)
+            self.assertEqual(self.read_output(path), stdout + "\n" if stdout else "")
+
+    def test_manifest_and_output_dir(self):
+        """Test paths from a manifest on stdin, written to an output directory."""
+        paths = self.write_inputs(["1 2", "3 4 5"])
+        manifest = "# inputs\n\n" + "\n".join(paths) + "\n"
+        output_dir = os.path.join(self.tmp_dir, 'out')
+        _, stderr, code = self.runner.run(
+            'python', manifest, args=['--manifest', '-', '--output-dir', output_dir])
+        self.assertEqual((stderr, code), ("", 0))
+        self.assertEqual(sorted(os.listdir(output_dir)), ["input0.txt.out", "input1.txt.out"])
+        with open(os.path.join(output_dir, "input1.txt.out")) as f:
+            self.assertEqual(f.read(), "5 4 3\n")
+
+    def test_failed_files_reported(self):
+        """Test failures are reported per file and the other files still finish."""
+        good, bad = self.write_inputs(["1 2 3", "1 x 3"])
+        missing = os.path.join(self.tmp_dir, 'missing.txt')
+        stdout, stderr, code = self.runner.run(
+            'python', args=['--batch', good, bad, missing, '--jobs', '2'])
+        self.assertEqual((stdout, code), ("", 1))
+        self.assertEqual(stderr.splitlines(), [
+            f"Error: {bad}: Input must contain only integers",
+            f"Error: {missing}: Cannot open: No such file or directory",
+        ])
+        self.assertEqual(self.read_output(good), "3 2 1\n")
+        self.assertFalse(os.path.exists(tablica.batch_output_path(bad)))
+
+    def test_stale_output_replaced_or_removed(self):
+        """Test an old output is replaced, or removed if its input now fails."""
+        good, bad = self.write_inputs(["1 2", "oops"])
+        for path in [good, bad]:
+            with open(tablica.batch_output_path(path), 'w') as f:
+                f.write("stale\n")
+        _, _, code = self.runner.run('python', args=['--batch', good, bad])
+        self.assertEqual(code, 1)
+        self.assertEqual(self.read_output(good), "2 1\n")
+        self.assertFalse(os.path.exists(tablica.batch_output_path(bad)))
+
+    def test_output_collisions_refused(self):
+        """Test an output path shared by two inputs, or equal to an input, is refused."""
+        first, = self.write_inputs(["1 2"])
+        other_dir = os.path.join(self.tmp_dir, 'other')
+        os.mkdir(other_dir)
+        second = os.path.join(other_dir, os.path.basename(first))
+        shutil.copy(first, second)
+        output_dir = os.path.join(self.tmp_dir, 'out')
+
+        _, stderr, code = self.runner.run(
+            'python', args=['--batch', first, second, '--output-dir', output_dir])
+        self.assertEqual(code, 1)
+        self.assertIn(f"Error: {second}: Output", stderr)
+        self.assertIn("already written for", stderr)
+
+        shutil.copy(first, first + tablica.BATCH_SUFFIX)
+        _, stderr, code = self.runner.run(
+            'python', args=['--batch', first, first + tablica.BATCH_SUFFIX])
+        self.assertEqual(code, 1)
+        self.assertIn("is also an input", stderr)
+        with open(first + tablica.BATCH_SUFFIX) as f:
+            self.assertEqual(f.read(), "1 2", "Python: Input overwritten")
+
+    def test_invalid_combinations(self):
+        """Test --batch without inputs, with a single-input option or a repeated input is an error."""
+        path, = self.write_inputs(["1"])
+        for args in [['--batch'], ['--batch', path, '--stream'], ['--batch', path, path],
+                     ['--batch', path, '--profile'], ['--batch', path, '--profile-dump', path],
+                     ['--batch', path, '--no-mmap'], ['--batch', path, '--chunk-size', '64']]:
+            with self.subTest(args=args):
+                _, stderr, code = self.runner.run('python', args=args)
+                self.assertEqual(code, 1)
+                self.assertTrue(stderr.startswith("Error:"), stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite tests.
+
+Tests the seeded input generators, a tiny end-to-end suite run and the
+report comparison used to detect regressions.
+"""
+
+import re
+import unittest
+
+from benchmarks import generators, suite
+
+
+class TestGenerators(unittest.TestCase):
+    """Test the seeded input generators."""
+
+    def test_deterministic(self):
+        """Test the same seed gives the same bytes and another seed does not."""
+        first = generators.generate_input(25000, 'int32', seed=1)
+        self.assertEqual(first, generators.generate_input(25000, 'int32', seed=1))
+        self.assertNotEqual(first, generators.generate_input(25000, 'int32', seed=2))
+
+    def test_count_across_chunks(self):
+        """Test the integer count is exact when it spans several chunks."""
+        count = generators.CHUNK_COUNT * 2 + 7
+        self.assertEqual(len(generators.generate_input(count, 'small').split()), count)
+
+    def test_profiles_respected(self):
+        """Test digit widths, int32 range, negative share and separators."""
+        for name, profile in generators.PROFILES.items():
+            with self.subTest(profile=name):
+                data = generators.generate_input(20000, name).decode()
+                values = [int(token) for token in data.split()]
+                fewest, most = profile['digits']
+                widths = {len(str(abs(value))) for value in values}
+                self.assertGreaterEqual(min(widths), fewest)
+                self.assertLessEqual(max(widths), most)
+                self.assertLessEqual(max(map(abs, values)), generators.INT32_MAX)
+
+                negative = sum(value < 0 for value in values) / len(values)
+                self.assertAlmostEqual(negative, profile['negative_ratio'], delta=0.05)
+
+                allowed = set(''.join(generators.SEPARATORS[profile['separators']]))
+                self.assertLessEqual(set(re.sub(r'[-0-9]', '', data)), allowed)
+
+
+class TestSuite(unittest.TestCase):
+    """Test running and comparing benchmark reports."""
+
+    def test_run_suite(self):
+        """Test a tiny run records timing, throughput and peak RSS."""
+        report = suite.run_suite(['python'], ['int32'], [500], repeat=2, log=None)
+        self.assertEqual(report['meta']['schema'], suite.SCHEMA_VERSION)
+        self.assertEqual(len(report['results']), 1)
+
+        result = report['results'][0]
+        self.assertNotIn('error', result)
+        self.assertEqual((result['language'], result['size']), ('python', 500))
+        self.assertEqual(len(result['runs_s']), 2)
+        self.assertGreater(result['wall_s'], 0)
+        self.assertGreater(result['mb_per_s'], 0)
+        self.assertGreater(result['max_rss_kb'], 0)
+        # Measured from the runner's spawner, not from this process
+        self.assertLess(result['rss_floor_kb'], result['max_rss_kb'])
+
+    def test_failing_solution_recorded(self):
+        """Test a solution that rejects its arguments is recorded as an error."""
+        report = suite.run_suite(['python'], ['small'], [10], repeat=1,
+                                 args=['--jobs', '-1'], log=None)
+        self.assertIn('error', report['results'][0])
+
+    def test_compare_reports(self):
+        """Test slowdowns and RSS growth above the floor are regressions."""
+        def report(wall, rss):
+            return {'results': [{'language': 'cpp', 'profile': 'int32', 'size': 1000,
+                                 'args': [], 'wall_s': wall, 'max_rss_kb': rss,
+                                 'rss_floor_kb': 1000}]}
+
+        cases = [
+            (report(1.0, 5000), report(1.05, 5000), False),
+            (report(1.0, 5000), report(1.5, 5000), True),
+            (report(1.0, 5000), report(1.0, 8000), True),
+            # Both at the inherited floor: RSS is not comparable
+            (report(1.0, 500), report(1.0, 900), False),
+        ]
+        for baseline, current, regressed in cases:
+            with self.subTest(current=current['results'][0]):
+                comparisons = suite.compare_reports(baseline, current, threshold=0.1)
+                self.assertEqual(len(comparisons), 1)
+                self.assertEqual(comparisons[0]['regression'], regressed)
+
+    def test_parse_size(self):
+        """Test sizes in scientific notation."""
+        self.assertEqual(suite.parse_size('1e6'), 1000000)
+        self.assertEqual(suite.parse_size('2500'), 2500)
+
+
+if __name__ == '__main__':
+    unittest.main()
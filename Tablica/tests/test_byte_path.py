@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Byte-level fast path tests for TABLICA Python solution.
+
+Tests that validated byte tokens are emitted verbatim and that tokens
+needing normalisation give the same output as the int() text path.
+"""
+
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestBytePath(unittest.TestCase):
+    """Test the default bytes path against the --text path."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def assertSameAsTextPath(self, input_data: str, expected: str):
+        """Check bytes path and text path agree on output and exit code."""
+        for args in [[], ['--text']]:
+            with self.subTest(args=args):
+                stdout, stderr, code = self.runner.run('python', input_data, args=args)
+                self.assertEqual(stdout, expected, f"Python {args}: Wrong output")
+                self.assertEqual(code, 0, f"Python {args}: Non-zero exit code")
+
+    def test_canonical_tokens(self):
+        """Test canonical tokens, including big integers, pass through."""
+        self.assertSameAsTextPath("0 -1 99999999999999999999 -7 10",
+                                  "10 -7 99999999999999999999 -1 0")
+
+    def test_leading_zeros_normalised(self):
+        """Test leading zeros are removed like int() does."""
+        self.assertSameAsTextPath("007 0 00 -010", "-10 0 0 7")
+
+    def test_negative_zero_normalised(self):
+        """Test negative zero is printed as 0."""
+        self.assertSameAsTextPath("-0 5", "5 0")
+
+    def test_underscore_separators(self):
+        """Test digit-group underscores accepted by int() are normalised."""
+        self.assertSameAsTextPath("1_000 2", "2 1000")
+
+    def test_normalisation_in_one_batch_of_many(self):
+        """Test one non-canonical token among many batches of canonical ones."""
+        numbers = list(range(20000))
+        tokens = list(map(str, numbers))
+        tokens[12345] = "+12345"
+        expected = " ".join(map(str, reversed(numbers)))
+        self.assertSameAsTextPath(" ".join(tokens), expected)
+
+    def test_unicode_digits_use_text_path(self):
+        """Test non-ASCII digits fall back to the text path."""
+        self.assertSameAsTextPath("1 ١٢ 3", "3 12 1")
+
+    def test_invalid_tokens(self):
+        """Test malformed signs are rejected with exit code 1."""
+        for input_data in ["1 - 2", "1 --2", "1 2-", "1 +", "1 2 0x10"]:
+            with self.subTest(input_data=input_data):
+                stdout, stderr, code = self.runner.run('python', input_data)
+                self.assertEqual(code, 1, "Python: Should return exit code 1")
+                self.assertIn("Error", stderr, "Python: Should output error message")
+                self.assertEqual(stdout, "", "Python: Should not print partial output")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Compact storage tests for TABLICA Python solution.
+
+Tests the packed int64 array storage (--compact), on its own and with
+the streaming reader, including the fallback to Python ints on overflow.
+"""
+
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestCompactStorage(unittest.TestCase):
+    """Test array('q')-backed integer storage of the Python solution."""
+
+    MODES = [['--compact'], ['--stream', '--compact']]
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def assertReversed(self, input_data: str, expected: str, extra_args=()):
+        """Check every compact mode reverses input_data to expected."""
+        for args in self.MODES:
+            with self.subTest(args=args):
+                stdout, stderr, code = self.runner.run(
+                    'python', input_data, timeout=30, args=args + list(extra_args))
+                self.assertEqual(stdout, expected, f"Python {args}: Wrong output")
+                self.assertEqual(code, 0, f"Python {args}: Non-zero exit code")
+
+    def test_simple_reverse(self):
+        """Test reversing a simple array."""
+        self.assertReversed("1 2 3", "3 2 1")
+
+    def test_int64_limits(self):
+        """Test values at the int64 limits stay packed and exact."""
+        self.assertReversed("9223372036854775807 -9223372036854775808 0",
+                            "0 -9223372036854775808 9223372036854775807")
+
+    def test_overflow_falls_back_to_ints(self):
+        """Test a value beyond int64 switches storage to Python ints."""
+        numbers = list(range(10000)) + [2**64] + list(range(-10, 0))
+        input_data = " ".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+        self.assertReversed(input_data, expected, ['--chunk-size', '512'])
+
+    def test_many_output_blocks(self):
+        """Test output assembled from many reversed slices."""
+        numbers = list(range(-25000, 25000))
+        input_data = "\n".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+        self.assertReversed(input_data, expected)
+
+    def test_plus_sign(self):
+        """Test explicit plus signs are normalised."""
+        self.assertReversed("+1 +2 +3", "3 2 1")
+
+    def test_empty_input(self):
+        """Test empty input produces no output."""
+        self.assertReversed("   \n ", "")
+
+    def test_invalid_input(self):
+        """Test invalid tokens are rejected with exit code 1."""
+        for args in self.MODES:
+            with self.subTest(args=args):
+                stdout, stderr, code = self.runner.run('python', "1 2 abc 4", args=args)
+                self.assertEqual(code, 1, f"Python {args}: Should return exit code 1")
+                self.assertIn("Error", stderr, f"Python {args}: Should output error message")
+
+
+if __name__ == '__main__':
+    unittest.main()
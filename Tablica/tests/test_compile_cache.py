@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Compile cache tests.
+
+Tests that SolutionRunner builds compiled solutions into a cache
+directory keyed by source, compiler and flags, reuses them across
+runners and reports compiler failures. Uses the C++ solution (skipped
+without g++).
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from tests import test_runner
+from tests.test_runner import SolutionRunner, build_key
+
+SOLUTIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'solutions')
+
+
+@unittest.skipUnless(shutil.which('g++'), "g++ not installed")
+class TestCompileCache(unittest.TestCase):
+    """Test the content-hash compile cache of SolutionRunner."""
+
+    # Patches subprocess.run and the build memo (run_tests.py --jobs runs it alone)
+    parallel_safe = False
+
+    def setUp(self):
+        """Give each test an empty cache and a private copy of the solutions."""
+        self.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.solutions_dir = os.path.join(self.tmp_dir, 'solutions')
+        shutil.copytree(SOLUTIONS_DIR, self.solutions_dir,
+                        ignore=shutil.ignore_patterns('__pycache__', 'tablica_exe', '*.class'))
+
+    def tearDown(self):
+        """Remove the cache and the copied solutions."""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def runner(self) -> SolutionRunner:
+        """Runner on the private solutions, C++ built on demand only."""
+        return SolutionRunner(self.solutions_dir, cache_dir=self.cache_dir, precompile=False)
+
+    def compiler_calls(self, calls) -> int:
+        """Count g++ invocations that produce an executable."""
+        return sum(1 for call in calls if '-o' in call.args[0])
+
+    def forget_builds(self):
+        """Drop this process's memo so the next build consults the disk."""
+        for key in list(SolutionRunner._builds):
+            if key[0] == self.cache_dir:
+                del SolutionRunner._builds[key]
+
+    def test_build_stored_in_cache(self):
+        """Test the executable lands in the cache, not next to the source."""
+        stdout, stderr, returncode = self.runner().run('cpp', "1 2 3")
+        self.assertEqual(returncode, 0, f"C++: {stderr}")
+        self.assertEqual(stdout.strip(), "3 2 1")
+
+        entries = os.listdir(self.cache_dir)
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0].startswith('cpp-'))
+        self.assertTrue(os.path.isfile(os.path.join(self.cache_dir, entries[0],
+                                                    test_runner.CPP_EXECUTABLE)))
+        self.assertFalse(os.path.exists(os.path.join(self.solutions_dir,
+                                                     test_runner.CPP_EXECUTABLE)))
+
+    def test_unchanged_source_not_recompiled(self):
+        """Test a new process (memo dropped) reuses the cached build."""
+        self.runner().precompile(['cpp'])
+        self.forget_builds()
+
+        run = subprocess.run
+        with mock.patch.object(test_runner.subprocess, 'run', side_effect=run) as calls:
+            runner = self.runner()
+            runner.precompile(['cpp'])
+            stdout, _, returncode = runner.run('cpp', "4 5")
+        self.assertEqual((stdout.strip(), returncode), ("5 4", 0))
+        self.assertEqual(self.compiler_calls(calls.call_args_list), 0)
+
+    def test_changed_source_recompiled(self):
+        """Test editing the source gives a new cache entry."""
+        self.runner().precompile(['cpp'])
+        self.forget_builds()
+        with open(os.path.join(self.solutions_dir, 'tablica.cpp'), 'a') as f:
+            f.write("\n// edited\n")
+
+        run = subprocess.run
+        with mock.patch.object(test_runner.subprocess, 'run', side_effect=run) as calls:
+            self.runner().precompile(['cpp'])
+        self.assertEqual(self.compiler_calls(calls.call_args_list), 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_key_covers_source_compiler_and_flags(self):
+        """Test every input of the key changes it."""
+        key = build_key(b"int main() {}", "g++ 12", ['g++', '-O2'])
+        self.assertEqual(key, build_key(b"int main() {}", "g++ 12", ['g++', '-O2']))
+        self.assertNotEqual(key, build_key(b"int main() { }", "g++ 12", ['g++', '-O2']))
+        self.assertNotEqual(key, build_key(b"int main() {}", "g++ 13", ['g++', '-O2']))
+        self.assertNotEqual(key, build_key(b"int main() {}", "g++ 12", ['g++', '-O3']))
+
+    def test_compilation_error(self):
+        """Test a broken source is reported by run() and command()."""
+        with open(os.path.join(self.solutions_dir, 'tablica.cpp'), 'w') as f:
+            f.write("int main( {\n")
+
+        runner = self.runner()
+        runner.precompile(['cpp'])
+        stdout, stderr, returncode = runner.run('cpp', "1 2 3")
+        self.assertEqual(stdout, "")
+        self.assertIn("Compilation error", stderr)
+        self.assertNotEqual(returncode, 0)
+        with self.assertRaises(RuntimeError):
+            runner.command('cpp')
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
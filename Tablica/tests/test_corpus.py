@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Input corpus tests.
+
+Tests that tests/corpus.py generates each dataset once, stores the
+digest of the expected output alongside, regenerates incomplete or
+outdated files and feeds datasets to SolutionRunner as files.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from tests import corpus
+from tests.test_runner import SolutionRunner
+
+
+class TestCorpus(unittest.TestCase):
+    """Test dataset generation and caching."""
+
+    def setUp(self):
+        """Give each test an empty corpus directory."""
+        self.corpus_dir = tempfile.mkdtemp(prefix='tablica_')
+
+    def tearDown(self):
+        """Remove the corpus directory."""
+        shutil.rmtree(self.corpus_dir, ignore_errors=True)
+
+    def test_range_contents(self):
+        """Test a range dataset's input and expected digest."""
+        dataset = corpus.load('range_100', self.corpus_dir)
+        with open(dataset.path) as f:
+            self.assertEqual(f.read().split(), [str(i) for i in range(1, 101)])
+
+        expected = " ".join(str(i) for i in range(100, 0, -1)) + "\n"
+        self.assertEqual(dataset.count, 100)
+        self.assertEqual(dataset.expected_bytes, len(expected))
+        self.assertEqual(dataset.expected_sha256, hashlib.sha256(expected.encode()).hexdigest())
+
+    def test_digest_across_chunks(self):
+        """Test the expected digest of a dataset spanning several chunks."""
+        spec = {'kind': 'profile', 'profile': 'mixed_separators', 'count': 25000, 'seed': 7}
+        with mock.patch.dict(corpus.DATASETS, {'mixed': spec}):
+            dataset = corpus.load('mixed', self.corpus_dir)
+        with dataset.mapped() as data:
+            tokens = data[:].split()
+        expected = b" ".join(reversed(tokens)) + b"\n"
+        self.assertEqual(dataset.count, 25000)
+        self.assertEqual(dataset.input_bytes, os.path.getsize(dataset.path))
+        self.assertEqual(dataset.expected_sha256, hashlib.sha256(expected).hexdigest())
+
+    def test_generated_once(self):
+        """Test a second load reuses the stored files."""
+        first = corpus.load('range_1000', self.corpus_dir)
+        with mock.patch.object(corpus, 'generate') as generate:
+            second = corpus.load('range_1000', self.corpus_dir)
+        generate.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_truncated_input_regenerated(self):
+        """Test an input file that does not match its metadata is rebuilt."""
+        dataset = corpus.load('range_1000', self.corpus_dir)
+        with open(dataset.path, 'r+b') as f:
+            f.truncate(10)
+        self.assertEqual(corpus.load('range_1000', self.corpus_dir), dataset)
+        self.assertEqual(os.path.getsize(dataset.path), dataset.input_bytes)
+
+    def test_changed_spec_new_file(self):
+        """Test editing a spec gives a new file instead of the stale one."""
+        old = corpus.load('range_100', self.corpus_dir)
+        with mock.patch.dict(corpus.DATASETS, {'range_100': {'kind': 'range', 'start': 1,
+                                                             'stop': 51}}):
+            new = corpus.load('range_100', self.corpus_dir)
+        self.assertNotEqual(old.path, new.path)
+        self.assertEqual(new.count, 50)
+
+    def test_unknown_dataset(self):
+        """Test an unknown name raises KeyError."""
+        with self.assertRaises(KeyError):
+            corpus.load('no_such_dataset', self.corpus_dir)
+
+
+class TestCorpusRuns(unittest.TestCase):
+    """Test feeding datasets to the solutions as files."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_input_path_matches_string(self):
+        """Test a file input gives the same result as the same string."""
+        dataset = corpus.load('random_100')
+        with open(dataset.path) as f:
+            input_data = f.read()
+        from_file = self.runner.run('python', input_path=dataset.path)
+        self.assertEqual(from_file, self.runner.run('python', input_data))
+        self.assertEqual(from_file.bytes_in, dataset.input_bytes)
+        self.assertEqual(from_file.stdout_sha256, dataset.expected_sha256)
+
+
+if __name__ == '__main__':
+    unittest.main()
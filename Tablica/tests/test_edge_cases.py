@@ -22,9 +22,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = ""
         expected = ""
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed empty input")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code for empty input")
 
@@ -33,9 +33,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "   \n  \t  "
         expected = ""
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed whitespace-only input")
 
     def test_zero_value(self):
@@ -43,9 +43,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "0"
         expected = "0"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed zero value")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -54,9 +54,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "0 0 0"
         expected = "0 0 0"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed multiple zeros")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -65,9 +65,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "-5 -3 -1"
         expected = "-1 -3 -5"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed negative numbers")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -76,9 +76,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "-10 5 -3 8 0"
         expected = "0 8 -3 5 -10"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed mixed pos/neg")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -87,9 +87,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "1    2     3"
         expected = "3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed extra spaces")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -98,9 +98,9 @@ class TestEdgeCases(unittest.TestCase):
         input_data = "   1 2 3   "
         expected = "3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed leading/trailing spaces")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+External-memory mode tests for TABLICA Python solution.
+
+Tests --external, which spills reversed runs to a temporary file and
+emits them last to first, using tiny memory limits to force many runs.
+"""
+
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestExternalMode(unittest.TestCase):
+    """Test external-memory reversal of the Python solution."""
+
+    SMALL_RUNS = ['--external', '--memory-limit', '100', '--chunk-size', '7']
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_many_runs(self):
+        """Test input split into many spilled runs."""
+        numbers = list(range(-5000, 5000, 3))
+        input_data = " ".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+
+        stdout, stderr, code = self.runner.run('python', input_data, args=self.SMALL_RUNS)
+        self.assertEqual(stdout, expected, "Python: Failed external reversal")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_default_memory_limit(self):
+        """Test a 50,000 element input with the default memory limit."""
+        numbers = list(range(50000))
+        input_data = "\n".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+
+        stdout, stderr, code = self.runner.run(
+            'python', input_data, timeout=30, args=['--external'])
+        self.assertEqual(stdout, expected, "Python: Failed external reversal")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_token_longer_than_run(self):
+        """Test a single token longer than the run size."""
+        big = "9" * 500
+        stdout, stderr, code = self.runner.run(
+            'python', f"1 {big} -2", args=self.SMALL_RUNS)
+        self.assertEqual(stdout, f"-2 {big} 1", "Python: Failed long token")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_mixed_separators_and_normalisation(self):
+        """Test separators and tokens needing normalisation across runs."""
+        input_data = "+1\t007  -0\n" * 30
+        expected = " ".join(["0 7 1"] * 30)
+        stdout, stderr, code = self.runner.run('python', input_data, args=self.SMALL_RUNS)
+        self.assertEqual(stdout, expected, "Python: Failed normalisation")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_unicode_digits(self):
+        """Test runs with non-ASCII digits use the text path."""
+        stdout, stderr, code = self.runner.run('python', "1 ١٢ 3", args=self.SMALL_RUNS)
+        self.assertEqual(stdout, "3 12 1", "Python: Failed text path run")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_text_path_run_among_byte_runs(self):
+        """Test a run needing the text path is replaced, not appended to, in the spill file."""
+        numbers = list(range(300))
+        input_data = " ".join(map(str, numbers[:150])) + " +5 ١٢ " + " ".join(map(str, numbers[150:]))
+        expected = " ".join(map(str, reversed(numbers[150:]))) + " 12 5 " + \
+            " ".join(map(str, reversed(numbers[:150])))
+        stdout, stderr, code = self.runner.run('python', input_data, args=self.SMALL_RUNS)
+        self.assertEqual((stdout, stderr, code), (expected, "", 0))
+
+    def test_huge_token_linear(self):
+        """Test a token of many chunks is not rescanned from its start on every read."""
+        big = "7" * (1 << 23)
+        stdout, stderr, code = self.runner.run(
+            'python', f"1 {big} 2", args=['--external', '--memory-limit', '1K',
+                                          '--chunk-size', '64'])
+        self.assertEqual((stdout, code), (f"2 {big} 1", 0))
+
+    def test_empty_input(self):
+        """Test empty input produces no output."""
+        stdout, stderr, code = self.runner.run('python', "  \n ", args=['--external'])
+        self.assertEqual(stdout, "", "Python: Expected no output")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_invalid_token_in_last_run(self):
+        """Test an invalid token in a late run fails with no output."""
+        input_data = " ".join(map(str, range(2000))) + " abc"
+        stdout, stderr, code = self.runner.run('python', input_data, args=self.SMALL_RUNS)
+        self.assertEqual(code, 1, "Python: Should return exit code 1")
+        self.assertIn("Error", stderr, "Python: Should output error message")
+        self.assertEqual(stdout, "", "Python: Should not print partial output")
+
+    def test_memory_limit_suffixes(self):
+        """Test K/M/G suffixes and rejection of invalid sizes."""
+        for size in ['64K', '16m', '1G']:
+            with self.subTest(size=size):
+                stdout, stderr, code = self.runner.run(
+                    'python', "1 2 3", args=['--external', '--memory-limit', size])
+                self.assertEqual(stdout, "3 2 1", f"Python: Failed limit {size}")
+        for size in ['0', '-5M', 'lots']:
+            with self.subTest(size=size):
+                stdout, stderr, code = self.runner.run(
+                    'python', "1 2 3", args=['--external', '--memory-limit', size])
+                self.assertNotEqual(code, 0, f"Python: Should reject limit {size}")
+
+    def test_ignored_options_rejected(self):
+        """Test options a single run would ignore are rejected like under --batch."""
+        cases = [
+            (['--external', '--per-line'], "--per-line cannot be combined with --external"),
+            (['--reverse-lines', '--external'],
+             "--reverse-lines cannot be combined with --external"),
+            (['--compact', '--external'], "--external cannot be combined with --compact"),
+            (['--external', '--text'], "--external cannot be combined with --text"),
+            (['--per-line', '--memory-limit', '1K'],
+             "--per-line cannot be combined with --memory-limit"),
+            (['--memory-limit', '1000'], "--memory-limit needs --external"),
+            (['--stream', '--memory-limit', '1000'], "--memory-limit needs --external"),
+        ]
+        for args, message in cases:
+            with self.subTest(args=args):
+                stdout, stderr, code = self.runner.run('python', "1 2 3", args=args)
+                self.assertEqual((stdout, stderr, code), ("", f"Error: {message}", 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
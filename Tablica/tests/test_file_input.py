@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+File input tests for TABLICA Python solution.
+
+Tests the memory-mapped backward scan used when the input is a regular
+file, given either as a path argument or redirected to stdin.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestFileInput(unittest.TestCase):
+    """Test memory-mapped file input of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner and a scratch directory for input files."""
+        cls.runner = SolutionRunner()
+        cls.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory."""
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def write_input(self, name: str, data: bytes) -> str:
+        """Write input bytes to a scratch file and return its path."""
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def run_file(self, path: str, *args: str):
+        """Run the Python solution on a file path argument."""
+        return self.runner.run('python', "", args=list(args) + [path])
+
+    def test_path_argument(self):
+        """Test reversing a file given as a path argument."""
+        path = self.write_input('simple.txt', b"1 2 3\n")
+        stdout, stderr, code = self.run_file(path)
+        self.assertEqual(stdout, "3 2 1", "Python: Failed file reverse")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_stdin_redirected_from_file(self):
+        """Test that stdin redirected from a regular file is handled."""
+        path = self.write_input('stdin.txt', b"-10 5 -3 8 0")
+        with open(path, 'rb') as f:
+            result = subprocess.run([sys.executable, self.runner.solutions['python']],
+                                    stdin=f, capture_output=True, timeout=10)
+        self.assertEqual(result.stdout.decode().strip(), "0 8 -3 5 -10")
+        self.assertEqual(result.returncode, 0, "Python: Non-zero exit code")
+
+    def test_windows_match_default_path(self):
+        """Test small scan windows give the same output as the default path."""
+        numbers = [123456789, -42, 0, 7, -1000000, 31337] * 20
+        data = "\n".join(" ".join(map(str, numbers[i:i + 7])) for i in range(0, len(numbers), 7))
+        path = self.write_input('windows.txt', data.encode())
+        expected, _, _ = self.run_file(path, '--no-mmap')
+
+        for window in ['1', '2', '3', '7', '4096']:
+            with self.subTest(window=window):
+                stdout, stderr, code = self.run_file(path, '--chunk-size', window)
+                self.assertEqual(stdout, expected, f"Python: Failed window {window}")
+                self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_non_canonical_tokens_normalised(self):
+        """Test plus signs, leading zeros and negative zero are normalised."""
+        path = self.write_input('normalise.txt', b"+1 007 -0 -5\t1_0")
+        stdout, stderr, code = self.run_file(path)
+        self.assertEqual(stdout, "10 -5 0 7 1", "Python: Failed normalisation")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_unicode_digits_use_text_path(self):
+        """Test non-ASCII input is parsed exactly like the text path."""
+        path = self.write_input('unicode.txt', "1 ١٢ 3".encode('utf-8'))
+        expected, _, _ = self.run_file(path, '--no-mmap')
+        stdout, stderr, code = self.run_file(path)
+        self.assertEqual(stdout, expected, "Python: Mapped and text paths differ")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_invalid_file_input(self):
+        """Test invalid tokens fail before any output is written."""
+        path = self.write_input('invalid.txt', b"1 2 abc 4")
+        stdout, stderr, code = self.run_file(path)
+        self.assertEqual(code, 1, "Python: Should return exit code 1 for invalid input")
+        self.assertIn("Error", stderr, "Python: Should output error message to stderr")
+        self.assertEqual(stdout, "", "Python: Should not print partial output")
+
+    def test_empty_file(self):
+        """Test that an empty file produces no output."""
+        path = self.write_input('empty.txt', b"")
+        stdout, stderr, code = self.run_file(path)
+        self.assertEqual(stdout, "", "Python: Expected no output")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_missing_file(self):
+        """Test that a missing input file is reported as an error."""
+        stdout, stderr, code = self.run_file(os.path.join(self.tmp_dir, 'missing.txt'))
+        self.assertEqual(code, 1, "Python: Should return exit code 1 for missing file")
+        self.assertIn("Error", stderr, "Python: Should output error message to stderr")
+
+
+if __name__ == '__main__':
+    unittest.main()
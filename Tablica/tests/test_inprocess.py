@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+In-process execution tests for TABLICA Python solution.
+
+Tests the library entry point reverse_stream() on in-memory and file
+streams, main() with explicit streams, and SolutionRunner's inprocess
+Python mode, which must give the same stdout, stderr and exit status as
+a new interpreter per run.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from tests.test_runner import PYTHON_MODES, SolutionRunner, exit_status
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+def reverse_bytes(data: bytes, args=()) -> bytes:
+    """Run reverse_stream() on data with options parsed from args."""
+    out = io.BytesIO()
+    tablica.reverse_stream(io.BytesIO(data), out, tablica.parse_args(list(args)))
+    return out.getvalue()
+
+
+class TestReverseStream(unittest.TestCase):
+    """Test the reverse_stream() library API."""
+
+    def test_default_options(self):
+        """Test options default to those of a run without arguments."""
+        out = io.BytesIO()
+        tablica.reverse_stream(io.BytesIO(b"1 -2 +3\n"), out)
+        self.assertEqual(out.getvalue(), b"3 -2 1\n")
+
+    def test_modes_agree(self):
+        """Test every whole-input mode gives the same bytes."""
+        data = " ".join(map(str, range(-500, 500))).encode()
+        expected = reverse_bytes(data)
+        for args in [['--text'], ['--compact'], ['--stream', '--chunk-size', '64'],
+                     ['--pipeline'], ['--external', '--memory-limit', '1K'],
+                     ['--jobs', '3'], ['--backend', 'python']]:
+            with self.subTest(args=args):
+                self.assertEqual(reverse_bytes(data, args), expected)
+
+    def test_line_modes(self):
+        """Test --per-line and --reverse-lines write to the given stream."""
+        self.assertEqual(reverse_bytes(b"1 2\n3 4\n", ['--per-line']), b"2 1\n4 3\n")
+        self.assertEqual(reverse_bytes(b"1 2\n3 4\n", ['--reverse-lines']), b"3 4\n1 2\n")
+
+    def test_empty_input(self):
+        """Test empty and whitespace-only input write nothing."""
+        for data in [b"", b" \n\t "]:
+            with self.subTest(data=data):
+                self.assertEqual(reverse_bytes(data), b"")
+
+    def test_invalid_input_raises(self):
+        """Test invalid input raises ValueError instead of exiting, writing nothing."""
+        for args in [[], ['--text'], ['--stream']]:
+            with self.subTest(args=args):
+                out = io.BytesIO()
+                with self.assertRaises(ValueError):
+                    tablica.reverse_stream(io.BytesIO(b"1 x 3"), out, tablica.parse_args(args))
+                self.assertEqual(out.getvalue(), b"")
+
+    def test_pipeline_reader_stopped(self):
+        """Test --pipeline leaves no reader thread behind, even after invalid input."""
+        tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        invalid, valid = os.path.join(tmp_dir, 'invalid.txt'), os.path.join(tmp_dir, 'valid.txt')
+        with open(invalid, 'wb') as f:
+            f.write(b"1 x " + b"7 " * 500000)
+        numbers = list(range(300000))
+        with open(valid, 'wb') as f:
+            f.write(" ".join(map(str, numbers)).encode())
+
+        threads = threading.active_count()
+        for args in [['--pipeline', '--chunk-size', '64'],
+                     ['--external', '--pipeline', '--chunk-size', '64']]:
+            with self.subTest(args=args):
+                with open(invalid, 'rb') as infile, self.assertRaises(ValueError):
+                    tablica.reverse_stream(infile, io.BytesIO(), tablica.parse_args(args))
+                out = io.BytesIO()
+                with open(valid, 'rb') as infile:
+                    tablica.reverse_stream(infile, out, tablica.parse_args(args))
+                self.assertEqual(out.getvalue(),
+                                 " ".join(map(str, reversed(numbers))).encode() + b"\n")
+                self.assertEqual(threading.active_count(), threads)
+
+    def test_regular_file(self):
+        """Test a file opened by the caller is mapped and reversed."""
+        tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        path = os.path.join(tmp_dir, 'input.txt')
+        with open(path, 'wb') as f:
+            f.write(b"10 20 30\n")
+        out = io.BytesIO()
+        with open(path, 'rb') as infile:
+            tablica.reverse_stream(infile, out)
+        self.assertEqual(out.getvalue(), b"30 20 10\n")
+
+    def test_main_with_streams(self):
+        """Test main() reads and writes explicit streams and exits on errors."""
+        out = io.BytesIO()
+        tablica.main([], io.BytesIO(b"4 5 6"), out)
+        self.assertEqual(out.getvalue(), b"6 5 4\n")
+
+        stderr = io.StringIO()
+        with self.assertRaises(SystemExit) as raised, contextlib.redirect_stderr(stderr):
+            tablica.main(['--text'], io.BytesIO(b"4 x"), io.BytesIO())
+        self.assertEqual(raised.exception.code, 1)
+        self.assertEqual(stderr.getvalue(), "Error: Input must contain only integers\n")
+
+    def test_main_closed_stream(self):
+        """Test a caller's stream raising BrokenPipeError exits 141 and leaves stdout alone."""
+        class ClosedStream(io.BytesIO):
+            def write(self, data):
+                raise BrokenPipeError
+
+        stdout_stat = os.fstat(sys.__stdout__.fileno())
+        with self.assertRaises(SystemExit) as raised, \
+                contextlib.redirect_stdout(io.StringIO()):
+            tablica.main([], io.BytesIO(b"1 2 3"), ClosedStream())
+        self.assertEqual(raised.exception.code, 141)
+        after = os.fstat(sys.__stdout__.fileno())
+        self.assertEqual((after.st_dev, after.st_ino), (stdout_stat.st_dev, stdout_stat.st_ino))
+
+
+class TestInProcessRunner(unittest.TestCase):
+    """Test the inprocess Python mode of SolutionRunner."""
+
+    # Swaps sys.stderr and sys.argv during runs (run_tests.py --jobs runs it alone)
+    parallel_safe = False
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a runner per Python mode."""
+        cls.runners = {mode: SolutionRunner(precompile=False, python_mode=mode)
+                       for mode in PYTHON_MODES}
+        cls.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory."""
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def test_same_as_subprocess(self):
+        """Test output, errors and exit status match a new interpreter per run."""
+        cases = [
+            ("1 2 3", []),
+            ("", []),
+            ("1 x 3", []),
+            ("1 x 3", ['--text']),
+            ("1 2\n3 4\n", ['--per-line']),
+            ("5 6", ['--jobs', '-1']),
+            ("5 6", ['--bogus']),
+            ("7 8 9", ['--jobs', '2']),
+        ]
+        for input_data, args in cases:
+            with self.subTest(input=input_data, args=args):
+                expected = self.runners['subprocess'].run('python', input_data, args=args)
+                result = self.runners['inprocess'].run('python', input_data, args=args)
+                self.assertEqual(tuple(result), tuple(expected))
+                self.assertEqual(result.bytes_in, expected.bytes_in)
+
+    def test_input_path_and_digest(self):
+        """Test a file input and a hashed-only output are handled like a subprocess run."""
+        path = os.path.join(self.tmp_dir, 'input.txt')
+        with open(path, 'w') as f:
+            f.write(" ".join(map(str, range(10000))))
+        runs = [runner.run('python', input_path=path, keep_stdout=False)
+                for runner in self.runners.values()]
+        self.assertEqual(runs[1].stdout, "")
+        self.assertEqual((runs[1].stdout_sha256, runs[1].bytes_out, runs[1].bytes_in),
+                         (runs[0].stdout_sha256, runs[0].bytes_out, runs[0].bytes_in))
+
+    def test_exit_status(self):
+        """Test SystemExit codes map to exit statuses like the interpreter's."""
+        self.assertEqual([exit_status(code) for code in [None, 0, 2, 141, "message"]],
+                         [0, 0, 2, 141, 1])
+
+    def test_unknown_mode(self):
+        """Test an unknown Python mode is refused."""
+        with self.assertRaises(ValueError):
+            SolutionRunner(precompile=False, python_mode='thread')
+
+
+if __name__ == '__main__':
+    unittest.main()
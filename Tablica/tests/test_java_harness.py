@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Java execution mode tests.
+
+Tests that the warm harness JVM (tests/TablicaHarness.java) and the
+AppCDS cold path give the same results as a fresh JVM per run, and that
+the harness serves many runs from one process. Skipped without a JDK.
+"""
+
+import shutil
+import unittest
+from tests.test_runner import SolutionRunner
+
+CASES = [
+    "1 2 3",
+    "",
+    "   \n  \t  ",
+    "-5 0 2147483647 -2147483648",
+    "1\n2\n3\n",
+    "+1 +2",
+    "1 a 3",
+    "1.5 2",
+]
+
+
+@unittest.skipUnless(shutil.which('java') and shutil.which('javac'), "JDK not installed")
+class TestJavaModes(unittest.TestCase):
+    """Test the warm and AppCDS Java execution modes."""
+
+    # Kills the shared harness JVM (run_tests.py --jobs runs it alone)
+    parallel_safe = False
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one runner per Java mode."""
+        cls.cold = SolutionRunner(java_mode='cold')
+        cls.warm = SolutionRunner(java_mode='warm')
+        cls.cds = SolutionRunner(java_mode='cds')
+
+    def test_warm_matches_cold(self):
+        """Test the harness gives the same output, errors and exit codes."""
+        for input_data in CASES:
+            with self.subTest(input=input_data):
+                self.assertEqual(self.warm.run('java', input_data),
+                                 self.cold.run('java', input_data))
+
+    def test_cds_matches_cold(self):
+        """Test runs started from the AppCDS archive give the same results."""
+        for input_data in CASES:
+            with self.subTest(input=input_data):
+                self.assertEqual(self.cds.run('java', input_data),
+                                 self.cold.run('java', input_data))
+
+    def test_one_jvm_for_many_runs(self):
+        """Test consecutive runs, including failing ones, reuse one JVM."""
+        self.warm.run('java', "1 2")
+        build_dir, _ = self.warm._build('java')
+        harness = self.warm._java_harness(build_dir)
+        pid = harness.process.pid
+
+        for i in range(50):
+            stdout, _, code = self.warm.run('java', f"{i} x" if i % 10 == 0 else f"{i} {i + 1}")
+            self.assertEqual(code, 1 if i % 10 == 0 else 0)
+        self.assertEqual(harness.process.pid, pid)
+
+    def test_harness_restarted_after_exit(self):
+        """Test a harness JVM that died is replaced on the next run."""
+        build_dir, _ = self.warm._build('java')
+        harness = self.warm._java_harness(build_dir)
+        self.warm.run('java', "1 2")
+        harness.process.kill()
+        harness.process.wait()
+
+        stdout, stderr, code = self.warm.run('java', "4 5 6")
+        self.assertEqual((stdout, code), ("6 5 4", 0), f"Java: {stderr}")
+
+    def test_large_input(self):
+        """Test an input and output larger than a pipe buffer."""
+        numbers = list(range(-50000, 50000))
+        stdout, stderr, code = self.warm.run('java', " ".join(map(str, numbers)))
+        self.assertEqual(code, 0, f"Java: {stderr}")
+        self.assertEqual(stdout, " ".join(map(str, reversed(numbers))))
+
+
+class TestJavaModeOption(unittest.TestCase):
+    """Test selection of the Java mode."""
+
+    def test_unknown_mode_rejected(self):
+        """Test an unknown mode is rejected before anything is built."""
+        with self.assertRaises(ValueError):
+            SolutionRunner(java_mode='hot', precompile=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Per-line mode tests for TABLICA Python solution.
+
+Tests --per-line (each line reversed independently and flushed at once)
+and --reverse-lines (order of whole lines reversed, lines untouched).
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestLineModes(unittest.TestCase):
+    """Test line-oriented streaming modes of the Python solution."""
+
+    INPUT = "1 2 3\n\n+4 5\n  7 \n8"
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_per_line(self):
+        """Test each line is reversed on its own and blank lines are kept."""
+        stdout, stderr, code = self.runner.run('python', self.INPUT, args=['--per-line'])
+        self.assertEqual(stdout, "3 2 1\n\n5 4\n7\n8", "Python: Failed per-line reversal")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_reverse_lines(self):
+        """Test line order is reversed and line contents are left as-is."""
+        stdout, stderr, code = self.runner.run(
+            'python', self.INPUT + "\n", args=['--reverse-lines'])
+        self.assertEqual(stdout, "8\n  7 \n+4 5\n\n1 2 3", "Python: Failed line order reversal")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_reverse_lines_not_tokenized(self):
+        """Test --reverse-lines accepts lines that are not integers."""
+        stdout, stderr, code = self.runner.run(
+            'python', "first line\nsecond line", args=['--reverse-lines'])
+        self.assertEqual(stdout, "second line\nfirst line", "Python: Should not tokenize lines")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_both_modes(self):
+        """Test combining the modes reverses lines and their integers."""
+        stdout, stderr, code = self.runner.run(
+            'python', self.INPUT, args=['--per-line', '--reverse-lines'])
+        self.assertEqual(stdout, "8\n7\n5 4\n\n3 2 1", "Python: Failed combined modes")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_reverse_lines_mapped_file(self):
+        """Test --reverse-lines on a memory-mapped file."""
+        tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        try:
+            path = os.path.join(tmp_dir, 'lines.txt')
+            with open(path, 'w') as f:
+                f.write("a\nb\nc\n")
+            stdout, stderr, code = self.runner.run(
+                'python', "", args=['--reverse-lines', path])
+            self.assertEqual(stdout, "c\nb\na", "Python: Failed mapped file")
+            self.assertEqual(code, 0, "Python: Non-zero exit code")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def test_per_line_flushes_each_record(self):
+        """Test a record's output is available before stdin is closed."""
+        process = subprocess.Popen(
+            [sys.executable, self.runner.solutions['python'], '--per-line'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for record, expected in [(b"1 2 3\n", b"3 2 1\n"), (b"-4 5\n", b"5 -4\n")]:
+                process.stdin.write(record)
+                process.stdin.flush()
+                self.assertEqual(process.stdout.readline(), expected,
+                                 "Python: Record not flushed immediately")
+            process.stdin.close()
+            self.assertEqual(process.wait(timeout=10), 0, "Python: Non-zero exit code")
+        finally:
+            process.kill()
+            process.stdout.close()
+            process.stderr.close()
+
+    def test_per_line_invalid_record(self):
+        """Test an invalid record stops processing with exit code 1."""
+        stdout, stderr, code = self.runner.run('python', "1 2\nx 3\n4", args=['--per-line'])
+        self.assertEqual(code, 1, "Python: Should return exit code 1")
+        self.assertIn("Error", stderr, "Python: Should output error message")
+        self.assertEqual(stdout, "2 1", "Python: Earlier records should be written")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+NumPy backend tests for TABLICA Python solution.
+
+Tests that --backend numpy gives exactly the same output and exit codes
+as the pure-Python backend, also when the input is cut into windows. The whole suite can also be run through the
+NumPy backend with TABLICA_BACKEND=numpy python3 run_tests.py.
+"""
+
+import importlib.util
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from tests.test_runner import SolutionRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy not installed")
+class TestNumpyBackend(unittest.TestCase):
+    """Test the optional NumPy parse/reverse/format backend."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def assertSameAsPythonBackend(self, input_data: str):
+        """Check NumPy and pure-Python backends agree on output and exit code."""
+        expected = self.runner.run('python', input_data, args=['--backend', 'python'])
+        stdout, stderr, code = self.runner.run('python', input_data, args=['--backend', 'numpy'])
+        self.assertEqual(stdout, expected[0], "Python numpy: Wrong output")
+        self.assertEqual(code, expected[2], "Python numpy: Wrong exit code")
+
+    def test_simple_reverse(self):
+        """Test reversing a simple array."""
+        stdout, stderr, code = self.runner.run('python', "1 2 3", args=['--backend', 'numpy'])
+        self.assertEqual(stdout, "3 2 1", "Python numpy: Failed simple reverse")
+        self.assertEqual(code, 0, "Python numpy: Non-zero exit code")
+
+    def test_extreme_values(self):
+        """Test 32-bit limits and the largest values handled in int64."""
+        self.assertSameAsPythonBackend(
+            "2147483647 -2147483648 0 999999999999999999 -999999999999999999")
+
+    def test_large_random_input(self):
+        """Test 50,000 random values with mixed separators."""
+        import random
+        rng = random.Random(42)
+        separators = [" ", "  ", "\t", "\n"]
+        input_data = "".join(f"{rng.randint(-10**9, 10**9)}{rng.choice(separators)}"
+                             for _ in range(50000))
+        self.assertSameAsPythonBackend(input_data)
+
+    def test_normalisation(self):
+        """Test plus signs, leading zeros and negative zero."""
+        self.assertSameAsPythonBackend("+1 007 -0 -05 +0")
+
+    def test_pure_path_fallback(self):
+        """Test inputs outside the NumPy grammar fall back to the pure path."""
+        for input_data in ["1_000 2", "12345678901234567890 1", "1 ١٢ 3"]:
+            with self.subTest(input_data=input_data):
+                self.assertSameAsPythonBackend(input_data)
+
+    def test_invalid_input(self):
+        """Test invalid tokens are rejected with exit code 1."""
+        for input_data in ["1 a 3", "1 - 2", "1 2-3", "1.5 2"]:
+            with self.subTest(input_data=input_data):
+                stdout, stderr, code = self.runner.run(
+                    'python', input_data, args=['--backend', 'numpy'])
+                self.assertEqual(code, 1, "Python numpy: Should return exit code 1")
+                self.assertIn("Error", stderr, "Python numpy: Should output error message")
+                self.assertEqual(stdout, "", "Python numpy: Should not print partial output")
+
+    def test_mapped_file(self):
+        """Test the NumPy backend reading a memory-mapped file."""
+        tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        try:
+            path = os.path.join(tmp_dir, 'input.txt')
+            with open(path, 'w') as f:
+                f.write("-10 5 -3 8 0\n")
+            stdout, stderr, code = self.runner.run(
+                'python', "", args=['--backend', 'numpy', path])
+            self.assertEqual(stdout, "0 8 -3 5 -10", "Python numpy: Failed mapped file")
+            self.assertEqual(code, 0, "Python numpy: Non-zero exit code")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def test_windows(self):
+        """Test windows cut at whitespace give the same output at any size."""
+        data = b"12 -3\t+4  567\n89 " + b"1" * 18 + b" -0 7"
+        expected = tablica.reverse_tokens(data)
+        for window in [1, 2, 3, 5, 8, 64]:
+            with self.subTest(window=window):
+                bounds = list(tablica.iter_windows_backward(data, window))
+                self.assertEqual(b''.join(data[a:b] for a, b in reversed(bounds)), data)
+                for start, _ in bounds:
+                    self.assertTrue(start == 0 or data[start:start + 1].isspace())
+                self.assertEqual(tablica.reverse_numpy(data, window), expected)
+
+                out = io.BytesIO()
+                self.assertTrue(tablica.reverse_numpy_mapped(data, out, window))
+                self.assertEqual(out.getvalue(), expected + b"\n")
+
+    def test_mapped_fallback_writes_nothing(self):
+        """Test a window needing the pure path is found before anything is written."""
+        data = b"1_000 " + b"1 2 3 " * 100
+        out = io.BytesIO()
+        self.assertFalse(tablica.reverse_numpy_mapped(data, out, 16))
+        self.assertEqual(out.getvalue(), b"")
+        self.assertIsNone(tablica.reverse_numpy(data, 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Output writer tests for TABLICA Python solution.
+
+Tests the chunked binary output stage (write_blocks/write_reversed), the
+precomputed formatting table for small values and the quiet exit when
+the reader closes the pipe early.
+"""
+
+import hashlib
+import importlib.util
+import io
+import os
+import random
+import subprocess
+import sys
+import unittest
+from unittest import mock
+from tests.test_runner import SolutionRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+class RecordingStream(io.BytesIO):
+    """BytesIO that remembers the size of every write."""
+
+    def __init__(self):
+        super().__init__()
+        self.sizes = []
+
+    def write(self, data):
+        self.sizes.append(len(data))
+        return super().write(data)
+
+
+class TestOutputWriter(unittest.TestCase):
+    """Test the chunked output stage of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_blocks_joined_with_newline(self):
+        """Test blocks are separated by spaces and end with one newline."""
+        out = io.BytesIO()
+        tablica.write_blocks([b"3 2", b"1", b"-5"], out)
+        self.assertEqual(out.getvalue(), b"3 2 1 -5\n")
+
+    def test_no_blocks_writes_nothing(self):
+        """Test empty output produces no newline."""
+        out = io.BytesIO()
+        tablica.write_blocks([], out)
+        self.assertEqual(out.getvalue(), b"")
+
+    def test_write_sizes_bounded(self):
+        """Test each write stays within one block of the block size."""
+        numbers = list(range(100000))
+        out = RecordingStream()
+        tablica.write_reversed(numbers, out)
+
+        self.assertEqual(out.getvalue(), " ".join(map(str, reversed(numbers))).encode() + b"\n")
+        largest_block = max(len(block) for block in tablica.iter_reversed_blocks(numbers))
+        self.assertGreater(len(out.sizes), 2, "Python: Output not split into writes")
+        self.assertLessEqual(max(out.sizes), tablica.OUTPUT_BLOCK_SIZE + largest_block + 1)
+
+    def test_default_path_write_sizes_bounded(self):
+        """Test the default path writes its blocks in pieces instead of one joined line."""
+        data = " ".join(map(str, range(-300000, 300000))).encode()
+        bound = tablica.OUTPUT_BLOCK_SIZE + tablica.NUMPY_WINDOW + 1
+        for backend in ['python', 'numpy']:
+            with self.subTest(backend=backend):
+                if backend == 'numpy' and importlib.util.find_spec('numpy') is None:
+                    self.skipTest("NumPy not installed")
+                out = RecordingStream()
+                tablica.reverse_stream(io.BytesIO(data), out,
+                                       tablica.parse_args(['--backend', backend]))
+                self.assertEqual(out.getvalue(), b" ".join(reversed(data.split())) + b"\n")
+                self.assertGreater(len(out.sizes), 2, "Python: Output not split into writes")
+                self.assertLessEqual(max(out.sizes), bound)
+
+    def test_text_path_output(self):
+        """Test the text path still prints the reversed line."""
+        stdout, stderr, code = self.runner.run('python', "1 +2 ٣", args=['--text'])
+        self.assertEqual(stdout, "3 2 1", "Python: Failed text path output")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_closed_pipe_exits_quietly(self):
+        """Test a reader that stops early ends the process without an error."""
+        input_data = " ".join(map(str, range(300000))).encode()
+        for args in [[], ['--text'], ['--compact'], ['--external']]:
+            with self.subTest(args=args):
+                process = subprocess.Popen(
+                    [sys.executable, self.runner.solutions['python']] + args,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                process.stdin.write(input_data)
+                process.stdin.close()
+                self.assertEqual(process.stdout.read(6), b"299999")
+                process.stdout.close()
+                code = process.wait(timeout=10)
+                stderr = process.stderr.read()
+                process.stderr.close()
+                self.assertEqual(code, 141, f"Python {args}: Should exit like SIGPIPE")
+                self.assertEqual(stderr, b"", f"Python {args}: Should not report an error")
+
+
+class TestHotTable(unittest.TestCase):
+    """Test formatting small values from the precomputed table."""
+
+    LIMIT = 100
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner and a small table."""
+        cls.runner = SolutionRunner()
+        cls.table = tablica.hot_table(cls.LIMIT)
+
+    def assertFormatsLikeStr(self, values):
+        """Check format_integers() with the table against str()."""
+        expected = " ".join(map(str, values)).encode()
+        self.assertEqual(tablica.format_integers(values, self.table), expected)
+
+    def test_table_contents(self):
+        """Test the table covers -limit..limit with canonical strings."""
+        self.assertEqual(len(self.table), 2 * self.LIMIT + 1)
+        self.assertEqual((self.table[-100], self.table[-1], self.table[0], self.table[100]),
+                         (b"-100", b"-1", b"0", b"100"))
+        self.assertIs(tablica.hot_table(self.LIMIT), self.table)
+
+    def test_same_output_as_str(self):
+        """Test every formatter choice gives the same bytes as str()."""
+        rng = random.Random(42)
+        boundary = [-self.LIMIT - 1, -self.LIMIT, -1, 0, self.LIMIT, self.LIMIT + 1]
+        cases = {
+            'all in table': [rng.randint(-self.LIMIT, self.LIMIT) for _ in range(5000)],
+            'outlier between samples': [0] * 100 + [2**40] + [5] * 100,
+            'mostly in table': boundary * 50 + [rng.randint(-10, 10) for _ in range(500)],
+            'mostly outside': [rng.randint(-2**63, 2**63) for _ in range(5000)] + boundary,
+            'empty': [],
+        }
+        for name, values in cases.items():
+            with self.subTest(case=name):
+                self.assertFormatsLikeStr(values)
+
+    def test_packed_storage(self):
+        """Test array('q') slices are formatted like lists."""
+        from array import array
+        self.assertFormatsLikeStr(array('q', [3, -7, 2**62, 0] * 100))
+
+    def test_table_only_when_it_pays(self):
+        """Test the table is used only for large outputs of repeating small values."""
+        rng = random.Random(7)
+        skewed = [rng.randint(-9, 9) for _ in range(20000)]
+        wide = [rng.randint(-2**31, 2**31 - 1) for _ in range(20000)]
+        distinct = list(range(-10000, 10000))
+        with mock.patch.object(tablica, 'HOT_TABLE_MIN_VALUES', 10000):
+            self.assertIsNotNone(tablica.table_for(skewed))
+            self.assertIsNotNone(tablica.table_for([str(v).encode() for v in skewed]))
+            self.assertIsNone(tablica.table_for(wide))
+            self.assertIsNone(tablica.table_for(distinct))
+            self.assertIsNone(tablica.table_for(skewed[:5000]))
+
+    def test_hot_range_environment(self):
+        """Test $TABLICA_HOT_RANGE sets, disables, caps or falls back to the default range."""
+        for value, expected in [('1024', 1024), ('0', 0), ('-5', tablica.HOT_RANGE),
+                                ('many', tablica.HOT_RANGE),
+                                (str(tablica.HOT_RANGE_MAX), tablica.HOT_RANGE_MAX),
+                                ('10000000000', tablica.HOT_RANGE_MAX)]:
+            with self.subTest(value=value), \
+                    mock.patch.dict(os.environ, {'TABLICA_HOT_RANGE': value}):
+                self.assertEqual(tablica.hot_range(), expected)
+
+    def test_normalised_output(self):
+        """Test a large input needing normalisation prints canonical values."""
+        rng = random.Random(3)
+        values = [rng.randint(-50, 50) for _ in range(tablica.HOT_TABLE_MIN_VALUES + 1000)]
+        tokens = [f"+{v}" if v > 0 and i % 3 == 0 else f"{v:03d}" if i % 7 == 0 else str(v)
+                  for i, v in enumerate(values)]
+        input_data = " ".join(tokens)
+        expected = " ".join(map(str, reversed(values)))
+        for args in [[], ['--text'], ['--compact']]:
+            with self.subTest(args=args):
+                result = self.runner.run('python', input_data, timeout=60,
+                                         args=args, keep_stdout=False)
+                self.assertEqual(result.returncode, 0, f"Python {args}: {result.stderr}")
+                self.assertEqual(result.stdout_sha256,
+                                 hashlib.sha256(expected.encode() + b"\n").hexdigest(),
+                                 f"Python {args}: Wrong output")
+
+
+if __name__ == '__main__':
+    unittest.main()
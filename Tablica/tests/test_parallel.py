@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Parallel mode tests for TABLICA Python solution.
+
+Tests that --jobs splits large inputs into shards processed by worker
+processes and still produces byte-identical output.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestParallelMode(unittest.TestCase):
+    """Test multi-process parse and format of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner and a multi-shard input (> 2 MiB)."""
+        cls.runner = SolutionRunner()
+        rng = random.Random(42)
+        separators = [" ", " ", " ", "\t", "\n", "  "]
+        cls.numbers = [rng.randint(-10**6, 10**6) for _ in range(300000)]
+        cls.input_data = "".join(f"{n}{rng.choice(separators)}" for n in cls.numbers)
+        cls.expected = " ".join(map(str, reversed(cls.numbers)))
+
+    def test_matches_single_process(self):
+        """Test several worker counts against the expected output."""
+        for jobs in ['2', '3', '4', '0']:
+            with self.subTest(jobs=jobs):
+                stdout, stderr, code = self.runner.run(
+                    'python', self.input_data, timeout=60, args=['--jobs', jobs])
+                self.assertEqual(code, 0, f"Python --jobs {jobs}: Non-zero exit code")
+                self.assertEqual(stdout, self.expected, f"Python --jobs {jobs}: Wrong output")
+
+    def test_small_input_single_shard(self):
+        """Test inputs below the shard size are handled in-process."""
+        stdout, stderr, code = self.runner.run('python', "1 2 3", args=['--jobs', '4'])
+        self.assertEqual(stdout, "3 2 1", "Python: Failed small input")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_normalisation_in_shards(self):
+        """Test tokens needing normalisation inside worker shards."""
+        input_data = self.input_data + " +7 007 -0"
+        expected = "0 7 7 " + self.expected
+        stdout, stderr, code = self.runner.run(
+            'python', input_data, timeout=60, args=['--jobs', '4'])
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+        self.assertEqual(stdout, expected, "Python: Failed normalisation")
+
+    def test_invalid_token_in_shard(self):
+        """Test an invalid token in any shard fails with no output."""
+        input_data = self.input_data + " abc"
+        stdout, stderr, code = self.runner.run(
+            'python', input_data, timeout=60, args=['--jobs', '4'])
+        self.assertEqual(code, 1, "Python: Should return exit code 1")
+        self.assertIn("Error", stderr, "Python: Should output error message")
+        self.assertEqual(stdout, "", "Python: Should not print partial output")
+
+    def test_mapped_file(self):
+        """Test parallel mode on a memory-mapped file."""
+        tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        try:
+            path = os.path.join(tmp_dir, 'input.txt')
+            with open(path, 'w') as f:
+                f.write(self.input_data)
+            stdout, stderr, code = self.runner.run(
+                'python', "", timeout=60, args=['--jobs', '4', path])
+            self.assertEqual(code, 0, "Python: Non-zero exit code")
+            self.assertEqual(stdout, self.expected, "Python: Failed mapped file")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def test_negative_jobs_rejected(self):
+        """Test that a negative worker count is rejected."""
+        stdout, stderr, code = self.runner.run('python', "1 2 3", args=['--jobs', '-1'])
+        self.assertEqual(code, 1, "Python: Should reject negative --jobs")
+
+
+if __name__ == '__main__':
+    unittest.main()
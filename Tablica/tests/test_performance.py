@@ -5,8 +5,9 @@ Performance and stress tests for TABLICA solutions.
 Tests with large inputs, extreme values, and performance benchmarks.
 """
 
+import os
 import unittest
-import time
+from tests import corpus
 from tests.test_runner import SolutionRunner
 
 
@@ -18,54 +19,68 @@ class TestPerformance(unittest.TestCase):
         """Set up test runner for all test methods."""
         cls.runner = SolutionRunner()
 
+    def assertReversesDataset(self, name: str, timeout: int):
+        """Check every language reverses a corpus dataset."""
+        dataset = corpus.load(name)
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], timeout=timeout,
+                                                      input_path=dataset.path,
+                                                      keep_stdout=False):
+            with self.subTest(language=lang):
+                result = result()
+                self.assertEqual(result.returncode, 0, f"{lang}: {result.stderr}")
+                self.assertEqual(result.bytes_out, dataset.expected_bytes, f"{lang}: Wrong length")
+                self.assertEqual(result.stdout_sha256, dataset.expected_sha256,
+                                 f"{lang}: Failed {name}")
+
     def test_large_array_100(self):
         """Test reversing 100 elements."""
-        numbers = list(range(1, 101))
-        input_data = " ".join(map(str, numbers))
-        expected = " ".join(map(str, reversed(numbers)))
+        dataset = corpus.load('range_100')
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'],
+                                                      input_path=dataset.path,
+                                                      keep_stdout=False):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
-                self.assertEqual(stdout, expected, f"{lang}: Failed 100 elements")
-                self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
+                result = result()
+                self.assertEqual(result.stdout_sha256, dataset.expected_sha256,
+                                 f"{lang}: Failed 100 elements")
+                self.assertEqual(result.returncode, 0, f"{lang}: Non-zero exit code")
 
     def test_large_array_1000(self):
         """Test reversing 1000 elements."""
-        numbers = list(range(1, 1001))
-        input_data = " ".join(map(str, numbers))
-        expected = " ".join(map(str, reversed(numbers)))
+        dataset = corpus.load('range_1000')
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'],
+                                                      input_path=dataset.path,
+                                                      keep_stdout=False):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
-                self.assertEqual(stdout, expected, f"{lang}: Failed 1000 elements")
-                self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
+                result = result()
+                self.assertEqual(result.stdout_sha256, dataset.expected_sha256,
+                                 f"{lang}: Failed 1000 elements")
+                self.assertEqual(result.returncode, 0, f"{lang}: Non-zero exit code")
 
     def test_large_array_10000(self):
         """Test reversing 10000 elements."""
-        numbers = list(range(1, 10001))
-        input_data = " ".join(map(str, numbers))
-        expected = " ".join(map(str, reversed(numbers)))
+        dataset = corpus.load('range_10000')
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'],
+                                                      input_path=dataset.path,
+                                                      keep_stdout=False):
             with self.subTest(language=lang):
-                start_time = time.time()
-                stdout, stderr, code = self.runner.run(lang, input_data)
-                elapsed = time.time() - start_time
+                result = result()
                 
-                self.assertEqual(stdout, expected, f"{lang}: Failed 10000 elements")
-                self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
-                self.assertLess(elapsed, 5.0, f"{lang}: Too slow (>{elapsed:.2f}s)")
+                self.assertEqual(result.stdout_sha256, dataset.expected_sha256,
+                                 f"{lang}: Failed 10000 elements")
+                self.assertEqual(result.returncode, 0, f"{lang}: Non-zero exit code")
+                self.assertLess(result.wall_s, 5.0, f"{lang}: Too slow (>{result.wall_s:.2f}s)")
 
     def test_very_large_numbers(self):
         """Test with very large integer values."""
         input_data = "2147483647 -2147483648 1000000000"
         expected = "1000000000 -2147483648 2147483647"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed large numbers")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
@@ -78,38 +93,45 @@ class TestPerformance(unittest.TestCase):
         input_data = " ".join(map(str, numbers))
         expected = " ".join(map(str, reversed(numbers)))
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed alternating pattern")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
     def test_random_large_values(self):
         """Test with random large values."""
-        import random
-        random.seed(42)  # For reproducibility
-        numbers = [random.randint(-1000000, 1000000) for _ in range(100)]
-        
-        input_data = " ".join(map(str, numbers))
-        expected = " ".join(map(str, reversed(numbers)))
+        dataset = corpus.load('random_100')  # seeded, for reproducibility
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'],
+                                                      input_path=dataset.path,
+                                                      keep_stdout=False):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
-                self.assertEqual(stdout, expected, f"{lang}: Failed random values")
-                self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
+                result = result()
+                self.assertEqual(result.stdout_sha256, dataset.expected_sha256,
+                                 f"{lang}: Failed random values")
+                self.assertEqual(result.returncode, 0, f"{lang}: Non-zero exit code")
 
     def test_palindrome_array(self):
         """Test with palindromic array (same forwards and backwards)."""
         input_data = "1 2 3 4 5 4 3 2 1"
         expected = "1 2 3 4 5 4 3 2 1"
         
-        for lang in ['python', 'java', 'cpp']:
+        for lang, result in self.runner.run_languages(['python', 'java', 'cpp'], input_data):
             with self.subTest(language=lang):
-                stdout, stderr, code = self.runner.run(lang, input_data)
+                stdout, stderr, code = result()
                 self.assertEqual(stdout, expected, f"{lang}: Failed palindrome")
                 self.assertEqual(code, 0, f"{lang}: Non-zero exit code")
 
+    def test_int32_1e6(self):
+        """Test reversing 1,000,000 seeded 32-bit values."""
+        self.assertReversesDataset('int32_1e6', timeout=60)
+
+    @unittest.skipUnless(os.environ.get('TABLICA_LARGE_TESTS'), "set TABLICA_LARGE_TESTS=1")
+    def test_int32_1e7(self):
+        """Test reversing 10,000,000 seeded 32-bit values."""
+        self.assertReversesDataset('int32_1e7', timeout=600)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Pipelined read tests for TABLICA Python solution.
+
+Tests --pipeline, where a background thread reads input into a bounded
+queue while the main thread parses, and the PrefetchReader behind it.
+"""
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from tests.test_runner import SolutionRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+class FailingStream(io.BytesIO):
+    """Stream that fails after returning its data once."""
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if not data:
+            raise OSError(5, "Input/output error")
+        return data
+
+
+class TestPipelineMode(unittest.TestCase):
+    """Test the pipelined reader of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_matches_default_path(self):
+        """Test --pipeline with chunk sizes that cut tokens."""
+        numbers = list(range(-3000, 3000, 7))
+        input_data = "\n".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+        for chunk_size in ['1', '5', '4096']:
+            with self.subTest(chunk_size=chunk_size):
+                stdout, stderr, code = self.runner.run(
+                    'python', input_data, args=['--pipeline', '--chunk-size', chunk_size])
+                self.assertEqual(stdout, expected, f"Python: Failed chunk size {chunk_size}")
+                self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_combined_modes(self):
+        """Test --pipeline together with --compact and --external."""
+        input_data = "+1 007\t-3\n" * 50
+        expected = " ".join(["-3 7 1"] * 50)
+        for extra in [['--compact'], ['--external', '--memory-limit', '100']]:
+            with self.subTest(args=extra):
+                stdout, stderr, code = self.runner.run(
+                    'python', input_data, args=['--pipeline'] + extra)
+                self.assertEqual(stdout, expected, f"Python {extra}: Wrong output")
+                self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_invalid_input(self):
+        """Test invalid input fails cleanly while the reader thread runs."""
+        stdout, stderr, code = self.runner.run('python', "1 x 3", args=['--pipeline'])
+        self.assertEqual(code, 1, "Python: Should return exit code 1")
+        self.assertIn("Error: Input must contain only integers", stderr)
+        self.assertEqual(stdout, "", "Python: Should not print partial output")
+
+    def test_invalid_input_open_pipe(self):
+        """Test invalid input ends the run while the writer keeps the pipe open."""
+        process = subprocess.Popen(
+            [sys.executable, self.runner.solutions['python'], '--pipeline'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        process.stdin.write(b"1 x 3 ")
+        process.stdin.flush()
+        try:
+            code = process.wait(timeout=10)
+        finally:
+            process.stdin.close()
+        stderr = process.stderr.read().decode()
+        process.stdout.close()
+        process.stderr.close()
+        self.assertEqual(code, 1, stderr)
+        self.assertEqual(stderr, "Error: Input must contain only integers\n")
+
+    def test_slow_writer(self):
+        """Test input arriving in pieces over time."""
+        process = subprocess.Popen(
+            [sys.executable, self.runner.solutions['python'], '--pipeline'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        for piece in [b"1 2", b"3 4 ", b"5\n"]:
+            process.stdin.write(piece)
+            process.stdin.flush()
+            time.sleep(0.05)
+        stdout, stderr = process.communicate(timeout=10)
+        self.assertEqual(stdout, b"5 4 23 1\n", "Python: Failed slow writer")
+        self.assertEqual(process.returncode, 0, "Python: Non-zero exit code")
+
+    def test_reader_sizes(self):
+        """Test read() never returns more than requested and ends with b''."""
+        reader = tablica.PrefetchReader(io.BytesIO(b"abcdefgh"), chunk_size=3, depth=2)
+        self.assertEqual([reader.read(2) for _ in range(6)],
+                         [b"ab", b"c", b"de", b"f", b"gh", b""])
+
+    def test_reader_read_all(self):
+        """Test read() without a size returns the whole stream."""
+        data = b"12 34 " * 10000
+        reader = tablica.PrefetchReader(io.BytesIO(data), chunk_size=7, depth=2)
+        self.assertEqual(reader.read(), data)
+        self.assertEqual(reader.read(), b"")
+
+    def test_reader_error_propagates(self):
+        """Test a read error in the thread is raised by the consumer."""
+        reader = tablica.PrefetchReader(FailingStream(b"1 2"), chunk_size=16)
+        self.assertEqual(reader.read(16), b"1 2")
+        with self.assertRaises(OSError):
+            reader.read(16)
+
+
+class TestPrefetchReaderFile(unittest.TestCase):
+    """Test PrefetchReader on files opened by the caller."""
+
+    def setUp(self):
+        """Write an input file with a header line."""
+        self.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
+        self.path = os.path.join(self.tmp_dir, 'input.txt')
+        with open(self.path, 'wb') as f:
+            f.write(b"header\n1 2 3 4 5\n")
+
+    def test_buffered_data_read_first(self):
+        """Test bytes already in a BufferedReader's buffer are not skipped."""
+        with open(self.path, 'rb') as infile:
+            infile.readline()
+            reader = tablica.PrefetchReader(infile, chunk_size=4)
+            self.assertEqual(reader.read(), b"1 2 3 4 5\n")
+            reader.close()
+
+            infile.seek(0)
+            infile.readline()
+            out = io.BytesIO()
+            tablica.reverse_stream(infile, out, tablica.parse_args(['--pipeline']))
+        self.assertEqual(out.getvalue(), b"5 4 3 2 1\n")
+
+    def test_close_stops_reading(self):
+        """Test close() ends the thread, which then leaves the descriptor alone."""
+        with open(self.path, 'wb') as f:
+            f.write(b"1 " * 500000)
+        threads = threading.active_count()
+        with open(self.path, 'rb', buffering=0) as infile:
+            reader = tablica.PrefetchReader(infile, chunk_size=16, depth=2)
+            self.assertEqual(reader.read(16), b"1 " * 8)
+            reader.close()
+            self.assertEqual(threading.active_count(), threads)
+            position = infile.tell()
+            time.sleep(0.05)
+            self.assertEqual(infile.tell(), position)
+            self.assertLess(position, 1000)
+            self.assertEqual(reader.read(16), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Phase profiler tests for TABLICA Python solution.
+
+Tests that --profile (or $TABLICA_PROFILE) writes one JSON line of phase
+timings and tracemalloc peaks to stderr without changing stdout, that
+--profile-dump writes a cProfile dump, and that a run without them does
+not load the profiling modules.
+"""
+
+import json
+import os
+import pstats
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from tests.test_runner import SolutionRunner
+from tests.test_startup import imported_modules
+
+
+def profile_report(stderr: str) -> dict:
+    """Decode the JSON report on the last line of stderr."""
+    return json.loads(stderr.strip().splitlines()[-1])
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    """Test the --profile report of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner and a scratch directory."""
+        cls.runner = SolutionRunner()
+        cls.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory."""
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def test_stdout_unchanged(self):
+        """Test profiling adds a report to stderr and leaves stdout alone."""
+        input_data = " ".join(map(str, range(1000)))
+        plain = self.runner.run('python', input_data)
+        profiled = self.runner.run('python', input_data, args=['--profile'])
+        self.assertEqual((profiled.stdout, profiled.returncode), (plain.stdout, 0))
+        self.assertEqual(plain.stderr, "", "Python: Report written without --profile")
+
+        report = profile_report(profiled.stderr)
+        self.assertEqual([p['phase'] for p in report['phases']],
+                         ['map', 'read', 'reverse', 'write'])
+        for phase in report['phases']:
+            self.assertGreaterEqual(phase['ms'], 0)
+            self.assertLessEqual(phase['peak_bytes'], report['peak_bytes'])
+        self.assertGreaterEqual(report['total_ms'], sum(p['ms'] for p in report['phases']))
+
+    def test_text_path_phases(self):
+        """Test the text path reports read, parse and format_write."""
+        result = self.runner.run('python', "3 -1 2", args=['--text', '--profile'])
+        self.assertEqual(result.stdout, "2 -1 3")
+        report = profile_report(result.stderr)
+        self.assertEqual([p['phase'] for p in report['phases']],
+                         ['read', 'parse', 'format_write'])
+        parse = report['phases'][1]
+        self.assertGreater(parse['peak_bytes'], 0)
+
+    def test_environment_variable(self):
+        """Test $TABLICA_PROFILE turns profiling on without a flag."""
+        env = dict(os.environ, TABLICA_PROFILE='1')
+        result = subprocess.run([sys.executable, self.runner.solutions['python']], env=env,
+                                input=b"1 2 3", capture_output=True, timeout=10)
+        self.assertEqual(result.stdout, b"3 2 1\n")
+        self.assertIn('phases', profile_report(result.stderr.decode()))
+
+        env['TABLICA_PROFILE'] = '0'
+        result = subprocess.run([sys.executable, self.runner.solutions['python']], env=env,
+                                input=b"1 2 3", capture_output=True, timeout=10)
+        self.assertEqual(result.stderr, b"")
+
+    def test_error_still_reported(self):
+        """Test a failing run reports the phases it got through."""
+        result = self.runner.run('python', "1 x 3", args=['--text', '--profile'])
+        self.assertEqual(result.returncode, 1)
+        lines = result.stderr.strip().splitlines()
+        self.assertTrue(lines[0].startswith("Error:"))
+        self.assertEqual(profile_report(result.stderr)['phases'][-1]['phase'], 'parse')
+
+    def test_cprofile_dump(self):
+        """Test --profile-dump writes stats pstats can load."""
+        path = os.path.join(self.tmp_dir, 'tablica.prof')
+        result = self.runner.run('python', "1 2 3", args=['--text', '--profile-dump', path])
+        self.assertEqual(result.stdout, "3 2 1")
+        self.assertIn('phases', profile_report(result.stderr))
+        functions = {name for _, _, name in pstats.Stats(path).stats}
+        self.assertIn('parse_integers', functions)
+
+    def test_disabled_imports_nothing(self):
+        """Test a run without --profile does not import the profiling modules."""
+        modules = imported_modules([self.runner.solutions['python']], b"1 2 3")
+        for name in ['tracemalloc', 'cProfile', 'json']:
+            self.assertNotIn(name, modules, f"Python: {name} imported without --profile")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Resource accounting tests.
+
+Tests the RunResult objects returned by SolutionRunner: tuple
+compatibility, byte counts, CPU time and peak RSS measured for the child
+alone (through tests/spawner.py), streamed input and hashed output, and
+per-element memory budgets for the Python and C++ solutions.
+"""
+
+import hashlib
+import shutil
+import subprocess
+import tracemalloc
+import unittest
+from tests.test_runner import OutputDigest, RunResult, SolutionRunner, execute
+
+# Elements in the budget runs
+BUDGET_SIZE = 1_000_000
+
+# Peak RSS above an empty run, in bytes per element
+MEMORY_BUDGETS = {
+    'python': 128,
+    'cpp': 32,
+}
+
+
+class TestRunResult(unittest.TestCase):
+    """Test the fields and tuple behaviour of RunResult."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a test runner that starts a process per run."""
+        cls.runner = SolutionRunner(python_mode='subprocess')
+
+    def test_unpacks_as_tuple(self):
+        """Test a result unpacks, indexes and compares as (stdout, stderr, returncode)."""
+        result = self.runner.run('python', "1 2 3")
+        stdout, stderr, code = result
+        self.assertEqual((stdout, code), ("3 2 1", 0))
+        self.assertEqual(result[0], stdout)
+        self.assertEqual(result, ("3 2 1", stderr, 0))
+        self.assertIsInstance(result, RunResult)
+
+    def test_fields_measured(self):
+        """Test wall time, CPU time, peak RSS and byte counts are filled in."""
+        input_data = "10 -20 30\n"
+        result = self.runner.run('python', input_data)
+        self.assertEqual(result.language, 'python')
+        self.assertGreater(result.wall_s, 0)
+        self.assertGreater(result.cpu_s, 0)
+        self.assertGreater(result.max_rss_kb, 0)
+        self.assertGreater(result.rss_floor_kb, 0)
+        self.assertEqual(result.bytes_in, len(input_data))
+        self.assertEqual(result.bytes_out, len("30 -20 10\n"))
+        self.assertEqual(result.compile_s, 0.0)
+
+    def test_recorded_in_history(self):
+        """Test every run is added to the process-wide history."""
+        result = self.runner.run('python', "4 5")
+        self.assertIs(SolutionRunner.history()[-1], result)
+
+    def test_streamed_run(self):
+        """Test chunked input and hashed output match a plain run."""
+        chunks = [f"{i} {i + 1} ".encode() for i in range(0, 20000, 2)]
+        streamed = self.runner.run('python', iter(chunks), keep_stdout=False)
+        plain = self.runner.run('python', b"".join(chunks))
+        self.assertEqual((streamed.stdout, streamed.returncode), ("", 0))
+        self.assertEqual(streamed.stdout_sha256, plain.stdout_sha256)
+        self.assertEqual(streamed.bytes_out, plain.bytes_out)
+        self.assertEqual(streamed.bytes_in, plain.bytes_in)
+
+    def test_failed_run_measured(self):
+        """Test invalid input still gives a measured result."""
+        result = self.runner.run('python', "1 x 3")
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stdout, "")
+        self.assertIsNotNone(result.max_rss_kb)
+
+
+class TestExecute(unittest.TestCase):
+    """Test execute(), which runs commands through the spawner."""
+
+    def test_cpu_separate_from_wall(self):
+        """Test a sleeping child uses wall time but almost no CPU."""
+        _, _, code, usage = execute(['sleep', '0.2'], b'', timeout=10)
+        self.assertEqual(code, 0)
+        self.assertGreaterEqual(usage['wall_s'], 0.2)
+        self.assertLess(usage['user_s'] + usage['sys_s'], 0.1)
+
+    def test_rss_independent_of_test_process(self):
+        """Test a large test process does not raise the child's peak RSS."""
+        ballast = bytearray(256 * 1024 * 1024)
+        ballast[::4096] = b'\1' * len(ballast[::4096])
+        _, _, code, usage = execute(['true'], b'', timeout=10)
+        del ballast
+        self.assertEqual(code, 0)
+        self.assertLess(usage['max_rss_kb'], 64 * 1024)
+
+    def test_large_input_and_output(self):
+        """Test input and output larger than a pipe buffer."""
+        data = b"x" * (4 * 1024 * 1024)
+        stdout, stderr, code, _ = execute(['cat'], data, timeout=10)
+        self.assertEqual((len(stdout), stderr, code), (len(data), b'', 0))
+
+    def test_iterable_input(self):
+        """Test an iterable of chunks is written to stdin in order."""
+        chunks = (bytes([65 + i % 26]) * 70000 for i in range(40))
+        stdout, _, code, usage = execute(['cat'], chunks, timeout=10)
+        self.assertEqual(code, 0)
+        self.assertEqual(usage['bytes_in'], 40 * 70000)
+        self.assertEqual(stdout[::70000], bytes(65 + i % 26 for i in range(40)))
+
+    def test_streamed_output_constant_memory(self):
+        """Test hashing a large output does not hold it in memory."""
+        size = 256 * 1024 * 1024
+        sink = OutputDigest()
+        tracemalloc.start()
+        try:
+            stdout, _, code, _ = execute(['head', '-c', str(size), '/dev/zero'], b'',
+                                         timeout=60, stdout_sink=sink)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        expected = hashlib.sha256()
+        block = bytes(1024 * 1024)
+        for _ in range(size // len(block)):
+            expected.update(block)
+        self.assertEqual((stdout, code, sink.size), (b'', 0, size))
+        self.assertEqual(sink.hexdigest(), expected.hexdigest())
+        self.assertLess(peak, 8 * 1024 * 1024)
+
+    def test_exit_status(self):
+        """Test exit codes and stderr are passed back."""
+        stdout, stderr, code, _ = execute(['sh', '-c', 'echo oops >&2; exit 3'], b'', timeout=10)
+        self.assertEqual((stdout, stderr, code), (b'', b'oops\n', 3))
+
+    def test_timeout(self):
+        """Test a child that runs too long is killed."""
+        with self.assertRaises(subprocess.TimeoutExpired):
+            execute(['sleep', '10'], b'', timeout=0.2)
+
+    def test_missing_command(self):
+        """Test a command that cannot be started raises like subprocess."""
+        with self.assertRaises(FileNotFoundError):
+            execute(['/nonexistent/tablica'], b'', timeout=10)
+
+
+class TestMemoryBudget(unittest.TestCase):
+    """Test peak memory per element stays within budget."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner and the budget input."""
+        # Peak RSS and CPU time are only measured for a child process
+        cls.runner = SolutionRunner(python_mode='subprocess')
+        cls.input_data = " ".join(map(str, range(-BUDGET_SIZE // 2, BUDGET_SIZE // 2)))
+
+    def assertWithinBudget(self, language: str, args=None):
+        """Check the peak RSS growth over an empty run against the budget."""
+        empty = self.runner.run(language, "", args=args)
+        result = self.runner.run(language, self.input_data, timeout=60, args=args)
+        self.assertEqual(result.returncode, 0, f"{language}: {result.stderr}")
+        per_element = (result.max_rss_kb - empty.max_rss_kb) * 1024 / BUDGET_SIZE
+        self.assertLess(per_element, MEMORY_BUDGETS[language],
+                        f"{language}: {per_element:.1f} bytes per element")
+
+    def test_python_budget(self):
+        """Test the pure-Python backend's memory per element."""
+        self.assertWithinBudget('python', args=['--backend', 'python'])
+
+    @unittest.skipUnless(shutil.which('g++'), "g++ not installed")
+    def test_cpp_budget(self):
+        """Test the C++ solution's memory per element."""
+        self.assertWithinBudget('cpp')
+
+    def test_python_cpu_time(self):
+        """Test the pure-Python backend's CPU time for the budget input."""
+        result = self.runner.run('python', self.input_data, timeout=60,
+                                 args=['--backend', 'python'])
+        self.assertEqual(result.returncode, 0, f"Python: {result.stderr}")
+        self.assertLess(result.cpu_s, 5.0, f"Python: {result.cpu_s:.2f}s CPU")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Parallel test execution tests.
+
+Tests run_tests.py --jobs: class fixtures, outcome collection and that
+waiting tests overlap; and the timing history and --check-regressions.
+"""
+
+import os
+import platform
+import shutil
+import tempfile
+import time
+import unittest
+from io import StringIO
+
+import run_tests
+from tests.test_runner import RunResult, SolutionRunner, current_test
+
+
+class TestParallelRunner(unittest.TestCase):
+    """Test run_tests.run_parallel()."""
+
+    # Times its own pool (run_tests.py --jobs runs it alone)
+    parallel_safe = False
+
+    # Sample classes are nested so that discovery does not collect them
+    class SleepingTests(unittest.TestCase):
+        """Sample tests that wait, counting their class fixtures."""
+
+        fixture_calls = []
+
+        @classmethod
+        def setUpClass(cls):
+            cls.fixture_calls.append('setUpClass')
+
+        @classmethod
+        def tearDownClass(cls):
+            cls.fixture_calls.append('tearDownClass')
+
+        def test_pass(self):
+            time.sleep(0.2)
+
+        def test_fail(self):
+            time.sleep(0.2)
+            self.fail("expected failure")
+
+        def test_subtests(self):
+            for i in range(2):
+                with self.subTest(i=i):
+                    time.sleep(0.2)
+                    self.assertEqual(i, 0)
+
+        @unittest.skip("skipped on purpose")
+        def test_skipped(self):
+            pass
+
+    class BrokenFixtureTests(unittest.TestCase):
+        """Sample tests whose class fixture fails."""
+
+        @classmethod
+        def setUpClass(cls):
+            raise RuntimeError("fixture failed")
+
+        def test_never_runs(self):
+            pass
+
+    class SolutionTests(unittest.TestCase):
+        """Sample test that runs a solution."""
+
+        def test_run(self):
+            SolutionRunner(precompile=False).run('python', "1 2")
+
+    def run_parallel(self, test_class, jobs=4):
+        """Run one sample class in parallel, returning its result and output."""
+        suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
+        stream = StringIO()
+        return run_tests.run_parallel(suite, jobs, stream), stream.getvalue()
+
+    def test_outcomes_collected(self):
+        """Test passes, failures, failing subtests and skips reach the result."""
+        result, output = self.run_parallel(self.SleepingTests)
+        self.assertEqual(result.testsRun, 4)
+        self.assertEqual(sorted(test.id().split('.')[-1] for test, _ in result.failures),
+                         ['test_fail', 'test_subtests (i=1)'])
+        self.assertEqual(len(result.skipped), 1)
+        self.assertIn("expected failure", output)
+        self.assertIn("Ran 4 tests", output)
+
+    def test_class_fixtures_once(self):
+        """Test setUpClass and tearDownClass run once per class."""
+        self.SleepingTests.fixture_calls.clear()
+        self.run_parallel(self.SleepingTests)
+        self.assertEqual(self.SleepingTests.fixture_calls, ['setUpClass', 'tearDownClass'])
+
+    def test_broken_fixture_reported(self):
+        """Test a failing setUpClass is an error of each test of its class."""
+        result, output = self.run_parallel(self.BrokenFixtureTests)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("fixture failed", output)
+
+    def test_waiting_tests_overlap(self):
+        """Test the run takes about as long as its slowest test."""
+        start = time.perf_counter()
+        self.run_parallel(self.SleepingTests)
+        # Serially: 0.2 + 0.2 + 0.4 seconds
+        self.assertLess(time.perf_counter() - start, 0.6)
+
+    def test_runs_tagged_with_test(self):
+        """Test solution runs are attributed to the test that made them."""
+        first = len(SolutionRunner.history())
+        self.run_parallel(self.SolutionTests)
+        test_ids = [result.test_id for result in SolutionRunner.history()[first:]]
+        self.assertEqual(test_ids, [self.SolutionTests('test_run').id()])
+
+
+def timings(wall_s: float, cpu_s=None) -> dict:
+    """One collect_timings() entry."""
+    return {'wall_s': wall_s, 'cpu_s': cpu_s, 'runs': 1}
+
+
+def history(samples, key='test_basic.TestBasic.test_simple [python]', host=None, jobs=1):
+    """History records with one timing each."""
+    return [{'host': host or platform.node(), 'jobs': jobs, 'timings': {key: timings(sample)}}
+            for sample in samples]
+
+
+class TestRegressionCheck(unittest.TestCase):
+    """Test the timing history and run_tests.find_regressions()."""
+
+    KEY = 'test_basic.TestBasic.test_simple [python]'
+    BASELINE = [0.100, 0.104, 0.098, 0.101, 0.103, 0.099, 0.102, 0.097, 0.105, 0.100]
+
+    def current(self, *samples):
+        """New runs with one timing each."""
+        return [{self.KEY: timings(sample)} for sample in samples]
+
+    def test_p_value_exact(self):
+        """Test the rank-sum p-value on separated, equal and tied samples."""
+        # Only 1 of the C(13, 3) = 286 splits puts all 3 on top
+        self.assertAlmostEqual(run_tests.slowdown_p_value(self.BASELINE, [0.2, 0.21, 0.22]),
+                               1 / 286)
+        self.assertGreater(run_tests.slowdown_p_value(self.BASELINE, [0.1, 0.101, 0.099]), 0.3)
+        self.assertEqual(run_tests.slowdown_p_value([1.0] * 5, [1.0] * 3), 1.0)
+
+    def test_slowdown_flagged(self):
+        """Test a consistent 2x slowdown is reported."""
+        regressions = run_tests.find_regressions(history(self.BASELINE),
+                                                 self.current(0.2, 0.21, 0.19), jobs=1)
+        self.assertEqual([regression['key'] for regression in regressions], [self.KEY])
+        self.assertAlmostEqual(regressions[0]['ratio'], 2.0, places=1)
+        self.assertEqual(regressions[0]['metric'], 'wall_s')
+
+    def test_noise_not_flagged(self):
+        """Test samples within the baseline's spread, or one outlier, are not reported."""
+        for samples in [(0.101, 0.099, 0.103), (0.5, 0.1, 0.1), (0.104, 0.105, 0.106)]:
+            with self.subTest(samples=samples):
+                self.assertEqual(run_tests.find_regressions(history(self.BASELINE),
+                                                            self.current(*samples), jobs=1), [])
+
+    def test_comparable_baseline_only(self):
+        """Test other hosts, other --jobs and short histories give no baseline."""
+        slow = self.current(0.2, 0.21, 0.19)
+        for records in [history(self.BASELINE, host='elsewhere'),
+                        history(self.BASELINE, jobs=8),
+                        history(self.BASELINE[:run_tests.MIN_BASELINE_SAMPLES - 1])]:
+            self.assertEqual(run_tests.find_regressions(records, slow, jobs=1), [])
+
+    def test_cpu_time_preferred(self):
+        """Test CPU time is compared when every sample has it."""
+        records = [{'host': platform.node(), 'jobs': 1,
+                    'timings': {self.KEY: timings(0.3, cpu_s)}} for cpu_s in self.BASELINE]
+        # Wall time doubled (busy machine) but CPU time unchanged
+        current = [{self.KEY: timings(0.6, 0.1)} for _ in range(3)]
+        self.assertEqual(run_tests.find_regressions(records, current, jobs=1), [])
+
+    def test_collect_timings(self):
+        """Test runs are totalled per test and language."""
+        results = [RunResult('python', "", "", 0, wall_s=0.1, user_s=0.05, sys_s=0.01,
+                             test_id='tests.test_basic.TestBasic.test_simple'),
+                   RunResult('python', "", "", 0, wall_s=0.2, user_s=0.1, sys_s=0.0,
+                             test_id='test_basic.TestBasic.test_simple'),
+                   RunResult('java', "", "", 0, wall_s=0.3,
+                             test_id='test_basic.TestBasic.test_simple'),
+                   RunResult('cpp', "", "", 0, wall_s=0.3)]
+        collected = run_tests.collect_timings(results)
+        self.assertEqual(sorted(collected), ['test_basic.TestBasic.test_simple [java]', self.KEY])
+        self.assertAlmostEqual(collected[self.KEY]['wall_s'], 0.3)
+        self.assertAlmostEqual(collected[self.KEY]['cpu_s'], 0.16)
+        self.assertEqual(collected[self.KEY]['runs'], 2)
+        self.assertIsNone(collected['test_basic.TestBasic.test_simple [java]']['cpu_s'])
+
+    def test_history_file(self):
+        """Test runs are appended as JSON lines and read back."""
+        tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        try:
+            path = os.path.join(tmp_dir, 'history.jsonl')
+            self.assertEqual(run_tests.load_history(path), [])
+            run_tests.append_history(path, self.current(0.1, 0.2), jobs=4)
+            with open(path, 'a') as f:
+                f.write("not json\n")
+            run_tests.append_history(path, self.current(0.3), jobs=4)
+
+            records = run_tests.load_history(path)
+            self.assertEqual([record['timings'][self.KEY]['wall_s'] for record in records],
+                             [0.1, 0.2, 0.3])
+            self.assertEqual({record['jobs'] for record in records}, {4})
+            self.assertEqual({record['host'] for record in records}, {platform.node()})
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def test_current_test_recorded(self):
+        """Test SolutionRunner tags results with current_test, also from its pool."""
+        runner = SolutionRunner(precompile=False, jobs=2)
+        token = current_test.set('sample.test')
+        try:
+            results = [result() for _, result in runner.run_languages(['python', 'python'], "1")]
+        finally:
+            current_test.reset(token)
+        self.assertEqual([result.test_id for result in results], ['sample.test'] * 2)
+        # Outside the block, the test running this one (if any)
+        self.assertEqual(runner.run('python', "1").test_id, current_test.get())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,23 +4,621 @@ Test runner utility for executing TABLICA solutions.
 
 Provides a unified interface for running Python, Java, and C++ solutions
 with input data and capturing their output.
+
+Java and C++ builds live in a cache directory ($TABLICA_CACHE_DIR, by
+default ~/.cache/tablica), keyed by a hash of the source, the compiler
+version and the flags, so an unchanged checkout never recompiles. The
+first runner of a process compiles both in parallel, before any test
+is timed.
+
+Java runs in one of three modes ($TABLICA_JAVA_MODE):
+
+- cold: a new JVM per run (default)
+- cds: a new JVM per run, started from an AppCDS archive of the
+  solution's classes (JDK 13+; falls back to cold)
+- warm: every run is sent to one persistent JVM (tests/TablicaHarness.java)
+  that calls the solution with in-memory streams
+
+Python runs in one of two modes ($TABLICA_PYTHON_MODE):
+
+- subprocess: a new interpreter per run (default)
+- inprocess: tablica.main() is called in the test process with
+  in-memory streams, and SystemExit is turned into the exit status.
+  Runs skip interpreter startup but are serialised, timeouts are not
+  enforced and CPU time and peak RSS are not measured, so tests of the
+  process itself (startup, resources, signals) pin python_mode to
+  subprocess
+
+With $TABLICA_TEST_JOBS above 1 (set by run_tests.py --jobs),
+run_languages() runs the languages of one test case concurrently.
+
+run() returns a RunResult, which unpacks as (stdout, stderr, returncode)
+and also carries the child's wall time, CPU time and peak RSS (from
+os.wait4), bytes in and out, and compile time. Every result is recorded
+in SolutionRunner.history(), tagged with the test that ran it
+(current_test), for run_tests.py's per-language table and timing history.
+With input_path, a file (e.g. a tests/corpus.py dataset) is fed to the
+solution instead of an input string; input can also be an iterable of
+byte chunks, written as they are produced. With keep_stdout=False the
+output is hashed as it arrives instead of being kept, so verifying a
+gigabyte output takes constant memory in the test process.
 """
 
+import atexit
+import contextlib
+import contextvars
+import functools
+import hashlib
+import importlib.util
+import io
+import itertools
+import json
+import queue
+import shutil
+import signal
+import socket
+import struct
 import subprocess
 import sys
 import os
-from typing import Tuple
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Languages that need a build step
+COMPILED_LANGUAGES = ('java', 'cpp')
+
+# Compiler command and flags per language
+COMPILERS = {
+    'java': ['javac'],
+    'cpp': ['g++', '-std=c++17', '-O2'],
+}
+
+# Name of the C++ executable inside its build directory
+CPP_EXECUTABLE = 'tablica_exe'
+
+# Maximum time for one compilation in seconds
+COMPILE_TIMEOUT = 120
+
+# Java execution modes, see the module docstring
+JAVA_MODES = ('cold', 'cds', 'warm')
+
+# Python execution modes, see the module docstring
+PYTHON_MODES = ('subprocess', 'inprocess')
+
+# Warm-mode harness, compiled together with the Java solution
+JAVA_HARNESS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'TablicaHarness.java')
+
+# AppCDS archive inside the Java build directory, and the input run to
+# record which classes it holds
+JAVA_ARCHIVE = 'tablica.jsa'
+JAVA_ARCHIVE_INPUT = "3 -1 2\n"
+
+# Process that starts the solutions, and its largest message in bytes
+SPAWNER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spawner.py')
+MAX_SPAWNER_MESSAGE = 1 << 16
+
+# Bytes read per call when a solution's stdout is streamed to a sink
+STREAM_CHUNK = 1 << 20
+
+# Outcome of a build: (build directory, failed compiler result), or the
+# exception raised when the compiler could not be run
+Build = Union[Tuple[Optional[str], Optional[subprocess.CompletedProcess]], Exception]
+
+# Program input: text, bytes, or an iterable of byte chunks fed as produced
+Input = Union[str, bytes, Iterable[bytes]]
+
+# Id of the test being run, set by run_tests.py and stored in each RunResult
+current_test: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    'current_test', default=None)
+
+
+def default_cache_dir() -> str:
+    """Return $TABLICA_CACHE_DIR, or tablica/ under the user cache directory."""
+    if os.environ.get('TABLICA_CACHE_DIR'):
+        return os.environ['TABLICA_CACHE_DIR']
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_root, 'tablica')
+
+
+def build_key(source: bytes, compiler_version: str, flags: Sequence[str]) -> str:
+    """
+    Hash everything that determines a build's output.
+
+    Args:
+        source: Source file contents
+        compiler_version: Output of the compiler's version command
+        flags: Compiler command and flags
+
+    Returns:
+        Hex digest (16 characters)
+    """
+    digest = hashlib.sha256()
+    for part in [source, compiler_version.encode(), '\0'.join(flags).encode()]:
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()[:16]
+
+
+@dataclass(eq=False)
+class RunResult:
+    """
+    Outcome and resource usage of one solution run.
+
+    Unpacks and compares as (stdout, stderr, returncode). Resource fields
+    are None where they cannot be measured (warm-mode Java shares one JVM).
+    A max_rss_kb at or near rss_floor_kb, the resident set inherited from
+    the process that started the child (see tests/spawner.py), only says
+    the child stayed below it. stdout_sha256 is the digest of the raw
+    output bytes, for comparison with tests/corpus.py datasets.
+    """
+
+    language: str
+    stdout: str
+    stderr: str
+    returncode: int
+    wall_s: float = 0.0
+    user_s: Optional[float] = None
+    sys_s: Optional[float] = None
+    max_rss_kb: Optional[int] = None
+    rss_floor_kb: Optional[int] = None
+    bytes_in: int = 0
+    bytes_out: int = 0
+    stdout_sha256: Optional[str] = None
+    compile_s: float = 0.0
+    test_id: Optional[str] = None
+
+    def __iter__(self):
+        return iter((self.stdout, self.stderr, self.returncode))
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index):
+        return (self.stdout, self.stderr, self.returncode)[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RunResult):
+            other = tuple(other)
+        return tuple(self) == other
+
+    @property
+    def cpu_s(self) -> Optional[float]:
+        """User plus system CPU time, or None if not measured."""
+        if self.user_s is None or self.sys_s is None:
+            return None
+        return self.user_s + self.sys_s
+
+
+class OutputDigest:
+    """Output sink that keeps only the length and SHA-256 of what it is given."""
+
+    def __init__(self):
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    def write(self, chunk) -> None:
+        """Add a chunk (bytes or memoryview)."""
+        self._sha256.update(chunk)
+        self.size += len(chunk)
+
+    def flush(self) -> None:
+        """Nothing is buffered (lets the sink stand in for a binary stream)."""
+
+    def hexdigest(self) -> str:
+        """SHA-256 of everything written so far."""
+        return self._sha256.hexdigest()
+
+
+def exit_status(code) -> int:
+    """
+    Exit status of a process that raised SystemExit(code).
+
+    Args:
+        code: SystemExit.code; None is success, anything but an int is
+              printed to stderr by the interpreter and means status 1
+
+    Returns:
+        Exit status
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+def write_all(fd: int, data) -> int:
+    """Write all of data to a descriptor; returns the number of bytes."""
+    view = memoryview(data).cast('B')
+    size = view.nbytes
+    while view:
+        view = view[os.write(fd, view):]
+    return size
+
+
+def read_chunks(fd: int, sink) -> None:
+    """Copy a descriptor to sink.write() until EOF, reusing one buffer."""
+    buffer = bytearray(STREAM_CHUNK)
+    view = memoryview(buffer)
+    while True:
+        count = os.readv(fd, [buffer])
+        if not count:
+            return
+        sink.write(view[:count])
+
+
+class Spawner:
+    """
+    Client of the spawner process (tests/spawner.py).
+
+    One spawner serves the whole test process; it is started on first use
+    and exits when the test process does.
+    """
+
+    _instance: Optional['Spawner'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.sock, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        with theirs:
+            self.process = subprocess.Popen([sys.executable, SPAWNER, str(theirs.fileno())],
+                                            pass_fds=[theirs.fileno()])
+        self._ids = itertools.count()
+        self._replies: Dict[int, queue.Queue] = {}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._dispatch, daemon=True).start()
+        atexit.register(self.sock.close)
+
+    @classmethod
+    def shared(cls) -> 'Spawner':
+        """Return the process-wide spawner, starting it if needed."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _dispatch(self) -> None:
+        """Hand replies to the waiting callers; wake them all if the spawner exits."""
+        while True:
+            try:
+                message = self.sock.recv(MAX_SPAWNER_MESSAGE)
+            except OSError:
+                message = b''
+            if not message:
+                break
+            reply = json.loads(message)
+            with self._lock:
+                replies = self._replies.get(reply['id'])
+            if replies is not None:
+                replies.put(reply)
+        with self._lock:
+            for replies in self._replies.values():
+                replies.put(None)
+
+    def start(self, command: List[str], stdin: int, stdout: int, stderr: int
+              ) -> Tuple[int, Callable[[], dict]]:
+        """
+        Start a command on the given descriptors.
+
+        Args:
+            command: Command line
+            stdin: Descriptor for the child's stdin
+            stdout: Descriptor for the child's stdout
+            stderr: Descriptor for the child's stderr
+
+        Returns:
+            Tuple of (pid, wait) where wait() blocks until the child exited
+            and returns its status and usage
+
+        Raises:
+            OSError: If the command could not be started
+            RuntimeError: If the spawner exited
+        """
+        request_id = next(self._ids)
+        replies: queue.Queue = queue.Queue()
+        with self._lock:
+            self._replies[request_id] = replies
+
+        def reply() -> dict:
+            message = replies.get()
+            if message is None:
+                raise RuntimeError("Spawner process exited")
+            return message
+
+        def wait() -> dict:
+            try:
+                return reply()
+            finally:
+                with self._lock:
+                    del self._replies[request_id]
+
+        try:
+            socket.send_fds(self.sock, [json.dumps({'id': request_id, 'command': command}).encode()],
+                            [stdin, stdout, stderr])
+            started = reply()
+            if 'error' in started:
+                raise OSError(started['errno'], started['error'], started['filename'])
+        except BaseException:
+            with self._lock:
+                del self._replies[request_id]
+            raise
+        return started['pid'], wait
+
+
+def execute(command: List[str], input_data: Union[bytes, Iterable[bytes]], timeout: float,
+            input_path: Optional[str] = None, stdout_sink=None
+            ) -> Tuple[bytes, bytes, int, Dict]:
+    """
+    Run a command with input on a pipe and measure the child alone.
+
+    The child is started by the spawner process and reaped there with
+    os.wait4; stdin is fed and stderr drained by helper threads here
+    while stdout is read. Input from a file or an iterable of chunks and
+    output passed to a sink (e.g. OutputDigest) are never held whole, so
+    gigabyte inputs and outputs take constant memory here.
+
+    Args:
+        command: Command line
+        input_data: Bytes, or an iterable of byte chunks, written to stdin
+        timeout: Seconds before the child is killed
+        input_path: File opened as the child's stdin instead of input_data
+        stdout_sink: Object whose write() gets stdout chunk by chunk
+                     instead of it being returned
+
+    Returns:
+        Tuple of (stdout, stderr, returncode, usage) where stdout is
+        empty if streamed to stdout_sink, and usage has wall_s, user_s,
+        sys_s, max_rss_kb, rss_floor_kb and bytes_in
+
+    Raises:
+        subprocess.TimeoutExpired: If the child ran out of time
+    """
+    if input_path is None:
+        stdin_read, stdin_write = os.pipe()
+    else:
+        stdin_read, stdin_write = os.open(input_path, os.O_RDONLY), None
+    stdout_read, stdout_write = os.pipe()
+    stderr_read, stderr_write = os.pipe()
+    try:
+        pid, wait = Spawner.shared().start(command, stdin_read, stdout_write, stderr_write)
+    except BaseException:
+        for fd in (stdin_write, stdout_read, stderr_read):
+            if fd is not None:
+                os.close(fd)
+        raise
+    finally:
+        for fd in (stdin_read, stdout_write, stderr_write):
+            os.close(fd)
+
+    expired = threading.Event()
+
+    def expire() -> None:
+        expired.set()
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # exited meanwhile
+
+    bytes_in = [os.path.getsize(input_path) if input_path is not None else 0]
+
+    def feed() -> None:
+        chunks = [input_data] if isinstance(input_data, (bytes, bytearray)) else input_data
+        try:
+            for chunk in chunks:
+                bytes_in[0] += write_all(stdin_write, chunk)
+        except BrokenPipeError:
+            pass  # the child exited without reading everything
+        finally:
+            os.close(stdin_write)
+
+    stderr_chunks = []
+
+    def drain() -> None:
+        with open(stderr_read, 'rb') as stderr:
+            stderr_chunks.append(stderr.read())
+
+    helpers = [threading.Thread(target=drain)]
+    if stdin_write is not None:
+        helpers.append(threading.Thread(target=feed))
+    timer = threading.Timer(timeout, expire)
+    timer.start()
+    try:
+        for helper in helpers:
+            helper.start()
+        if stdout_sink is None:
+            with open(stdout_read, 'rb') as stdout_file:
+                stdout = stdout_file.read()
+        else:
+            stdout = b''
+            try:
+                read_chunks(stdout_read, stdout_sink)
+            finally:
+                os.close(stdout_read)
+        for helper in helpers:
+            helper.join()
+        usage = wait()
+    finally:
+        timer.cancel()
+    stderr = stderr_chunks[0] if stderr_chunks else b''
+
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(command, timeout, output=stdout, stderr=stderr)
+    returncode = usage.pop('status')
+    del usage['id']
+    usage['bytes_in'] = bytes_in[0]
+    return stdout, stderr, returncode, usage
+
+
+class JavaHarness:
+    """
+    Persistent JVM answering runs of the Java solution (tests/TablicaHarness.java).
+
+    Requests are a 4-byte big-endian length and the input; responses are
+    the exit status, stdout length and stderr length (4 bytes each), then
+    stdout and stderr. The JVM is started on first use, restarted after a
+    timeout and stopped when the Python process exits.
+    """
+
+    REQUEST_HEADER = struct.Struct('>I')
+    RESPONSE_HEADER = struct.Struct('>iII')
+
+    def __init__(self, build_dir: str):
+        """
+        Prepare a harness for a Java build (the JVM starts on first use).
+
+        Args:
+            build_dir: Build directory holding Tablica and TablicaHarness classes
+        """
+        self.build_dir = build_dir
+        self.process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def start(self) -> None:
+        """Start the JVM unless it is running."""
+        with self._lock:
+            self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        """Start the JVM unless it is running (caller holds the lock)."""
+        if self.process is None or self.process.poll() is not None:
+            self.process = subprocess.Popen(
+                ['java', '-cp', self.build_dir, 'TablicaHarness'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+
+    def run(self, input_data: bytes, timeout: float, stdout_sink=None
+            ) -> Tuple[bytes, bytes, int]:
+        """
+        Run the solution on one input.
+
+        Args:
+            input_data: Program input
+            timeout: Maximum time in seconds for the round trip
+            stdout_sink: Object whose write() gets stdout chunk by chunk
+                         instead of it being returned
+
+        Returns:
+            Tuple of (stdout, stderr, exit status); stdout is empty if
+            streamed to stdout_sink
+
+        Raises:
+            subprocess.TimeoutExpired: If no response came in time (the JVM
+                                       is killed and restarted on next use)
+            RuntimeError: If the JVM exited without answering
+        """
+        with self._lock:
+            self._ensure_started()
+            process = self.process
+            expired = threading.Event()
+
+            def expire() -> None:
+                expired.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+            try:
+                process.stdin.write(self.REQUEST_HEADER.pack(len(input_data)))
+                process.stdin.write(input_data)
+                process.stdin.flush()
+                header = process.stdout.read(self.RESPONSE_HEADER.size)
+                if len(header) == self.RESPONSE_HEADER.size:
+                    status, out_length, err_length = self.RESPONSE_HEADER.unpack(header)
+                    if stdout_sink is None:
+                        stdout = process.stdout.read(out_length)
+                        complete = len(stdout) == out_length
+                    else:
+                        stdout, complete = b'', self._copy(out_length, stdout_sink)
+                    stderr = process.stdout.read(err_length)
+                    if complete and len(stderr) == err_length:
+                        return stdout, stderr, status
+            except OSError:
+                pass
+            finally:
+                timer.cancel()
+
+            # The JVM died or was killed mid-request
+            process.kill()
+            returncode = process.wait()
+            self.process = None
+            if expired.is_set():
+                raise subprocess.TimeoutExpired(process.args, timeout)
+            raise RuntimeError(f"Java harness exited with code {returncode}")
+
+    def _copy(self, length: int, sink) -> bool:
+        """Pass length bytes of the response to sink; False if it ended early."""
+        while length:
+            chunk = self.process.stdout.read(min(length, STREAM_CHUNK))
+            if not chunk:
+                return False
+            sink.write(chunk)
+            length -= len(chunk)
+        return True
+
+    def close(self) -> None:
+        """Stop the JVM by closing its input."""
+        with self._lock:
+            process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        process.stdout.close()
 
 
 class SolutionRunner:
     """Runner class for executing solutions in different languages."""
 
-    def __init__(self, solutions_dir: str = "solutions"):
+    # Builds shared by every runner of this process, keyed by
+    # (cache_dir, source path)
+    _builds: Dict[Tuple[str, str], Build] = {}
+    _build_locks: Dict[Tuple[str, str], threading.Lock] = {}
+    _compiler_versions: Dict[str, str] = {}
+    # Java warm-mode harnesses and AppCDS archives (None if the JDK cannot
+    # create one), keyed by build directory
+    _harnesses: Dict[str, JavaHarness] = {}
+    _archives: Dict[str, Optional[str]] = {}
+    # In-process Python solution modules keyed by path, and the lock that
+    # serialises their runs (they share sys.stderr)
+    _modules: Dict[str, Any] = {}
+    _inprocess_lock = threading.Lock()
+    # Seconds spent compiling each build in this process (absent when the
+    # build came from the cache)
+    _compile_times: Dict[Tuple[str, str], float] = {}
+    # Every RunResult of this process, see history()
+    _history: List[RunResult] = []
+    _lock = threading.Lock()
+
+    def __init__(self, solutions_dir: str = "solutions", cache_dir: Optional[str] = None,
+                 precompile: bool = True, java_mode: Optional[str] = None,
+                 jobs: Optional[int] = None, python_mode: Optional[str] = None):
         """
         Initialize runner with solutions directory.
 
         Args:
             solutions_dir: Path to directory containing solution files
+            cache_dir: Directory for compiled builds (default: default_cache_dir())
+            precompile: Compile Java and C++ now (in parallel, once per process)
+                        instead of on their first run
+            java_mode: One of JAVA_MODES (default: $TABLICA_JAVA_MODE, or 'cold')
+            jobs: Run the languages of run_languages() concurrently when
+                  above 1 (default: $TABLICA_TEST_JOBS, or 1)
+            python_mode: One of PYTHON_MODES (default: $TABLICA_PYTHON_MODE,
+                         or 'subprocess')
+
+        Raises:
+            ValueError: If java_mode or python_mode is unknown
         """
         # Get absolute path relative to project root
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,18 +639,234 @@ class SolutionRunner:
         for lang, path in self.solutions.items():
             if not os.path.exists(path):
                 raise FileNotFoundError(f"{lang} solution not found: {path}")
+        
+        self.java_mode = java_mode or os.environ.get('TABLICA_JAVA_MODE') or 'cold'
+        if self.java_mode not in JAVA_MODES:
+            raise ValueError(f"Unknown Java mode: {self.java_mode}. Supported: {list(JAVA_MODES)}")
+        
+        self.python_mode = python_mode or os.environ.get('TABLICA_PYTHON_MODE') or 'subprocess'
+        if self.python_mode not in PYTHON_MODES:
+            raise ValueError(f"Unknown Python mode: {self.python_mode}. "
+                             f"Supported: {list(PYTHON_MODES)}")
+        
+        self.jobs = jobs if jobs is not None else int(os.environ.get('TABLICA_TEST_JOBS') or 1)
+        self.cache_dir = os.path.abspath(cache_dir or default_cache_dir())
+        if precompile:
+            self.precompile()
+
+    def precompile(self, languages: Sequence[str] = COMPILED_LANGUAGES) -> None:
+        """
+        Build solutions in parallel; languages already built are skipped.
+
+        Also creates the AppCDS archive (cds mode) or starts the harness JVM
+        (warm mode) for Java. Failures are kept and reported when the
+        language is run.
+
+        Args:
+            languages: Languages to build
+        """
+        def build(language: str) -> None:
+            try:
+                build_dir, failed = self._build(language)
+                if language == 'java' and failed is None:
+                    if self.java_mode == 'cds':
+                        self._java_archive(build_dir)
+                    elif self.java_mode == 'warm':
+                        self._java_harness(build_dir).start()
+            except (OSError, subprocess.SubprocessError):
+                pass
+
+        with ThreadPoolExecutor(max_workers=len(languages)) as pool:
+            list(pool.map(build, languages))
+
+    def _build(self, language: str) -> Tuple[Optional[str], Optional[subprocess.CompletedProcess]]:
+        """
+        Return the build of a language, compiling it at most once per process.
+
+        Returns:
+            (build directory, None), or (None, failed compiler result)
+
+        Raises:
+            OSError: If the compiler could not be run (e.g. not installed)
+            subprocess.TimeoutExpired: If compilation took too long
+        """
+        key = (self.cache_dir, self.solutions[language])
+        with self._lock:
+            lock = self._build_locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._builds:
+                try:
+                    self._builds[key] = self._compile_cached(language)
+                except (OSError, subprocess.SubprocessError) as e:
+                    self._builds[key] = e
+            build = self._builds[key]
+        if isinstance(build, Exception):
+            raise build
+        return build
+
+    def _compiler_version(self, compiler: str) -> str:
+        """Return the version output of a compiler (queried once per process)."""
+        if compiler not in self._compiler_versions:
+            flag = '-version' if compiler == 'javac' else '--version'
+            result = subprocess.run([compiler, flag], capture_output=True, text=True,
+                                    timeout=COMPILE_TIMEOUT)
+            self._compiler_versions[compiler] = result.stdout + result.stderr
+        return self._compiler_versions[compiler]
+
+    def _sources(self, language: str) -> List[str]:
+        """Source files compiled into a language's build."""
+        if language == 'java':
+            return [self.solutions[language], JAVA_HARNESS]
+        return [self.solutions[language]]
+
+    def _compile_cached(self, language: str) -> Tuple[Optional[str],
+                                                      Optional[subprocess.CompletedProcess]]:
+        """
+        Compile a solution into the cache unless an identical build exists.
+
+        The build is made in a temporary directory and renamed into place,
+        so concurrent runners never see a partial build.
+
+        Returns:
+            (build directory, None), or (None, failed compiler result)
+        """
+        sources = self._sources(language)
+        compiler = COMPILERS[language]
+        contents = []
+        for path in sources:
+            with open(path, 'rb') as f:
+                contents.append(f.read())
+        key = build_key(b'\0'.join(contents), self._compiler_version(compiler[0]), compiler)
+        build_dir = os.path.join(self.cache_dir, f"{language}-{key}")
+        if os.path.isdir(build_dir):
+            return build_dir, None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{language}-", dir=self.cache_dir)
+        try:
+            if language == 'java':
+                compile_cmd = compiler + ['-d', tmp_dir] + sources
+            else:
+                compile_cmd = compiler + ['-o', os.path.join(tmp_dir, CPP_EXECUTABLE)] + sources
+            start = time.perf_counter()
+            compile_result = subprocess.run(
+                compile_cmd,
+                capture_output=True,
+                text=True,
+                timeout=COMPILE_TIMEOUT
+            )
+            with self._lock:
+                self._compile_times[(self.cache_dir, self.solutions[language])] = (
+                    time.perf_counter() - start)
+            if compile_result.returncode != 0:
+                return None, compile_result
+            try:
+                os.rename(tmp_dir, build_dir)
+            except OSError:
+                # Another process stored the same build first
+                pass
+            return build_dir, None
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def compile_time(self, language: str) -> float:
+        """
+        Seconds this process spent compiling a language.
+
+        Returns:
+            Compile time, or 0.0 for Python and for builds reused from the cache
+        """
+        return self._compile_times.get((self.cache_dir, self.solutions[language]), 0.0)
+
+    @classmethod
+    def history(cls) -> List[RunResult]:
+        """Return every RunResult produced in this process, oldest first."""
+        with cls._lock:
+            return list(cls._history)
+
+    def _java_archive(self, build_dir: str) -> Optional[str]:
+        """
+        Return the AppCDS archive of a Java build, creating it if needed.
+
+        The archive is recorded by one run with -XX:ArchiveClassesAtExit
+        and kept in the build directory.
+
+        Returns:
+            Archive path, or None if the JDK could not create one
+        """
+        with self._lock:
+            if build_dir in self._archives:
+                return self._archives[build_dir]
+        archive = os.path.join(build_dir, JAVA_ARCHIVE)
+        if not os.path.exists(archive):
+            tmp_archive = f"{archive}.{os.getpid()}.{threading.get_ident()}"
+            try:
+                subprocess.run(
+                    ['java', f'-XX:ArchiveClassesAtExit={tmp_archive}', '-cp', build_dir, 'Tablica'],
+                    input=JAVA_ARCHIVE_INPUT,
+                    text=True,
+                    capture_output=True,
+                    timeout=COMPILE_TIMEOUT
+                )
+                if os.path.exists(tmp_archive):
+                    os.replace(tmp_archive, archive)
+            except (OSError, subprocess.SubprocessError):
+                pass
+        result = archive if os.path.exists(archive) else None
+        with self._lock:
+            self._archives[build_dir] = result
+        return result
+
+    def _java_harness(self, build_dir: str) -> JavaHarness:
+        """Return the warm-mode harness of a Java build (one per process)."""
+        with self._lock:
+            if build_dir not in self._harnesses:
+                self._harnesses[build_dir] = JavaHarness(build_dir)
+            return self._harnesses[build_dir]
+
+    def _python_module(self, file_path: str):
+        """
+        Return the Python solution imported into this process (once per path).
+
+        The module is registered as sys.modules['tablica'] unless another
+        copy already is, so its process pool workers can pickle its functions.
+        """
+        with self._lock:
+            if file_path in self._modules:
+                return self._modules[file_path]
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            loaded = sys.modules.get(name)
+            if loaded is not None and os.path.realpath(getattr(loaded, '__file__', '')) == \
+                    os.path.realpath(file_path):
+                module = loaded
+            else:
+                spec = importlib.util.spec_from_file_location(name, file_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                sys.modules.setdefault(name, module)
+            self._modules[file_path] = module
+            return module
 
-    def run(self, language: str, input_data: str, timeout: int = 10) -> Tuple[str, str, int]:
+    def run(self, language: str, input_data: Input = "", timeout: int = 10,
+            args: Optional[Sequence[str]] = None, input_path: Optional[str] = None,
+            keep_stdout: bool = True) -> RunResult:
         """
         Run a solution with given input data.
 
         Args:
             language: One of 'python', 'java', 'cpp'
-            input_data: Input string to feed to the program
+            input_data: Input string, bytes, or iterable of byte chunks
+                        (streamed) to feed to the program
             timeout: Maximum execution time in seconds
+            args: Extra command-line arguments passed to the program
+            input_path: File fed to the program instead of input_data
+                        (e.g. a tests/corpus.py dataset)
+            keep_stdout: If False, stdout is only hashed as it arrives
+                         (RunResult.stdout_sha256 and bytes_out) and
+                         RunResult.stdout is empty
 
         Returns:
-            Tuple of (stdout, stderr, return_code)
+            RunResult, which unpacks as (stdout, stderr, return_code)
 
         Raises:
             ValueError: If language is not supported
@@ -62,90 +876,217 @@ class SolutionRunner:
             raise ValueError(f"Unknown language: {language}. Supported: {list(self.solutions.keys())}")
 
         file_path = self.solutions[language]
+        extra_args = list(args) if args else []
 
         if language == 'python':
-            return self._run_python(file_path, input_data, timeout)
+            result = self._run_python(file_path, input_data, timeout, extra_args, input_path,
+                                      keep_stdout)
         elif language == 'java':
-            return self._run_java(file_path, input_data, timeout)
+            result = self._run_java(file_path, input_data, timeout, extra_args, input_path,
+                                    keep_stdout)
         elif language == 'cpp':
-            return self._run_cpp(file_path, input_data, timeout)
+            result = self._run_cpp(file_path, input_data, timeout, extra_args, input_path,
+                                   keep_stdout)
+        result.compile_s = self.compile_time(language)
+        result.test_id = current_test.get()
+        with self._lock:
+            self._history.append(result)
+        return result
 
-    def _run_python(self, file_path: str, input_data: str, timeout: int) -> Tuple[str, str, int]:
+    def run_languages(self, languages: Sequence[str], input_data: Union[str, bytes] = "",
+                      timeout: int = 10, args: Optional[Sequence[str]] = None,
+                      input_path: Optional[str] = None, keep_stdout: bool = True
+                      ) -> Iterator[Tuple[str, Callable[[], RunResult]]]:
+        """
+        Run a solution in several languages, concurrently if jobs > 1.
+
+        Args:
+            languages: Languages to run
+            input_data: Input string or bytes to feed to every program
+            timeout: Maximum execution time in seconds
+            args: Extra command-line arguments passed to every program
+            input_path: File fed to every program instead of input_data
+            keep_stdout: If False, stdout is only hashed, see run()
+
+        Yields:
+            (language, result) pairs in the given order; result() returns
+            what run() returns or raises what it raised, so each language
+            can be checked in its own subTest
+        """
+        if self.jobs <= 1:
+            for language in languages:
+                yield language, functools.partial(self.run, language, input_data, timeout, args,
+                                                  input_path, keep_stdout)
+            return
+        with ThreadPoolExecutor(max_workers=len(languages)) as pool:
+            # Each run sees the caller's context (current_test)
+            futures = [(language, pool.submit(contextvars.copy_context().run, self.run, language,
+                                              input_data, timeout, args, input_path, keep_stdout))
+                       for language in languages]
+            for language, future in futures:
+                yield language, future.result
+
+    def command(self, language: str, args: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Build the command line that runs a solution, compiling it if needed.
+
+        Used by callers that spawn the process themselves (e.g. the
+        benchmark suite, to feed files and measure resource usage). Java
+        in warm mode gets the cold command, since it needs a new process.
+
+        Args:
+            language: One of 'python', 'java', 'cpp'
+            args: Extra command-line arguments passed to the program
+
+        Returns:
+            Command line as a list of arguments
+
+        Raises:
+            ValueError: If language is not supported
+            RuntimeError: If compilation fails
+        """
+        if language not in self.solutions:
+            raise ValueError(f"Unknown language: {language}. Supported: {list(self.solutions.keys())}")
+
+        file_path = self.solutions[language]
+        extra_args = list(args) if args else []
+
+        if language == 'python':
+            return [sys.executable, file_path] + extra_args
+
+        build_dir, failed = self._build(language)
+        if failed is not None:
+            raise RuntimeError(f"Compilation error: {failed.stderr}")
+        return self._build_command(language, build_dir) + extra_args
+
+    def _build_command(self, language: str, build_dir: str) -> List[str]:
+        """Command line that runs a compiled solution from its build directory."""
+        if language == 'java':
+            class_name = os.path.splitext(os.path.basename(self.solutions[language]))[0]
+            archive = self._java_archive(build_dir) if self.java_mode == 'cds' else None
+            if archive:
+                return ['java', f'-XX:SharedArchiveFile={archive}', '-cp', build_dir, class_name]
+            return ['java', '-cp', build_dir, class_name]
+        return [os.path.join(build_dir, CPP_EXECUTABLE)]
+
+    def _execute(self, language: str, cmd: List[str], input_data: Input,
+                 timeout: int, input_path: Optional[str], keep_stdout: bool) -> RunResult:
+        """Run a command through execute() and wrap its outcome."""
+        data = input_data.encode() if isinstance(input_data, str) else input_data
+        sink = None if keep_stdout else OutputDigest()
+        stdout, stderr, returncode, usage = execute(cmd, data, timeout, input_path, sink)
+        return self._result(language, stdout, stderr, returncode, sink, **usage)
+
+    @staticmethod
+    def _result(language: str, stdout: bytes, stderr: bytes, returncode: int,
+                sink: Optional[OutputDigest], **usage) -> RunResult:
+        """Wrap a finished run's raw outcome in a RunResult."""
+        if sink is None:
+            digest, bytes_out = hashlib.sha256(stdout).hexdigest(), len(stdout)
+        else:
+            digest, bytes_out = sink.hexdigest(), sink.size
+        return RunResult(language, stdout.decode().strip(), stderr.decode().strip(), returncode,
+                         bytes_out=bytes_out, stdout_sha256=digest, **usage)
+
+    def _run_python(self, file_path: str, input_data: Input, timeout: int,
+                    extra_args: List[str], input_path: Optional[str],
+                    keep_stdout: bool) -> RunResult:
         """Run Python solution."""
-        cmd = [sys.executable, file_path]
-        
-        result = subprocess.run(
-            cmd,
-            input=input_data,
-            text=True,
-            capture_output=True,
-            timeout=timeout
-        )
-        
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
+        if self.python_mode == 'inprocess':
+            return self._run_python_inprocess(file_path, input_data, extra_args, input_path,
+                                              keep_stdout)
+        cmd = [sys.executable, file_path] + extra_args
+        return self._execute('python', cmd, input_data, timeout, input_path, keep_stdout)
 
-    def _run_java(self, file_path: str, input_data: str, timeout: int) -> Tuple[str, str, int]:
+    def _run_python_inprocess(self, file_path: str, input_data: Input, extra_args: List[str],
+                              input_path: Optional[str], keep_stdout: bool) -> RunResult:
+        """
+        Run the Python solution's main() in this process (inprocess mode).
+
+        Input is a BytesIO, or input_path opened as a file so the solution
+        maps it as it would its stdin. Output goes to a BytesIO or straight
+        to the digest sink; stderr, text printed by argparse and sys.argv
+        are swapped while the run holds _inprocess_lock.
+        """
+        module = self._python_module(file_path)
+        if input_path is not None:
+            infile = open(input_path, 'rb')
+            bytes_in = os.fstat(infile.fileno()).st_size
+        else:
+            if isinstance(input_data, str):
+                data = input_data.encode()
+            elif isinstance(input_data, (bytes, bytearray)):
+                data = bytes(input_data)
+            else:
+                data = b''.join(input_data)
+            infile, bytes_in = io.BytesIO(data), len(data)
+        sink = None if keep_stdout else OutputDigest()
+        out = io.BytesIO() if sink is None else sink
+        text_out, text_err = io.StringIO(), io.StringIO()
+
+        with infile, self._inprocess_lock, contextlib.redirect_stdout(text_out), \
+                contextlib.redirect_stderr(text_err):
+            # argparse names the program after sys.argv[0]
+            saved_argv, sys.argv = sys.argv, [file_path] + extra_args
+            start = time.perf_counter()
+            try:
+                module.main(extra_args, infile, out)
+                returncode = 0
+            except SystemExit as e:
+                returncode = exit_status(e.code)
+                if e.code is not None and not isinstance(e.code, int):
+                    text_err.write(f"{e.code}\n")
+            finally:
+                sys.argv = saved_argv
+            wall_s = time.perf_counter() - start
+
+        if text_out.getvalue():
+            out.write(text_out.getvalue().encode())
+        stdout = out.getvalue() if sink is None else b''
+        return self._result('python', stdout, text_err.getvalue().encode(), returncode, sink,
+                            wall_s=wall_s, bytes_in=bytes_in)
+
+    def _run_java(self, file_path: str, input_data: Input, timeout: int,
+                  extra_args: List[str], input_path: Optional[str],
+                  keep_stdout: bool) -> RunResult:
         """Run Java solution (compile if needed, then execute)."""
-        class_name = os.path.splitext(os.path.basename(file_path))[0]
-        class_file = os.path.join(self.solutions_dir, f"{class_name}.class")
+        build_dir, failed = self._build('java')
+        if failed is not None:
+            return RunResult('java', "", f"Compilation error: {failed.stderr}", failed.returncode)
         
-        # Check if compilation is needed
-        if not os.path.exists(class_file) or \
-           os.path.getmtime(file_path) > os.path.getmtime(class_file):
-            # Compile
-            compile_cmd = ['javac', file_path]
-            compile_result = subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            if compile_result.returncode != 0:
-                return "", f"Compilation error: {compile_result.stderr}", compile_result.returncode
+        if self.java_mode == 'warm':
+            # The solution takes no arguments, so extra_args are not sent
+            # The protocol is length-prefixed, so the input is held whole
+            if input_path is not None:
+                with open(input_path, 'rb') as f:
+                    data = f.read()
+            elif isinstance(input_data, str):
+                data = input_data.encode()
+            elif isinstance(input_data, (bytes, bytearray)):
+                data = bytes(input_data)
+            else:
+                data = b''.join(input_data)
+            sink = None if keep_stdout else OutputDigest()
+            start = time.perf_counter()
+            stdout, stderr, returncode = self._java_harness(build_dir).run(data, timeout, sink)
+            return self._result('java', stdout, stderr, returncode, sink,
+                                wall_s=time.perf_counter() - start, bytes_in=len(data))
         
         # Run
-        run_cmd = ['java', '-cp', self.solutions_dir, class_name]
-        result = subprocess.run(
-            run_cmd,
-            input=input_data,
-            text=True,
-            capture_output=True,
-            timeout=timeout
-        )
-        
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
+        run_cmd = self._build_command('java', build_dir) + extra_args
+        return self._execute('java', run_cmd, input_data, timeout, input_path, keep_stdout)
 
-    def _run_cpp(self, file_path: str, input_data: str, timeout: int) -> Tuple[str, str, int]:
+    def _run_cpp(self, file_path: str, input_data: Input, timeout: int,
+                 extra_args: List[str], input_path: Optional[str],
+                 keep_stdout: bool) -> RunResult:
         """Run C++ solution (compile if needed, then execute)."""
-        exe_path = os.path.join(self.solutions_dir, 'tablica_exe')
-        
-        # Check if compilation is needed
-        if not os.path.exists(exe_path) or \
-           os.path.getmtime(file_path) > os.path.getmtime(exe_path):
-            # Compile
-            compile_cmd = ['g++', '-std=c++17', '-O2', '-o', exe_path, file_path]
-            compile_result = subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            if compile_result.returncode != 0:
-                return "", f"Compilation error: {compile_result.stderr}", compile_result.returncode
+        build_dir, failed = self._build('cpp')
+        if failed is not None:
+            return RunResult('cpp', "", f"Compilation error: {failed.stderr}", failed.returncode)
         
         # Run
-        result = subprocess.run(
-            [exe_path],
-            input=input_data,
-            text=True,
-            capture_output=True,
-            timeout=timeout
-        )
-        
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-
+        run_cmd = self._build_command('cpp', build_dir) + extra_args
+        return self._execute('cpp', run_cmd, input_data, timeout, input_path, keep_stdout)
 
 if __name__ == "__main__":
     # Simple test of the runner
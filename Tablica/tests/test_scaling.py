@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Empirical complexity tests for TABLICA solutions.
+
+Tests the exponent fit of benchmarks/scaling.py on synthetic costs, then
+runs every solution at geometrically increasing sizes and fails when its
+cost above startup grows clearly faster than linearly.
+"""
+
+import math
+import unittest
+
+from benchmarks import scaling
+from tests.test_runner import SolutionRunner
+
+SIZES = [10**5, 3 * 10**5, 10**6, 3 * 10**6]
+STARTUP = 0.01
+
+
+class TestExponentFit(unittest.TestCase):
+    """Test scaling.fit_exponent() on known cost curves."""
+
+    def fit(self, per_element) -> float:
+        """Exponent fitted to STARTUP + per_element(n) at SIZES."""
+        costs = [STARTUP + per_element(n) for n in SIZES]
+        exponent, _ = scaling.fit_exponent(SIZES, costs, STARTUP)
+        return exponent
+
+    def test_linear(self):
+        """Test a linear cost fits exponent 1 despite the startup cost."""
+        self.assertAlmostEqual(self.fit(lambda n: 50e-9 * n), 1.0)
+
+    def test_n_log_n_accepted(self):
+        """Test n log n stays under MAX_EXPONENT."""
+        self.assertLess(self.fit(lambda n: 5e-9 * n * math.log(n)), scaling.MAX_EXPONENT)
+
+    def test_quadratic_rejected(self):
+        """Test a quadratic term in part of the work is caught."""
+        self.assertGreater(self.fit(lambda n: 50e-9 * n + 1e-12 * n * n), scaling.MAX_EXPONENT)
+
+    def test_startup_subtracted(self):
+        """Test the same curve would look sub-linear without subtracting startup."""
+        costs = [STARTUP + 50e-9 * n for n in SIZES]
+        exponent, _ = scaling.fit_exponent(SIZES, costs, 0.0)
+        self.assertLess(exponent, 0.8)
+
+    def test_noise_points_dropped(self):
+        """Test sizes that barely rise above startup are left out or refused."""
+        costs = [STARTUP + 1e-4, STARTUP + 1e-4, STARTUP + 1e-3, STARTUP + 0.05]
+        with self.assertRaises(ValueError):
+            scaling.fit_exponent(SIZES, costs, STARTUP)
+
+
+class TestScaling(unittest.TestCase):
+    """Test each solution's cost grows linearly with the input size."""
+
+    # Times its runs (run_tests.py --jobs runs it alone)
+    parallel_safe = False
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_linear_scaling(self):
+        """Test the fitted exponent of every language is close to linear."""
+        for lang in ['python', 'java', 'cpp']:
+            with self.subTest(language=lang):
+                fit = scaling.measure_scaling(self.runner, lang)
+                self.assertTrue(fit.linear,
+                                f"{lang}: exponent {fit.exponent:.2f} > {scaling.MAX_EXPONENT} "
+                                f"({fit.ns_per_element:.1f} ns/element at {fit.sizes[-1]}, "
+                                f"startup {fit.startup_s * 1000:.1f} ms, {fit.metric})")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Server mode tests for TABLICA Python solution.
+
+Tests the persistent server (--serve) on a local Unix socket and on
+framed stdin/stdout, the --connect client, and the shutdown statistics.
+"""
+
+import json
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from tests.test_runner import SolutionRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+def frame(payload: bytes) -> bytes:
+    """Encode one length-prefixed request."""
+    return struct.pack('>I', len(payload)) + payload
+
+
+def parse_responses(data: bytes):
+    """Decode a sequence of (status, body) responses."""
+    responses = []
+    while data:
+        status, length = struct.unpack('>BI', data[:5])
+        responses.append((status, data[5:5 + length]))
+        data = data[5 + length:]
+    return responses
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets not available")
+class TestServerMode(unittest.TestCase):
+    """Test the persistent server of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one server on a temporary socket for all test methods."""
+        cls.runner = SolutionRunner()
+        cls.tmp_dir = tempfile.mkdtemp(prefix='tablica_')
+        cls.socket_path = os.path.join(cls.tmp_dir, 'server.sock')
+        cls.server = subprocess.Popen(
+            [sys.executable, cls.runner.solutions['python'], '--serve', cls.socket_path],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        deadline = time.monotonic() + 10
+        while not os.path.exists(cls.socket_path):
+            if time.monotonic() > deadline or cls.server.poll() is not None:
+                raise RuntimeError("server did not start")
+            time.sleep(0.01)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server and remove the scratch directory."""
+        if cls.server.poll() is None:
+            cls.server.terminate()
+        cls.server.communicate(timeout=10)
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def connect(self, input_data: str):
+        """Send input_data through the --connect client."""
+        return self.runner.run('python', input_data, args=['--connect', self.socket_path])
+
+    def test_client_round_trip(self):
+        """Test a request sent by the client is reversed."""
+        stdout, stderr, code = self.connect("1 2 3")
+        self.assertEqual(stdout, "3 2 1", "Python: Failed server round trip")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_client_large_request(self):
+        """Test a 50,000 element request."""
+        numbers = list(range(50000))
+        stdout, stderr, code = self.connect(" ".join(map(str, numbers)))
+        self.assertEqual(stdout, " ".join(map(str, reversed(numbers))),
+                         "Python: Failed large request")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_client_invalid_request(self):
+        """Test the server error is reported by the client with exit code 1."""
+        stdout, stderr, code = self.connect("1 a 3")
+        self.assertEqual(code, 1, "Python: Should return exit code 1")
+        self.assertIn("Error: Input must contain only integers", stderr,
+                      "Python: Should output the server error message")
+
+    def test_server_survives_errors(self):
+        """Test the server keeps answering after an invalid request."""
+        self.connect("not numbers")
+        stdout, stderr, code = self.connect("+5 -6")
+        self.assertEqual(stdout, "-6 5", "Python: Server stopped after an error")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_client_without_server(self):
+        """Test connecting to a missing socket fails cleanly."""
+        stdout, stderr, code = self.runner.run(
+            'python', "1 2", args=['--connect', os.path.join(self.tmp_dir, 'missing.sock')])
+        self.assertEqual(code, 1, "Python: Should return exit code 1")
+        self.assertIn("Error", stderr, "Python: Should output error message")
+
+
+class TestFramedStdio(unittest.TestCase):
+    """Test the framed stdin/stdout server protocol."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_many_requests_one_process(self):
+        """Test several requests answered in order by one process."""
+        payloads = [b"1 2 3", b"", b"4 x", b"+7 08", b"42"]
+        result = subprocess.run(
+            [sys.executable, self.runner.solutions['python'], '--serve', '-'],
+            input=b"".join(frame(p) for p in payloads), capture_output=True, timeout=10)
+
+        self.assertEqual(result.returncode, 0, "Python: Non-zero exit code")
+        self.assertEqual(parse_responses(result.stdout), [
+            (0, b"3 2 1"),
+            (0, b""),
+            (1, b"Input must contain only integers"),
+            (0, b"8 7"),
+            (0, b"42"),
+        ])
+
+    def test_shutdown_statistics(self):
+        """Test the JSON throughput/latency summary written on shutdown."""
+        result = subprocess.run(
+            [sys.executable, self.runner.solutions['python'], '--serve', '-'],
+            input=frame(b"1 2") * 10, capture_output=True, timeout=10)
+
+        stats = json.loads(result.stderr.decode().strip().splitlines()[-1])
+        self.assertEqual(stats['requests'], 10, "Python: Wrong request count")
+        for key in ['busy_s', 'requests_per_s', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms']:
+            self.assertIn(key, stats, f"Python: Missing {key} in stats")
+        self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertLessEqual(stats['busy_s'], stats['uptime_s'])
+
+
+class TestServerStats(unittest.TestCase):
+    """Test the throughput accounting of ServerStats on a fake clock."""
+
+    def setUp(self):
+        """Give the recorder a clock the test sets."""
+        self.now = 0.0
+        self.stats = tablica.ServerStats()
+        self.stats._clock = lambda: self.now
+        self.stats.started = 0.0
+
+    def request(self, start: float, end: float) -> None:
+        """Record one request from start to end."""
+        self.now = start
+        began = self.stats.timer()
+        self.now = end
+        self.stats.record(began)
+
+    def test_idle_time_not_counted(self):
+        """Test requests per second ignore the idle time between requests."""
+        for start in [0.0, 10.0, 20.0]:
+            self.request(start, start + 0.5)
+        self.now = 100.0
+        summary = self.stats.summary()
+        self.assertEqual((summary['uptime_s'], summary['busy_s']), (100.0, 1.5))
+        self.assertEqual(summary['requests_per_s'], 2.0)
+
+    def test_overlapping_requests(self):
+        """Test requests in flight together count their shared time once."""
+        self.now = 0.0
+        first = self.stats.timer()
+        self.now = 1.0
+        second = self.stats.timer()
+        self.now = 2.0
+        self.stats.record(first)
+        self.now = 4.0
+        self.stats.record(second)
+        summary = self.stats.summary()
+        self.assertEqual((summary['busy_s'], summary['requests_per_s']), (4.0, 0.5))
+
+    def test_no_requests(self):
+        """Test an idle server reports zero throughput."""
+        self.now = 5.0
+        self.assertEqual(self.stats.summary()['requests_per_s'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
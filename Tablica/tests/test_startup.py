@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Startup tests for TABLICA Python solution.
+
+Tests that a run without arguments imports nothing beyond the modules
+the interpreter has already loaded, and that its default options match
+the ones argparse produces.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+from tests.test_runner import SolutionRunner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'solutions'))
+
+import tablica  # noqa: E402
+
+
+def imported_modules(args, input_data: bytes) -> set:
+    """Return the module names reported by -X importtime for one run."""
+    env = {name: value for name, value in os.environ.items() if name != 'TABLICA_BACKEND'}
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, env=env,
+                            input=input_data, capture_output=True, timeout=10)
+    return {line.rsplit('|', 1)[1].strip()
+            for line in result.stderr.decode().splitlines()
+            if line.startswith('import time:')}
+
+
+class TestStartup(unittest.TestCase):
+    """Test the startup cost of the Python solution."""
+
+    LAZY_MODULES = ['argparse', 'typing', 'mmap', 'array']
+
+    # Patches os.environ (run_tests.py --jobs runs it alone)
+    parallel_safe = False
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_no_argument_run_imports(self):
+        """Test a run without arguments imports no lazily loaded module."""
+        modules = imported_modules([self.runner.solutions['python']], b"1 2 3")
+        for name in self.LAZY_MODULES:
+            self.assertNotIn(name, modules, f"Python: {name} imported at startup")
+
+    def test_default_options_match_argparse(self):
+        """Test the argparse-free defaults equal the parsed defaults."""
+        parsed = tablica.parse_args(['--chunk-size', str(tablica.DEFAULT_CHUNK_SIZE)])
+        self.assertEqual(tablica.parse_args([]), parsed)
+
+    def test_backend_environment_default(self):
+        """Test $TABLICA_BACKEND is honoured with and without arguments."""
+        with mock.patch.dict(os.environ, {'TABLICA_BACKEND': 'python'}):
+            self.assertEqual(tablica.parse_args([]).backend, 'python')
+            self.assertEqual(tablica.parse_args(['--text']).backend, 'python')
+
+    def test_arguments_still_parsed(self):
+        """Test options are parsed when arguments are given."""
+        stdout, stderr, code = self.runner.run('python', "1 2 3", args=['--stream'])
+        self.assertEqual(stdout, "3 2 1", "Python: Failed with arguments")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Streaming mode tests for TABLICA Python solution.
+
+Tests the chunked binary reader (--stream), including tokens split
+across chunk boundaries, Unicode input decoded chunk by chunk and error
+reporting.
+"""
+
+import unittest
+from tests.test_runner import SolutionRunner
+
+
+class TestStreamingMode(unittest.TestCase):
+    """Test chunked streaming reader of the Python solution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test runner for all test methods."""
+        cls.runner = SolutionRunner()
+
+    def test_stream_simple_reverse(self):
+        """Test streaming mode on a simple input."""
+        stdout, stderr, code = self.runner.run('python', "1 2 3", args=['--stream'])
+        self.assertEqual(stdout, "3 2 1", "Python: Failed streaming reverse")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_stream_tokens_split_across_chunks(self):
+        """Test tokens cut by chunk boundaries are reassembled."""
+        numbers = [123456789, -42, 0, 7, -1000000, 31337]
+        input_data = " ".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+
+        for chunk_size in ['1', '2', '3', '7', '64']:
+            with self.subTest(chunk_size=chunk_size):
+                stdout, stderr, code = self.runner.run(
+                    'python', input_data, args=['--stream', '--chunk-size', chunk_size])
+                self.assertEqual(stdout, expected, f"Python: Failed chunk size {chunk_size}")
+                self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_stream_mixed_separators(self):
+        """Test streaming mode with spaces, tabs and newlines."""
+        input_data = "1\t2  3\n4    5\t\t6\n"
+        stdout, stderr, code = self.runner.run(
+            'python', input_data, args=['--stream', '--chunk-size', '4'])
+        self.assertEqual(stdout, "6 5 4 3 2 1", "Python: Failed mixed separators")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_stream_large_input(self):
+        """Test streaming mode on 50,000 elements with a small chunk size."""
+        numbers = list(range(50000))
+        input_data = " ".join(map(str, numbers))
+        expected = " ".join(map(str, reversed(numbers)))
+
+        stdout, stderr, code = self.runner.run(
+            'python', input_data, timeout=30, args=['--stream', '--chunk-size', '4096'])
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+        self.assertEqual(stdout, expected, "Python: Failed large streaming input")
+
+    def test_stream_empty_input(self):
+        """Test streaming mode on empty and whitespace-only input."""
+        for input_data in ["", "   \n  \t  "]:
+            with self.subTest(input_data=input_data):
+                stdout, stderr, code = self.runner.run('python', input_data, args=['--stream'])
+                self.assertEqual(stdout, "", "Python: Expected no output")
+                self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_stream_invalid_input(self):
+        """Test streaming mode reports invalid tokens like the default path."""
+        stdout, stderr, code = self.runner.run(
+            'python', "1 2 abc 4", args=['--stream', '--chunk-size', '2'])
+        self.assertEqual(code, 1, "Python: Should return exit code 1 for invalid input")
+        self.assertIn("Error", stderr, "Python: Should output error message to stderr")
+        self.assertEqual(stdout, "", "Python: Should not print partial output")
+
+    def test_stream_plus_sign(self):
+        """Test streaming mode normalises explicit plus signs."""
+        stdout, stderr, code = self.runner.run('python', "+1 +2 +3", args=['--stream'])
+        self.assertEqual(stdout, "3 2 1", "Python: Should remove + signs")
+        self.assertEqual(code, 0, "Python: Non-zero exit code")
+
+    def test_stream_unicode_and_separators(self):
+        """Test Unicode digits and separators parse as on the default path, at any chunk size."""
+        cases = {"1\xa02": "2 1", "1\u20032": "2 1", "٣ 4": "4 3", "1\x1c2": "2 1",
+                 "5 6 1\u20032 ٣٤": "34 2 1 6 5", "1 2\xa0": "2 1", "٣ 4 ": "4 3",
+                 "1\u20032\n": "2 1"}
+        for input_data, expected in cases.items():
+            for args in [['--stream'], ['--stream', '--chunk-size', '1'],
+                         ['--stream', '--chunk-size', '2'], ['--stream', '--compact'],
+                         ['--pipeline', '--chunk-size', '3']]:
+                with self.subTest(input_data=input_data, args=args):
+                    stdout, stderr, code = self.runner.run('python', input_data, args=args)
+                    self.assertEqual((stdout, stderr, code), (expected, "", 0))
+
+    def test_stream_truncated_character(self):
+        """Test a multi-byte character cut off by EOF is still an error."""
+        stdout, stderr, code = self.runner.run(
+            'python', "1 2 ٣".encode()[:-1], args=['--stream', '--chunk-size', '1'])
+        self.assertEqual((stdout, code), ("", 1))
+
+    def test_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        stdout, stderr, code = self.runner.run(
+            'python', "1 2 3", args=['--stream', '--chunk-size', '0'])
+        self.assertNotEqual(code, 0, "Python: Should reject chunk size 0")
+
+
+if __name__ == '__main__':
+    unittest.main()